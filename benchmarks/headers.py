@@ -0,0 +1,54 @@
+"""Micro-benchmark do custo dos headers normalizados por resposta do `ResponseHttp`
+- `antes` reconstrói o `dict` e o `DictNormalizado` a cada acesso, como nas versões anteriores
+- `depois` normaliza os itens dos headers uma única vez por resposta, com o `headers` e o `headers_dict` retornando cópias
+- Simulado os acessos de uma resposta típica: `esperar_tipo_conteudo`, construção do `holmes.Documento` e log
+
+Executar `uv run python benchmarks/headers.py [repeticoes]`"""
+
+# std
+import sys, timeit
+# interno
+from dclick.http import ResponseHttp
+# externo
+import httpx
+from bot.estruturas import DictNormalizado
+
+HEADERS = {
+    "Content-Type": "application/pdf",
+    "Content-Disposition": 'attachment; filename="nota_fiscal.pdf"',
+    "Content-Length": "183920",
+    "Cache-Control": "no-cache",
+    "Date": "Mon, 12 Oct 2026 12:00:00 GMT",
+    "Server": "nginx",
+    "X-Request-Id": "3f1c0b7e-0a5e-4a3b-9d1f-1a2b3c4d5e6f",
+    "Strict-Transport-Security": "max-age=31536000",
+}
+
+def headers_dict_antes (response: ResponseHttp) -> dict[str, str]:
+    return {
+        str(key).lower().strip(): str(value)
+        for key, value in dict(getattr(response, "_headers", {})).items()
+    }
+
+def acessos_antes (response: ResponseHttp) -> None:
+    DictNormalizado(headers_dict_antes(response)).get("Content-Type", "")
+    "\n".join(f"{h}: {v}" for h, v in headers_dict_antes(response).items())
+    DictNormalizado(headers_dict_antes(response)).get("Content-Length", "")
+
+def acessos_depois (response: ResponseHttp) -> None:
+    response.headers.get("Content-Type", "")
+    "\n".join(f"{h}: {v}" for h, v in response.headers_dict.items())
+    response.headers.get("Content-Length", "")
+
+def nova_response () -> ResponseHttp:
+    return ResponseHttp.New(httpx.Response(200, headers=HEADERS, content=b""))
+
+def main () -> None:
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    for nome, acessos in (("antes", acessos_antes), ("depois", acessos_depois)):
+        segundos = min(timeit.repeat(lambda: acessos(nova_response()), number=repeticoes, repeat=5))
+        base = min(timeit.repeat(nova_response, number=repeticoes, repeat=5))
+        print(f"{nome:>6}: {(segundos - base) / repeticoes * 1e6:.2f} µs de overhead de headers por resposta")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark do tempo de importação do pacote pelo `python -X importtime`
+- `import dclick` importa apenas o `logger`, os subpacotes são importados no primeiro acesso
+- `dclick.<subpacote>` mede o custo do primeiro acesso de cada subpacote
+- `todos` acessa todos os subpacotes, equivalente ao `import dclick` das versões anteriores
+- Cada medição executada em um novo interpretador, reportado a mediana do tempo cumulativo e a quantidade de módulos
+- Encerrado com código `1` caso o `import dclick` volte a importar algum dos `MODULOS_PROIBIDOS`, protegendo o ganho
+
+Executar `uv run python benchmarks/importacao.py [repeticoes]`"""
+
+# std
+import re, sys, statistics, subprocess
+
+SUBPACOTES = ("http", "cofre", "email", "holmes", "nora", "central")
+MODULOS_PROIBIDOS = ("httpx", "httpcore", "smtplib", "dclick.http", "dclick.holmes", "dclick.nora", "dclick.cofre", "dclick.central", "dclick.email")
+"""Módulos que não podem ser importados por um `import dclick` sem acesso aos subpacotes
+- Módulos importados pela biblioteca `bot` através do `logger` não são considerados"""
+
+PADRAO_LINHA = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+def medir (codigo: str) -> tuple[float, dict[str, int]]:
+    """Executar o `codigo` em um novo interpretador com o `-X importtime`
+    - Retornado os milissegundos cumulativos das importações de nível superior e o tempo cumulativo, em µs, por módulo"""
+    processo = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                              capture_output=True, text=True, check=True)
+    modulos = dict[str, int]()
+    total = 0
+    for linha in processo.stderr.splitlines():
+        encontrado = PADRAO_LINHA.match(linha)
+        if not encontrado: continue
+        _, cumulativo, indentacao, modulo = encontrado.groups()
+        modulos[modulo] = int(cumulativo)
+        # Apenas os módulos de nível superior para não contar os tempos aninhados duas vezes
+        if len(indentacao) == 1: total += int(cumulativo)
+    return total / 1000, modulos
+
+def main () -> None:
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    cenarios = [("import dclick", "import dclick")]
+    cenarios.extend((f"dclick.{subpacote}", f"import dclick; dclick.{subpacote}") for subpacote in SUBPACOTES)
+    cenarios.append(("todos", "import dclick; " + "; ".join(f"dclick.{subpacote}" for subpacote in SUBPACOTES)))
+
+    modulos_import = dict[str, int]()
+    for nome, codigo in cenarios:
+        medicoes = [medir(codigo) for _ in range(repeticoes)]
+        milissegundos = statistics.median(total for total, _ in medicoes)
+        modulos = medicoes[-1][1]
+        if nome == "import dclick": modulos_import = modulos
+        print(f"{nome:>16}: {milissegundos:8.2f} ms | {len(modulos):4} módulos")
+
+    proibidos = [
+        modulo for modulo in modulos_import
+        if any(modulo == proibido or modulo.startswith(f"{proibido}.") for proibido in MODULOS_PROIBIDOS)
+    ]
+    if proibidos:
+        print(f"\n`import dclick` importou módulos que deveriam ser carregados sob demanda: {', '.join(sorted(proibidos))}")
+        sys.exit(1)
+    print("\n`import dclick` sem os módulos proibidos")
+
+if __name__ == "__main__":
+    main()
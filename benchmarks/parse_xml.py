@@ -0,0 +1,79 @@
+"""Benchmark do parse de respostas `xml` grandes no formato de uma NFe com muitos itens `det`
+- `xml` realiza o parse completo do documento para um `ElementoXML`, como nas versões anteriores
+- `iter_xml (det)` extrai todos os itens `det` incrementalmente, retendo os itens
+- `iter_xml (det consumo)` processa e descarta cada item, uso esperado para documentos grandes
+- `iterar_xml (det consumo)` processa e descarta cada item como `xml.etree.ElementTree.Element`, sem a conversão para `ElementoXML`
+- `iter_xml (ide)` extrai apenas o nó de identificação, poucos bytes do documento
+- Reportado o tempo mínimo e o pico de memória alocada pelo `tracemalloc`
+
+Executar `uv run python benchmarks/parse_xml.py [itens ...]`"""
+
+# std
+import sys, timeit, tracemalloc
+from typing import Callable
+# interno
+from dclick.http import ResponseHttp, TAMANHO_CHUNK, iterar_xml
+# externo
+import httpx
+
+def gerar_payload (quantidade: int) -> bytes:
+    itens = "".join(
+        f'<det nItem="{indice}"><prod><cProd>{indice:08d}</cProd><xProd>PRODUTO {indice} DESCRICAO LONGA</xProd>'
+        f"<NCM>87089990</NCM><CFOP>5405</CFOP><qCom>1.0000</qCom><vProd>{indice % 1000}.00</vProd></prod>"
+        f"<imposto><ICMS><ICMS60><orig>0</orig><CST>60</CST></ICMS60></ICMS></imposto></det>"
+        for indice in range(1, quantidade + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<nfeProc xmlns="http://www.portalfiscal.inf.br/nfe" versao="4.00"><NFe><infNFe Id="NFe123" versao="4.00">'
+        "<ide><cUF>35</cUF><nNF>123</nNF><serie>1</serie></ide>"
+        f"{itens}"
+        "<total><ICMSTot><vNF>1000.00</vNF></ICMSTot></total>"
+        "</infNFe></NFe></nfeProc>"
+    ).encode()
+
+def nova_response (payload: bytes) -> ResponseHttp:
+    return ResponseHttp.New(httpx.Response(200, content=payload, headers={ "Content-Type": "application/xml" }))
+
+def xml_completo (payload: bytes) -> object:
+    return nova_response(payload).xml()
+
+def iter_xml_det (payload: bytes) -> list[object]:
+    return list(nova_response(payload).iter_xml("infNFe/det"))
+
+def iter_xml_det_consumo (payload: bytes) -> int:
+    return sum(1 for _ in nova_response(payload).iter_xml("infNFe/det"))
+
+def iterar_xml_det_consumo (payload: bytes) -> int:
+    response = nova_response(payload)
+    return sum(1 for _ in iterar_xml(response.iter_bytes(TAMANHO_CHUNK), "infNFe/det"))
+
+def iter_xml_ide (payload: bytes) -> list[object]:
+    return list(nova_response(payload).iter_xml("/nfeProc/NFe/infNFe/ide"))
+
+def pico_memoria (funcao: Callable[[bytes], object], payload: bytes) -> int:
+    """Pico de memória alocada além do `payload` já carregado"""
+    tracemalloc.start()
+    try:
+        funcao(payload)
+        return tracemalloc.get_traced_memory()[1]
+    finally: tracemalloc.stop()
+
+def main () -> None:
+    quantidades = [int(argumento) for argumento in sys.argv[1:]] or [1_000, 10_000]
+
+    for quantidade in quantidades:
+        payload = gerar_payload(quantidade)
+        print(f"\n{quantidade} itens ({len(payload) / 1024:.0f} KiB)")
+
+        for nome, funcao in (("xml", xml_completo),
+                             ("iter_xml (det)", iter_xml_det),
+                             ("iter_xml (det consumo)", iter_xml_det_consumo),
+                             ("iterar_xml (det consumo)", iterar_xml_det_consumo),
+                             ("iter_xml (ide)", iter_xml_ide)):
+            segundos = min(timeit.repeat(lambda: funcao(payload), number=1, repeat=5))
+            memoria = pico_memoria(funcao, payload)
+            print(f"{nome:>24}: {segundos * 1000:8.2f} ms | pico {memoria / 1024 / 1024:7.2f} MiB")
+
+if __name__ == "__main__":
+    main()
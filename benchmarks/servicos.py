@@ -0,0 +1,233 @@
+"""Benchmark dos clientes `holmes`, `central`, `cofre` e `nora` contra os servidores locais do `benchmarks/servidores.py`
+- Executado o código real dos pacotes, com os clientes do `http.registro_clientes` apontados para os servidores locais
+- Servidores executados em um processo separado para não concorrerem pelo `GIL` com o código medido
+- Opções de conexão, retentativa, cache e demais conforme as seções do .ini, como em produção
+- Para cada cenário e concorrência: throughput, latências `p50/p95/p99` e pico de memória alocada pelo `tracemalloc`
+- Memória medida em uma execução separada com `--operacoes-memoria`, pois o `tracemalloc` afeta as latências
+- Resultado salvo em `json` com as estatísticas por rota do `http.historico_http`
+- `--comparar` com o `json` de uma execução anterior para exibir a variação de throughput e `p95`
+
+Executar `uv run python benchmarks/servicos.py --latencia 20 --concorrencia 1 8 --saida resultado.json`
+Executar `uv run python benchmarks/servicos.py --cenarios holmes --comparar resultado.json`"""
+
+# std
+from __future__ import annotations
+import sys, json, time, tempfile, platform, argparse, statistics, tracemalloc, importlib.metadata
+from datetime import datetime
+from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+# interno
+from dclick.http import ClienteHttp, registro_clientes, historico_http
+from dclick.holmes import Tarefa, Processo, Documento, cache_modelos
+from dclick.central import SolicitacaoPendente
+from dclick.cofre import consultar_segredo
+from dclick.nora import executar_extracao, acompanhar_extracao, consultar_extracao
+from servidores import ProcessoServidores, id_hex
+# externo
+from bot.estruturas import Caminho
+
+type Operacao = Callable[[int], object]
+
+class Cenario:
+    """Operação de um serviço medida pelo benchmark
+    - `preparar` executado uma única vez, fora da medição, para obter os objetos utilizados pela operação"""
+
+    def __init__ (self, nome: str, servico: str, preparar: Callable[[], Operacao]) -> None:
+        self.nome = nome
+        self.servico = servico
+        self.preparar = preparar
+
+def cenarios () -> list[Cenario]:
+    id_tarefa, id_processo = id_hex("tarefa"), id_hex("processo")
+    id_documento, conteudo_upload = id_hex("documento0"), b"%PDF-1.4 " + b"0" * 256 * 1024
+
+    def metodo_tarefa (metodo: Callable[[Tarefa, int], object]) -> Callable[[], Operacao]:
+        def preparar () -> Operacao:
+            tarefa = Tarefa.Consultar(id_tarefa)
+            return lambda indice: metodo(tarefa, indice)
+        return preparar
+
+    def metodo_processo (metodo: Callable[[Processo, int], object]) -> Callable[[], Operacao]:
+        def preparar () -> Operacao:
+            processo = Processo.Consultar(id_processo)
+            return lambda indice: metodo(processo, indice)
+        return preparar
+
+    def baixar_documentos (processo: Processo) -> object:
+        with tempfile.TemporaryDirectory(prefix="benchmark_holmes_") as diretorio:
+            return processo.BaixarDocumentos(Caminho(diretorio), concorrencia=8)
+
+    def output_data () -> Operacao:
+        solicitacao = SolicitacaoPendente.Consultar(limit=1)[0]
+        return lambda indice: solicitacao.AtualizarOutputData({ "indice": indice })
+
+    return [
+        Cenario("holmes.tarefa_consultar", "holmes", lambda: lambda _: Tarefa.Consultar(id_tarefa)),
+        Cenario("holmes.processo_consultar", "holmes", lambda: lambda _: Processo.Consultar(id_processo)),
+        Cenario("holmes.tarefa_consultar_muitos", "holmes",
+                lambda: lambda indice: Tarefa.ConsultarMuitos(id_hex(f"tarefa{indice}_{item}") for item in range(20)).esperar_sucesso()),
+        Cenario("holmes.processo_documentos", "holmes", metodo_processo(lambda processo, _: processo.Documentos())),
+        Cenario("holmes.processo_historico", "holmes", metodo_processo(lambda processo, _: processo.Historico())),
+        Cenario("holmes.processo_baixar_documentos", "holmes", metodo_processo(lambda processo, _: baixar_documentos(processo))),
+        Cenario("holmes.itens_tabela", "holmes", metodo_tarefa(lambda tarefa, _: tarefa.ItensTabela("Itens 0"))),
+        Cenario("holmes.iterar_itens_tabela", "holmes", metodo_tarefa(lambda tarefa, _: sum(1 for _ in tarefa.IterarItensTabela("Itens 0")))),
+        Cenario("holmes.tomar_acao", "holmes", metodo_tarefa(lambda tarefa, _: tarefa.TomarAcao("Aprovar"))),
+        Cenario("holmes.documento_consultar", "holmes", lambda: lambda _: Documento.Consultar(id_documento)),
+        Cenario("holmes.documento_em_disco", "holmes", lambda: lambda _: Documento.Consultar(id_documento, em_disco=True)),
+        Cenario("holmes.documento_upload", "holmes", lambda: lambda _: Documento.Upload("documento.pdf", conteudo_upload)),
+        Cenario("central.pendentes_consultar", "central_processamento", lambda: lambda _: SolicitacaoPendente.Consultar(limit=50)),
+        Cenario("central.output_data", "central_processamento", output_data),
+        Cenario("cofre.consultar_segredo", "cofre", lambda: lambda _: consultar_segredo("EMAIL_CREDENTIALS")),
+        Cenario("nora.executar_extracao", "nora",
+                lambda: lambda indice: executar_extracao("nota_fiscal", "application/pdf", f"nota_{indice}.pdf", "JVBERi0xLjQ=")),
+        Cenario("nora.acompanhar_extracao", "nora", lambda: lambda _: acompanhar_extracao("vXRdxHZRrUKj")),
+        Cenario("nora.consultar_extracao", "nora", lambda: lambda _: consultar_extracao(id_hex("extracao", 32))),
+    ]
+
+def apontar_clientes (urls: dict[str, str]) -> None:
+    """Registrar as fábricas dos clientes dos pacotes com o `base_url` dos servidores locais
+    - Demais opções do `ClienteHttp.FromConfig()` conforme a seção do .ini
+    - `metricas` sempre habilitadas para gerar as estatísticas por rota"""
+    timeouts = { "holmes": 120, "central_processamento": 30, "cofre": 120, "nora": 60 }
+
+    def fabrica (secao: str, url: str) -> ClienteHttp:
+        client = ClienteHttp.FromConfig(
+            secao,
+            timeout  = timeouts[secao],
+            base_url = url,
+            headers  = { "api_token": "benchmark", "x-api-key": "benchmark" },
+            follow_redirects = True,
+            compartilhar_transporte = True,
+        )
+        client.metricas = historico_http
+        return client
+
+    for secao, url in urls.items():
+        registro_clientes.registrar(secao, lambda secao=secao, url=url: fabrica(secao, url))
+
+def executar (operacao: Operacao, operacoes: int, concorrencia: int) -> tuple[float, list[float], int]:
+    """Executar a `operacao` com a `concorrencia` informada
+    - Retornado os segundos totais, as latências de cada operação com sucesso e a quantidade de erros"""
+    def medir (indice: int) -> float | None:
+        inicio = time.perf_counter()
+        try: operacao(indice)
+        except Exception: return None
+        return time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    if concorrencia <= 1:
+        resultados = [medir(indice) for indice in range(operacoes)]
+    else:
+        with ThreadPoolExecutor(concorrencia) as executor:
+            resultados = list(executor.map(medir, range(operacoes)))
+    segundos = time.perf_counter() - inicio
+
+    latencias = [latencia for latencia in resultados if latencia is not None]
+    return segundos, latencias, len(resultados) - len(latencias)
+
+def pico_memoria (operacao: Operacao, operacoes: int, concorrencia: int) -> int:
+    tracemalloc.start()
+    try:
+        executar(operacao, operacoes, concorrencia)
+        return tracemalloc.get_traced_memory()[1]
+    finally: tracemalloc.stop()
+
+def percentil (latencias: list[float], percentil: int) -> float:
+    if len(latencias) < 2: return latencias[0] * 1000 if latencias else 0.0
+    return statistics.quantiles(latencias, n=100, method="inclusive")[percentil - 1] * 1000
+
+def comparar (atual: list[dict[str, Any]], caminho: str) -> None:
+    """Exibir a variação de throughput e `p95` em relação ao resultado no `caminho`"""
+    with open(caminho, encoding="utf-8") as arquivo:
+        anterior = json.load(arquivo)
+    indice = { (item["cenario"], item["concorrencia"]): item for item in anterior["resultados"] }
+    print(f"\nComparação com {caminho} (versão {anterior['versao']}, {anterior['data']})")
+
+    for item in atual:
+        base = indice.get((item["cenario"], item["concorrencia"]))
+        if base is None or not base["throughput"] or not base["p95_ms"]: continue
+        throughput = item["throughput"] / base["throughput"] - 1
+        p95 = item["p95_ms"] / base["p95_ms"] - 1
+        print(f"{item['cenario']:>30} c={item['concorrencia']:<3} throughput {throughput:+7.1%} | p95 {p95:+7.1%}")
+
+def argumentos () -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark dos clientes dos pacotes contra servidores locais")
+    parser.add_argument("--cenarios", nargs="*", default=[], help="Prefixos dos cenários. Ex: holmes nora.consultar")
+    parser.add_argument("--concorrencia", nargs="+", type=int, default=[1, 8])
+    parser.add_argument("--operacoes", type=int, default=200, help="Operações por cenário e concorrência")
+    parser.add_argument("--operacoes-memoria", type=int, default=20)
+    parser.add_argument("--latencia", type=float, default=10.0, help="Latência, em milissegundos, de cada resposta")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Variação proporcional da latência")
+    parser.add_argument("--tamanho-documento", type=int, default=512, help="KiB dos documentos baixados")
+    parser.add_argument("--itens-tabela", type=int, default=250)
+    parser.add_argument("--saida", default=f"benchmarks/resultado_{datetime.now():%Y%m%d_%H%M%S}.json")
+    parser.add_argument("--comparar", default=None, help="json de uma execução anterior")
+    return parser.parse_args()
+
+def executar_cenarios (args: argparse.Namespace) -> None:
+    selecionados = [
+        cenario for cenario in cenarios()
+        if not args.cenarios or any(cenario.nome.startswith(prefixo) for prefixo in args.cenarios)
+    ]
+
+    resultados = list[dict[str, Any]]()
+    for cenario in selecionados:
+        operacao = cenario.preparar()
+        executar(operacao, min(5, args.operacoes), 1) # aquecimento das conexões
+
+        for concorrencia in args.concorrencia:
+            segundos, latencias, erros = executar(operacao, args.operacoes, concorrencia)
+            memoria = pico_memoria(operacao, args.operacoes_memoria, concorrencia)
+            resultado = {
+                "cenario": cenario.nome,
+                "servico": cenario.servico,
+                "concorrencia": concorrencia,
+                "operacoes": args.operacoes,
+                "erros": erros,
+                "segundos": round(segundos, 4),
+                "throughput": round(len(latencias) / segundos, 2) if segundos else 0.0,
+                "p50_ms": round(percentil(latencias, 50), 2),
+                "p95_ms": round(percentil(latencias, 95), 2),
+                "p99_ms": round(percentil(latencias, 99), 2),
+                "pico_memoria_bytes": memoria,
+            }
+            resultados.append(resultado)
+            print(f"{cenario.nome:>30} c={concorrencia:<3} {resultado['throughput']:9.1f} op/s | "
+                  f"p50 {resultado['p50_ms']:8.2f} ms | p95 {resultado['p95_ms']:8.2f} ms | "
+                  f"pico {memoria / 1024 / 1024:7.2f} MiB | erros {erros}")
+
+    try: versao = importlib.metadata.version("dclick")
+    except importlib.metadata.PackageNotFoundError: versao = "desconhecida"
+
+    saida = {
+        "versao": versao,
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "plataforma": platform.platform(),
+        "parametros": { chave: valor for chave, valor in vars(args).items() if chave not in ("saida", "comparar") },
+        "resultados": resultados,
+        "http": historico_http.as_dict(),
+        "clientes": registro_clientes.as_dict(),
+        "cache_modelos": cache_modelos.as_dict(),
+    }
+    with open(args.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(saida, arquivo, ensure_ascii=False, indent=2)
+    print(f"\nResultado salvo em {args.saida}")
+
+    if args.comparar: comparar(resultados, args.comparar)
+    registro_clientes.fechar()
+
+def main () -> None:
+    args = argumentos()
+    servidores = ProcessoServidores(
+        latencia = args.latencia / 1000,
+        jitter = args.jitter,
+        tamanho_documento = args.tamanho_documento * 1024,
+        itens_tabela = args.itens_tabela,
+    )
+    with servidores:
+        apontar_clientes(servidores.urls)
+        executar_cenarios(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""Servidores http locais que simulam as rotas do Holmes, Central de Processamento, Cofre e Nora
+- Utilizados pelo `benchmarks/servicos.py` para medir o código real dos clientes sem acesso às APIs
+- Respostas no formato esperado pelos modelos de cada pacote
+- `latencia` em segundos aplicada antes de cada resposta, com variação aleatória de `jitter` proporcional
+
+Executar `uv run python benchmarks/servidores.py` para manter os servidores em execução e inspecionar as rotas"""
+
+# std
+from __future__ import annotations
+import re, json, time, random, socket, hashlib, threading, multiprocessing
+from typing import Any, Callable
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+type Resposta = tuple[int, dict[str, str], bytes]
+type Rota = tuple[str, re.Pattern[str], Callable[[re.Match[str], dict[str, list[str]], bytes], Resposta]]
+
+DATA = "2026-10-12T12:00:00.000Z"
+
+def resposta_json (dados: Any, status: int = 200) -> Resposta:
+    return status, { "Content-Type": "application/json" }, json.dumps(dados).encode()
+
+def resposta_vazia (status: int = 204) -> Resposta:
+    return status, {}, b""
+
+def id_hex (valor: int | str, tamanho: int = 24) -> str:
+    """Identificador hexadecimal determinístico para o `valor`"""
+    return hashlib.sha256(str(valor).encode()).hexdigest()[:tamanho]
+
+class ServidorSimulado:
+    """Servidor http local, em uma thread, que responde conforme as `rotas`
+    - `url` disponível após o `iniciar()`
+    - `requests` contador de requests atendidos"""
+
+    def __init__ (self, nome: str, rotas: list[Rota], latencia: float = 0.0, jitter: float = 0.0) -> None:
+        self.nome = nome
+        self.rotas = rotas
+        self.latencia = latencia
+        self.jitter = jitter
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._servidor: ThreadingHTTPServer | None = None
+
+    def __repr__ (self) -> str:
+        return f"<ServidorSimulado {self.nome!r} url={self.url!r} requests={self.requests}>"
+
+    def __enter__ (self) -> ServidorSimulado:
+        return self.iniciar()
+
+    def __exit__ (self, *args: Any) -> None:
+        self.parar()
+
+    @property
+    def url (self) -> str:
+        assert self._servidor is not None, f"Servidor '{self.nome}' não iniciado"
+        host, porta = self._servidor.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    def iniciar (self) -> ServidorSimulado:
+        servidor = self
+
+        class Handler (BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message (self, *args: Any) -> None: pass
+
+            def setup (self) -> None:
+                super().setup()
+                # headers e corpo escritos separadamente, evitar o atraso do algoritmo de Nagle com o ACK atrasado do cliente
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET (self) -> None: servidor._responder(self)
+            def do_PUT (self) -> None: servidor._responder(self)
+            def do_POST (self) -> None: servidor._responder(self)
+            def do_PATCH (self) -> None: servidor._responder(self)
+            def do_DELETE (self) -> None: servidor._responder(self)
+
+        self._servidor = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._servidor.daemon_threads = True
+        threading.Thread(target=self._servidor.serve_forever, name=f"servidor-{self.nome}", daemon=True).start()
+        return self
+
+    def parar (self) -> None:
+        if self._servidor is None: return
+        self._servidor.shutdown()
+        self._servidor.server_close()
+        self._servidor = None
+
+    def _responder (self, handler: BaseHTTPRequestHandler) -> None:
+        corpo = _ler_corpo(handler)
+        partes = urlsplit(handler.path)
+        with self._lock: self.requests += 1
+
+        status, headers, conteudo = 404, { "Content-Type": "application/json" }, b'{"message": "rota inexistente"}'
+        for metodo, padrao, funcao in self.rotas:
+            if metodo == handler.command and (correspondencia := padrao.fullmatch(partes.path)):
+                status, headers, conteudo = funcao(correspondencia, parse_qs(partes.query), corpo)
+                break
+
+        if self.latencia > 0:
+            time.sleep(max(0.0, self.latencia * (1 + random.uniform(-self.jitter, self.jitter))))
+
+        handler.send_response(status)
+        for nome, valor in headers.items():
+            handler.send_header(nome, valor)
+        handler.send_header("Content-Length", str(len(conteudo)))
+        handler.end_headers()
+        handler.wfile.write(conteudo)
+
+def _ler_corpo (handler: BaseHTTPRequestHandler) -> bytes:
+    """Ler o corpo do request com `Content-Length` ou `Transfer-Encoding: chunked`"""
+    if handler.headers.get("Transfer-Encoding", "").lower() == "chunked":
+        partes = list[bytes]()
+        while tamanho := int(handler.rfile.readline().split(b";")[0].strip() or b"0", 16):
+            partes.append(handler.rfile.read(tamanho))
+            handler.rfile.readline()
+        # trailers até a linha vazia
+        while handler.rfile.readline().strip(): pass
+        return b"".join(partes)
+    return handler.rfile.read(int(handler.headers.get("Content-Length") or 0))
+
+def rota (metodo: str, padrao: str) -> Callable[[Callable[..., Resposta]], Rota]:
+    """Criar a `Rota` com o `padrao` de path no formato de regex com grupos nomeados"""
+    def decorator (funcao: Callable[..., Resposta]) -> Rota:
+        return metodo, re.compile(padrao), funcao
+    return decorator
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Holmes
+# ---------------------------------------------------------------------------------------------------------------------
+
+def rotas_holmes (tamanho_documento: int = 512 * 1024, itens_tabela: int = 250) -> list[Rota]:
+    """Rotas do `dclick.holmes`
+    - `tamanho_documento` bytes dos documentos baixados
+    - `itens_tabela` quantidade total de itens paginados das tabelas"""
+    documento = random.Random(0).randbytes(tamanho_documento)
+
+    def atividade (indice: int, id_processo: str) -> dict[str, Any]:
+        return {
+            "id": id_hex(f"atividade{indice}{id_processo}"), "name": f"Atividade {indice}",
+            "task_id": id_hex(f"tarefa{indice}{id_processo}"), "status": "opened", "created_at": DATA,
+            "assignee": { "id": id_hex("usuario"), "name": "Bot" } if indice % 2 else None,
+        }
+
+    def tarefa (id_tarefa: str) -> dict[str, Any]:
+        return {
+            "id": id_tarefa, "name": "Conferência", "status": "opened", "task_id": id_tarefa,
+            "identifier": f"TAR-{id_tarefa[-6:]}", "template_id": id_hex("template"), "assignee_id": None,
+            "process_id": id_hex(f"processo{id_tarefa}"), "process_name": "Processo", "process_status": "opened",
+            "process_created_at": DATA,
+            "tables": [{ "id": id_hex(f"tabela{indice}"), "name": f"Itens {indice}" } for indice in range(3)],
+            "actions": [{ "id": id_hex(nome), "name": nome } for nome in ("Aprovar", "Reprovar", "Pendenciar")],
+            "documents": [{ "id": id_hex(f"documento{indice}"), "conditional": f"Documento {indice}" } for indice in range(5)],
+            "properties": [{ "id": id_hex(f"propriedade{indice}"), "name": f"campo_{indice}", "value": f"valor {indice}" }
+                           for indice in range(20)],
+        }
+
+    @rota("GET", r"/v1/tasks/(?P<id>\w+)")
+    def consultar_tarefa (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json(tarefa(match["id"]))
+
+    @rota("PUT", r"/v1/tasks/(?P<id>\w+)/assign")
+    def assumir_tarefa (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({ "id": match["id"], "assignee_id": json.loads(corpo)["user_id"] })
+
+    @rota("POST", r"/v1/tasks/(?P<id>\w+)/action")
+    def tomar_acao (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({ "id": match["id"] })
+
+    @rota("GET", r"/v1/tasks/(?P<id>\w+)/documents/(?P<documento>\w+)")
+    def documento_tarefa (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return 200, { "Content-Type": "application/pdf", "Content-Disposition": 'attachment; filename="documento.pdf"' }, documento
+
+    @rota("POST", r"/v1/tasks/(?P<id>\w+)/documents/(?P<documento>\w+)")
+    def anexar_documento (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_vazia()
+
+    @rota("GET", r"/v1/tasks/(?P<id>\w+)/tables/(?P<tabela>\w+)/table_items")
+    def itens_tabela_tarefa (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        pagina, por_pagina = int(query.get("page", ["1"])[0]), int(query.get("per_page", ["100"])[0])
+        inicio = (pagina - 1) * por_pagina
+        return resposta_json({
+            "items": [
+                {
+                    "id": id_hex(f"item{indice}{match['tabela']}"), "created_at": DATA, "updated_at": None,
+                    "property_values": [{ "id": id_hex(f"coluna{coluna}"), "name": f"coluna_{coluna}", "value": f"valor {indice}-{coluna}" }
+                                        for coluna in range(8)],
+                }
+                for indice in range(inicio, min(inicio + por_pagina, itens_tabela))
+            ],
+            "total": itens_tabela,
+        })
+
+    @rota("GET", r"/v1/processes/(?P<id>\w+)")
+    def consultar_processo (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({
+            "id": match["id"], "name": "Processo", "status": "opened", "identifier": f"PRO-{match['id'][-6:]}",
+            "solution_id": id_hex("solucao"), "created_at": DATA,
+            "current_activities": [atividade(indice, match["id"]) for indice in range(3)],
+        })
+
+    @rota("GET", r"/v1/processes/(?P<id>\w+)/details")
+    def detalhes_processo (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({ "instance": { "property_values": [
+            { "id": id_hex(f"detalhe{indice}"), "name": f"detalhe_{indice}", "value": f"valor {indice}", "property_values": [] }
+            for indice in range(30)
+        ]}})
+
+    @rota("GET", r"/v1/processes/(?P<id>\w+)/history")
+    def historico_processo (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({ "histories": [
+            { "id": id_hex(f"historico{indice}"), "key": "task.action", "message": f"Ação {indice}", "created_at": DATA,
+              "performed_by": "Bot", "properties": {} }
+            for indice in range(50)
+        ]})
+
+    @rota("GET", r"/v1/processes/(?P<id>\w+)/documents")
+    def documentos_processo (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({ "documents": [
+            { "id": id_hex(f"item_documento{indice}"), "name": f"Documento {indice}", "status": "active", "file": True,
+              "file_name": f"documento_{indice}.pdf", "document_id": id_hex(f"documento{indice}"), "created_at": DATA,
+              "removed": indice % 7 == 6 }
+            for indice in range(20)
+        ]})
+
+    @rota("GET", r"/v1/documents/(?P<id>\w+)/download")
+    def download_documento (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return 200, { "Content-Type": "application/pdf", "Content-Disposition": f'attachment; filename="{match["id"]}.pdf"' }, documento
+
+    @rota("GET", r"/v1/documents/(?P<id>\w+)/classify")
+    def classificacao_documento (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({ "id": match["id"], "nature_id": id_hex("natureza"), "file_name": "documento.pdf",
+                               "property_values": [{ "id": "cnpj", "name": "CNPJ", "value": "03095314000618" }] })
+
+    @rota("DELETE", r"/v1/documents/(?P<id>\w+)")
+    def remover_documento (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_vazia()
+
+    @rota("POST", r"/v1/documents")
+    def upload_documento (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        identificador = id_hex(len(corpo))
+        return resposta_json({ "id": identificador, "url": f"/v1/documents/{identificador}/download" })
+
+    return [
+        consultar_tarefa, assumir_tarefa, tomar_acao, documento_tarefa, anexar_documento, itens_tabela_tarefa,
+        consultar_processo, detalhes_processo, historico_processo, documentos_processo,
+        download_documento, classificacao_documento, remover_documento, upload_documento,
+    ]
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Central de Processamento
+# ---------------------------------------------------------------------------------------------------------------------
+
+def rotas_central () -> list[Rota]:
+    """Rotas do `dclick.central`"""
+
+    def solicitacao (indice: int | str, status: str = "pendente") -> dict[str, Any]:
+        return {
+            "id": id_hex(f"solicitacao{indice}", 32), "identification": f"Solicitação {indice}",
+            "data": { "empresa": "0001", "nota": f"{indice}" }, "outputData": None, "status": status,
+            "createdAt": DATA, "updatedAt": DATA, "completedAt": DATA if status in ("concluida", "erro", "cancelada") else None,
+            "retryCount": 0, "cancelledBy": None, "cancellationReason": None,
+            "events": [{ "message": "Criada", "status": "sucesso", "createdAt": DATA }],
+        }
+
+    def listar (query: dict[str, list[str]], status: str) -> Resposta:
+        limite, offset = int(query.get("limit", ["50"])[0]), int(query.get("offset", ["0"])[0])
+        return resposta_json([solicitacao(indice, status) for indice in range(offset, offset + limite)])
+
+    @rota("GET", r"/api/request-center/requests")
+    def consultar (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return listar(query, query.get("status", ["pendente"])[0])
+
+    @rota("GET", r"/api/request-center/requests/open")
+    def consultar_pendentes (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return listar(query, "pendente")
+
+    @rota("PATCH", r"/api/request-center/requests/(?P<id>\w+)/status")
+    def atualizar_status (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        dados = json.loads(corpo)
+        resposta = solicitacao(match["id"], dados["status"]) | { "id": match["id"] }
+        if dados["status"] == "cancelada": resposta["cancellationReason"] = dados.get("cancellationReason")
+        return resposta_json(resposta)
+
+    @rota("PATCH", r"/api/request-center/requests/(?P<id>\w+)/output-data")
+    def atualizar_output_data (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json(solicitacao(match["id"]) | { "id": match["id"], "outputData": json.loads(corpo)["outputData"] })
+
+    return [consultar, consultar_pendentes, atualizar_status, atualizar_output_data]
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Cofre
+# ---------------------------------------------------------------------------------------------------------------------
+
+def rotas_cofre () -> list[Rota]:
+    """Rotas do `dclick.cofre`"""
+
+    @rota("GET", r"/api/vault/get/(?P<nome>[\w\-]+)")
+    def consultar_segredo (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({
+            "key": match["nome"], "description": "Credenciais", "category": None, "status": "active",
+            "fields": { "username": "usuario", "password": "senha", "host": "smtp.local" },
+        })
+
+    return [consultar_segredo]
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Nora
+# ---------------------------------------------------------------------------------------------------------------------
+
+def rotas_nora () -> list[Rota]:
+    """Rotas do `dclick.nora`"""
+
+    def extracao (identificador: str) -> dict[str, Any]:
+        return {
+            "id": identificador, "trackingCode": identificador[:12], "status": "success", "createdAt": "2026-10-12T12:00:00",
+            "totalTokens": 1500, "resultJson": None, "confidenceJson": None, "errorMessage": None,
+            "agent": { "id": id_hex("agente", 32), "code": "nota_fiscal", "name": "Nota Fiscal", "description": None, "isActive": True },
+        }
+
+    @rota("POST", r"/agents/(?P<agente>[\w\-]+)/execute")
+    def executar (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        identificador = id_hex(len(corpo), 32)
+        return resposta_json({ "trackingCode": identificador[:12], "extractionId": identificador,
+                               "status": "pending", "message": "Extração criada" }, 202)
+
+    @rota("GET", r"/extractions/track/(?P<codigo>\w+)")
+    def acompanhar (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({
+            "extraction": extracao(match["codigo"].ljust(32, "0")),
+            "data": { "numero_nf": "123", "valor_total_nota": 1000.5, "itens": ["a", "b"] },
+            "confidence": { "numero_nf": 0.99, "valor_total_nota": 0.95, "itens": 0.9 },
+        })
+
+    @rota("GET", r"/extractions/(?P<id>\w+)")
+    def consultar (match: re.Match[str], query: dict[str, list[str]], corpo: bytes) -> Resposta:
+        return resposta_json({ "extraction": extracao(match["id"]) })
+
+    return [executar, acompanhar, consultar]
+
+def iniciar_servidores (latencia: float = 0.0,
+                        jitter: float = 0.0,
+                        tamanho_documento: int = 512 * 1024,
+                        itens_tabela: int = 250) -> dict[str, ServidorSimulado]:
+    """Iniciar um servidor por serviço, indexado pelo nome da seção do .ini"""
+    return {
+        "holmes": ServidorSimulado("holmes", rotas_holmes(tamanho_documento, itens_tabela), latencia, jitter).iniciar(),
+        "central_processamento": ServidorSimulado("central_processamento", rotas_central(), latencia, jitter).iniciar(),
+        "cofre": ServidorSimulado("cofre", rotas_cofre(), latencia, jitter).iniciar(),
+        "nora": ServidorSimulado("nora", rotas_nora(), latencia, jitter).iniciar(),
+    }
+
+class ProcessoServidores:
+    """Servidores do `iniciar_servidores()` executados em um processo separado
+    - Evita que o processamento dos servidores concorra pelo `GIL` com o código medido
+    - `urls` indexado pelo nome da seção do .ini, disponível dentro do `with`"""
+
+    def __init__ (self, **opcoes: Any) -> None:
+        self.opcoes = opcoes
+        self.urls = dict[str, str]()
+        self._parar = multiprocessing.Event()
+        self._processo: multiprocessing.Process | None = None
+
+    def __enter__ (self) -> ProcessoServidores:
+        recebedor, enviador = multiprocessing.Pipe(duplex=False)
+        self._processo = multiprocessing.Process(
+            target = _executar_servidores,
+            args = (enviador, self._parar, self.opcoes),
+            name = "servidores-simulados",
+            daemon = True,
+        )
+        self._processo.start()
+        self.urls = recebedor.recv()
+        return self
+
+    def __exit__ (self, *args: Any) -> None:
+        self._parar.set()
+        if self._processo is not None:
+            self._processo.join(5)
+            self._processo = None
+
+def _executar_servidores (enviador: Any, parar: Any, opcoes: dict[str, Any]) -> None:
+    servidores = iniciar_servidores(**opcoes)
+    enviador.send({ secao: servidor.url for secao, servidor in servidores.items() })
+    parar.wait()
+    for servidor in servidores.values():
+        servidor.parar()
+
+if __name__ == "__main__":
+    servidores = iniciar_servidores()
+    for servidor in servidores.values():
+        print(servidor)
+    try: threading.Event().wait()
+    except KeyboardInterrupt: pass
@@ -0,0 +1,76 @@
+"""Benchmark das imagens de template embutidas nos módulos do `dclick.nbs`
+- `importação`: tempo do `-X importtime` para importar todos os módulos do `dclick.nbs`, sem decodificar as imagens
+- `decodificação antes`: custo de decodificar todas as imagens pelo `Imagem.FromBase64()`, antes pago na importação
+- `primeiro uso`: custo de decodificar cada imagem no primeiro acesso do `TemplateImagem`
+- `uso em cache`: custo dos acessos seguintes, com a imagem já decodificada
+- `variante cinza`: criação da `TemplateImagem.variante(cinza=True)` no primeiro uso e em cache
+- `--procurar` mede também a primeira e a segunda busca de cada imagem na tela pelo `procurar_imagem(cinza=True)`.
+Necessário uma sessão com tela, as imagens não precisam estar visíveis
+
+Executar `uv run --extra nbs python benchmarks/template_imagem.py [--procurar]`"""
+
+# std
+import sys, time, types, pkgutil, importlib, statistics
+# interno
+import dclick.nbs
+from dclick.nbs import TemplateImagem
+from importacao import medir
+# externo
+from bot.imagem import Imagem
+
+def importar_modulos () -> list[types.ModuleType]:
+    """Importar todos os módulos do `dclick.nbs`"""
+    modulos = [dclick.nbs]
+    for modulo in pkgutil.walk_packages(dclick.nbs.__path__, "dclick.nbs."):
+        modulos.append(importlib.import_module(modulo.name))
+    return modulos
+
+def encontrar_templates (modulos: list[types.ModuleType]) -> dict[str, TemplateImagem]:
+    """Encontrar os `TemplateImagem` nas variáveis dos módulos e das classes"""
+    templates = dict[str, TemplateImagem]()
+    for modulo in modulos:
+        for nome, valor in vars(modulo).items():
+            if isinstance(valor, TemplateImagem):
+                templates[f"{modulo.__name__}.{nome}"] = valor
+            elif isinstance(valor, type) and valor.__module__ == modulo.__name__:
+                for atributo, template in vars(valor).items():
+                    if isinstance(template, TemplateImagem):
+                        templates[f"{modulo.__name__}.{nome}.{atributo}"] = template
+    return templates
+
+def cronometrar (funcao) -> float:
+    inicio = time.perf_counter()
+    funcao()
+    return (time.perf_counter() - inicio) * 1000
+
+def main () -> None:
+    procurar = "--procurar" in sys.argv[1:]
+    modulos = importar_modulos()
+    templates = encontrar_templates(modulos)
+    print(f"{len(templates)} imagens em {len(modulos)} módulos")
+
+    codigo = "; ".join(f"import {modulo.__name__}" for modulo in modulos)
+    importacao = statistics.median(medir(codigo)[0] for _ in range(5))
+    print(f"{'importação':>24}: {importacao:8.2f} ms")
+
+    antes = sum(cronometrar(lambda: Imagem.FromBase64(template.conteudo)) for template in templates.values())
+    print(f"{'decodificação antes':>24}: {antes:8.2f} ms")
+
+    assert not any(template.decodificado for template in templates.values()), "Imagens decodificadas na importação"
+    primeiro = { nome: cronometrar(lambda: template.imagem) for nome, template in templates.items() }
+    cache = sum(cronometrar(lambda: template.imagem) for template in templates.values())
+    print(f"{'primeiro uso':>24}: {sum(primeiro.values()):8.2f} ms | maior {max(primeiro.values()):.2f} ms")
+    print(f"{'uso em cache':>24}: {cache:8.2f} ms")
+
+    cinza = sum(cronometrar(lambda: template.variante(cinza=True)) for template in templates.values())
+    cinza_cache = sum(cronometrar(lambda: template.variante(cinza=True)) for template in templates.values())
+    print(f"{'variante cinza':>24}: {cinza:8.2f} ms | cache {cinza_cache:.2f} ms")
+
+    if not procurar: return
+    print()
+    for nome, template in templates.items():
+        buscas = [cronometrar(lambda: template.procurar_imagem(cinza=True, segundos=0)) for _ in range(2)]
+        print(f"{nome.removeprefix('dclick.nbs.'):>80}: primeira {buscas[0]:8.2f} ms | segunda {buscas[1]:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
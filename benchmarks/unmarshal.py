@@ -0,0 +1,78 @@
+"""Benchmark da decodificação de respostas `json` com listas grandes no formato do `holmes.Tarefa.ItensTabela`
+- `json + UnmarshalMany` decodifica com o `json` da biblioteca padrão e cria a lista de `dict`, como nas versões anteriores
+- `backend + UnmarshalMany` decodifica com o `decodificador.BACKEND` e cria a lista de `dict`
+- `iter_unmarshal` lê o corpo em partes e decodifica item a item pelo `BACKEND`, sem a lista intermediária, retendo todos os itens
+- `iter_unmarshal (consumo)` processa e descarta cada item, uso esperado para listas grandes
+- Reportado o tempo mínimo e o pico de memória alocada pelo `tracemalloc`
+
+Executar `uv run python benchmarks/unmarshal.py [itens ...]`"""
+
+# std
+import sys, json, timeit, tracemalloc
+from typing import Callable
+# interno
+from dclick.http import ResponseHttp, BACKEND
+from dclick.holmes import modelos
+# externo
+import httpx
+
+def gerar_payload (quantidade: int) -> bytes:
+    items = [
+        {
+            "id": f"{indice:032x}",
+            "created_at": "2026-10-12T12:00:00.000Z",
+            "updated_at": None,
+            "property_values": [
+                { "id": f"{propriedade:024x}", "name": f"coluna_{propriedade}", "value": f"valor {indice}-{propriedade}" }
+                for propriedade in range(8)
+            ],
+        }
+        for indice in range(quantidade)
+    ]
+    return json.dumps({ "items": items, "total": quantidade }).encode()
+
+def nova_response (payload: bytes) -> ResponseHttp:
+    return ResponseHttp.New(httpx.Response(200, content=payload, headers={ "Content-Type": "application/json" }))
+
+def json_unmarshal_many (payload: bytes) -> list[modelos.TableItem]:
+    response = nova_response(payload)
+    return modelos.TableItem.UnmarshalMany(json.loads(response.content).get("items", []))
+
+def backend_unmarshal_many (payload: bytes) -> list[modelos.TableItem]:
+    response = nova_response(payload)
+    return modelos.TableItem.UnmarshalMany(response.json().get("items", []))
+
+def iter_unmarshal (payload: bytes) -> list[modelos.TableItem]:
+    response = nova_response(payload)
+    return list(response.iter_unmarshal(modelos.TableItem, "items"))
+
+def iter_unmarshal_consumo (payload: bytes) -> int:
+    response = nova_response(payload)
+    return sum(1 for _ in response.iter_unmarshal(modelos.TableItem, "items"))
+
+def pico_memoria (funcao: Callable[[bytes], object], payload: bytes) -> int:
+    """Pico de memória alocada além do `payload` já carregado"""
+    tracemalloc.start()
+    try:
+        funcao(payload)
+        return tracemalloc.get_traced_memory()[1]
+    finally: tracemalloc.stop()
+
+def main () -> None:
+    quantidades = [int(argumento) for argumento in sys.argv[1:]] or [1_000, 10_000]
+    print(f"backend: {BACKEND}")
+
+    for quantidade in quantidades:
+        payload = gerar_payload(quantidade)
+        print(f"\n{quantidade} itens ({len(payload) / 1024:.0f} KiB)")
+
+        for nome, funcao in (("json + UnmarshalMany", json_unmarshal_many),
+                             ("backend + UnmarshalMany", backend_unmarshal_many),
+                             ("iter_unmarshal", iter_unmarshal),
+                             ("iter_unmarshal (consumo)", iter_unmarshal_consumo)):
+            segundos = min(timeit.repeat(lambda: funcao(payload), number=1, repeat=5))
+            memoria = pico_memoria(funcao, payload)
+            print(f"{nome:>24}: {segundos * 1000:8.2f} ms | pico {memoria / 1024 / 1024:7.2f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,21 @@
 """Biblioteca com pacotes padronizados para as ferramentas utilizadas recorrentemente pelos bots da **DClick**
 ### Dependência `dclick[nbs]` necessária para utilizar `dclick.nbs`
-### Dependência `dclick[dealernet]` necessária para utilizar `dclick.dealernet`"""
+### Dependência `dclick[dealernet]` necessária para utilizar `dclick.dealernet`
+### Subpacotes importados apenas no primeiro acesso, `import dclick` carrega somente o `logger`"""
 
+import typing
 from dclick.logger.setup import logger
-from dclick import (
-    http,
-    cofre,
-    email,
-    holmes,
-    nora,
-    central
-)
\ No newline at end of file
+from dclick.importacao import sob_demanda
+
+# Subpacotes importados apenas no primeiro acesso. Ex: `dclick.holmes`
+if typing.TYPE_CHECKING:
+    from dclick import (
+        http,
+        cofre,
+        email,
+        holmes,
+        nora,
+        central
+    )
+
+__getattr__, __dir__ = sob_demanda(__name__, "http", "cofre", "email", "holmes", "nora", "central")
\ No newline at end of file
@@ -1,5 +1,5 @@
 # std
-import certifi, functools
+import certifi
 from typing import Any, Self, Literal
 from datetime import datetime as Datetime
 # interno
@@ -11,16 +11,19 @@ from bot.formatos import Unmarshaller
 type STATUS = Literal["nova", "pendente", "concluida", "erro", "cancelada"]
 type STATUS_EVENTO = Literal["sucesso", "erro"]
 
-@functools.cache
+@dclick.http.registro_clientes.cliente("central_processamento")
 def client_singleton () -> dclick.http.ClienteHttp:
     """Criar o http `Client` configurado com o `host`, `apikey` e timeout
-    - O Client ficará aberto após a primeira chamada na função devido ao `@cache`"""
+    - Client gerenciado pelo `registro_clientes`: criado na primeira chamada, fechado ao final da execução e recriado após `fork` ou alteração da seção
+    - Opções de conexão, timeouts e retentativas conforme as variáveis da seção `[central_processamento]`"""
     host, apikey = bot.config.central_processamento.obter("host", "apikey")
-    return dclick.http.ClienteHttp(
+    return dclick.http.ClienteHttp.FromConfig(
+        "central_processamento",
+        timeout  = 30,
         base_url = host,
         headers  = { "x-api-key": apikey },
-        timeout  = 30,
         verify   = certifi.where(),
+        compartilhar_transporte = True,
         follow_redirects = True,
     )
 
@@ -1,5 +1,5 @@
 # std
-import typing, certifi, functools
+import typing, certifi
 # interno
 import dclick
 from dclick.cofre import modelos
@@ -8,19 +8,22 @@ import bot
 from bot.formatos import Unmarshaller
 from bot.estruturas import DictNormalizado
 
-@functools.cache
+@dclick.http.registro_clientes.cliente("cofre")
 def client_singleton () -> dclick.http.ClienteHttp:
     """Criar o http `Client` configurado com o `host`, `token` e timeout
-    - O Client ficará aberto após a primeira chamada na função devido ao `@cache`"""
+    - Client gerenciado pelo `registro_clientes`: criado na primeira chamada, fechado ao final da execução e recriado após `fork` ou alteração da seção
+    - Opções de conexão, timeouts e retentativas conforme as variáveis da seção `[cofre]`"""
     host, apikey = bot.config.cofre.obter("host", "apikey")
-    return dclick.http.ClienteHttp(
+    return dclick.http.ClienteHttp.FromConfig(
+        "cofre",
+        timeout  = 120,
         base_url = host,
         headers  = {
             "x-api-key": apikey,
             "x-real-ip": bot.config.cofre.obter_ou("x-real-ip", default="")
         },
-        timeout  = 120,
         verify   = certifi.where(),
+        compartilhar_transporte = True,
         follow_redirects = True,
     )
 
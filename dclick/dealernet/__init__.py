@@ -1,5 +1,12 @@
 """Pacote destinado ao `Sistema Web Dealer-Net`
 ## Dependência `dclick[dealernet]` necessária para utilizar `dclick.dealernet`"""
 
+import typing
+from dclick.importacao import sob_demanda
 from dclick.dealernet.login import *
-from dclick.dealernet import menus, integracao, produtos, financeiro, cadastro
\ No newline at end of file
+
+# Menus do sistema importados apenas no primeiro acesso
+if typing.TYPE_CHECKING:
+    from dclick.dealernet import menus, integracao, produtos, financeiro, cadastro
+
+__getattr__, __dir__ = sob_demanda(__name__, "menus", "integracao", "produtos", "financeiro", "cadastro")
\ No newline at end of file
@@ -1,3 +1,9 @@
 """Pacote para tratar o menu `Cadastro`"""
 
-from . import nota_fiscal_eletronica
\ No newline at end of file
+import typing
+from dclick.importacao import sob_demanda
+
+if typing.TYPE_CHECKING:
+    from . import nota_fiscal_eletronica
+
+__getattr__, __dir__ = sob_demanda(__name__, "nota_fiscal_eletronica")
\ No newline at end of file
@@ -1,3 +1,9 @@
 """Pacote para tratar o menu `Financeiro`"""
 
-from . import titulos_a_pagar
\ No newline at end of file
+import typing
+from dclick.importacao import sob_demanda
+
+if typing.TYPE_CHECKING:
+    from . import titulos_a_pagar
+
+__getattr__, __dir__ = sob_demanda(__name__, "titulos_a_pagar")
\ No newline at end of file
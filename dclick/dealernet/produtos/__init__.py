@@ -1,3 +1,9 @@
 """Pacote para tratar o menu `Produtos`"""
 
-from . import nf_entrada_item_avulso, nf_entrada_produto, nf_saida_item_avulso, nf_saida_produto
\ No newline at end of file
+import typing
+from dclick.importacao import sob_demanda
+
+if typing.TYPE_CHECKING:
+    from . import nf_entrada_item_avulso, nf_entrada_produto, nf_saida_item_avulso, nf_saida_produto
+
+__getattr__, __dir__ = sob_demanda(__name__, "nf_entrada_item_avulso", "nf_entrada_produto", "nf_saida_item_avulso", "nf_saida_produto")
\ No newline at end of file
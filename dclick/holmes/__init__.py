@@ -1,7 +1,17 @@
 """Pacote destinado ao `Holmes API`
 - Módulo `modelos` contem os formatos esperados pelas respostas do Holmes.
+- `cache_modelos` cache opcional das consultas de tarefas, processos e classificações
+- Módulo `aio` contem a variante assíncrona para realizar as consultas de forma concorrente
 \nReferências:
 - https://documenter.getpostman.com/view/24441173/2s93m63NCa
 - https://suporte.holmes.app/pt-br/integrações-com-o-holmes"""
 
-from dclick.holmes.setup import *
\ No newline at end of file
+import typing
+from dclick.importacao import sob_demanda
+from dclick.holmes.setup import *
+from dclick.holmes.cache import *
+
+if typing.TYPE_CHECKING:
+    from dclick.holmes import aio
+
+__getattr__, __dir__ = sob_demanda(__name__, "aio")
\ No newline at end of file
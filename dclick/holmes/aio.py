@@ -0,0 +1,231 @@
+"""Variante assíncrona do `Holmes API` para realizar as consultas independentes de forma concorrente
+- Mesmos modelos do `dclick.holmes`: as funções retornam `Tarefa`, `Processo`, `Documento` e os `modelos`
+- Métodos síncronos dos modelos, como `Tarefa.obter_acao()`, continuam disponíveis nos objetos retornados
+- Mesmas rotas do `dclick.holmes`, montadas pelo `dclick.holmes.rotas`, diferindo apenas no envio
+- Cliente `ClienteHttpAsync` criado por event loop pelo `registro_clientes`, com as mesmas variáveis da seção `[holmes]`
+- Cliente fechado ao encerrar o `asyncio.run()` ou pelo `fechar_client()`, e recriado após `fork` ou alteração da seção.
+O `fechar_client()` é obrigatório caso o event loop não seja gerenciado pelo `asyncio.run()`
+- Mesmo `cache_modelos` das consultas síncronas
+
+### Exemplo
+```
+import asyncio
+from dclick.holmes import aio
+
+async def main () -> None:
+    completa = await aio.consultar_tarefa_completa("id_tarefa")
+    documentos = await aio.consultar_documentos(
+        [item.document_id for item in completa.documentos if item.file and not item.removed]
+    )
+    await aio.fechar_client()
+
+asyncio.run(main())
+```"""
+
+# std
+from __future__ import annotations
+import certifi, asyncio
+from typing import Literal, Iterable, BinaryIO
+# interno
+import dclick
+from dclick.holmes import modelos, rotas
+from dclick.holmes.setup import Tarefa, Processo, Documento
+# externo
+import bot
+from bot.estruturas import Caminho
+
+@dclick.http.registro_clientes.cliente_async("holmes")
+def client_async () -> dclick.http.ClienteHttpAsync:
+    """Obter o `ClienteHttpAsync` do event loop atual configurado com o `host`, `token` e timeout
+    - Client gerenciado pelo `registro_clientes`: criado no primeiro uso em cada event loop, pois as conexões pertencem ao loop que as criou
+    - Opções de conexão, timeouts e retentativas conforme as variáveis da seção `[holmes]`"""
+    host, token = bot.config.holmes.obter("host", "token")
+    return dclick.http.ClienteHttpAsync.FromConfig(
+        "holmes",
+        timeout  = 120,
+        base_url = host,
+        headers  = { "api_token": token },
+        verify   = certifi.where(),
+    )
+
+async def fechar_client () -> None:
+    """Fechar o cliente do event loop atual antes do encerramento do event loop
+    - Obrigatório fora do `asyncio.run()`, como no `loop.run_until_complete()`, antes do `loop.close()`
+    - Um novo cliente é criado caso utilizado novamente"""
+    await dclick.http.registro_clientes.fechar_async("holmes")
+
+async def consultar_tarefa (id_tarefa: str) -> Tarefa:
+    """Consultar a tarefa `id_tarefa`
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await rotas.consultar_tarefa(id_tarefa, Tarefa).enviar_async(client_async())
+
+async def consultar_processo (id_processo: str) -> Processo:
+    """Consultar o processo `id_processo`
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await rotas.consultar_processo(id_processo, Processo).enviar_async(client_async())
+
+async def detalhes_processo (id_processo: str) -> list[modelos.DetalhesProcesso]:
+    """Consultar o campo `property_values` nos detalhes do processo `id_processo`
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await rotas.detalhes_processo(id_processo).enviar_async(client_async())
+
+async def historico_processo (id_processo: str) -> list[modelos.HistoryItem]:
+    """Consultar o histórico do processo `id_processo`
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await rotas.historico_processo(id_processo).enviar_async(client_async())
+
+async def documentos_processo (id_processo: str) -> list[modelos.DocumentItem]:
+    """Consultar os documentos do processo `id_processo`
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await rotas.documentos_processo(id_processo).enviar_async(client_async())
+
+async def _download (url: str, mensagem: str, em_disco: bool = False) -> Documento:
+    """Realizar o download do `url` em memória ou, caso `em_disco`, em `stream` para um arquivo temporário
+    - Mesmo comportamento do `Documento.Download()`"""
+    if em_disco: return await rotas.baixar_em_disco(url, mensagem, Documento).enviar_async(client_async())
+    return await rotas.baixar(url, mensagem, Documento).enviar_async(client_async())
+
+async def consultar_documento (document_id: str, *, em_disco: bool = False) -> Documento:
+    """Consultar o documento `document_id`
+    - `em_disco` para realizar o download em `stream` para um arquivo temporário
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await _download(*rotas.url_documento(document_id), em_disco)
+
+async def consultar_documentos (document_ids: Iterable[str], *,
+                                concorrencia: int = 8,
+                                em_disco: bool = False) -> list[Documento]:
+    """Consultar os documentos `document_ids` com até `concorrencia` downloads simultâneos
+    - Retornado na mesma ordem dos `document_ids`
+    - Primeiro erro propagado após o cancelamento dos downloads pendentes
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    semaforo = asyncio.Semaphore(max(1, concorrencia))
+
+    async def consultar (document_id: str) -> Documento:
+        async with semaforo:
+            return await consultar_documento(document_id, em_disco=em_disco)
+
+    tasks = [asyncio.ensure_future(consultar(document_id)) for document_id in document_ids]
+    try: return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks: task.cancel()
+        # Aguardar os downloads cancelados para que os arquivos temporários e conexões sejam liberados antes de retornar
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def documento_tarefa (tarefa: Tarefa, id_ou_conditional: str, *, em_disco: bool = False) -> Documento:
+    """Consultar o documento pelo `id` ou pelo `conditional` da `tarefa`
+    - `em_disco` para realizar o download em `stream` para um arquivo temporário
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await _download(*rotas.url_documento_tarefa(tarefa, id_ou_conditional), em_disco)
+
+async def remover_documento (document_id: str, descricao: str | None = None) -> None:
+    """Remover o documento `document_id`
+    - `descricao` para informar o motivo da remoção
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    await rotas.remover_documento(document_id, descricao).enviar_async(client_async())
+
+async def classificacao_documento (document_id: str) -> modelos.ClassificacaoDocumento:
+    """Consultar a classificação do documento `document_id`
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await rotas.classificacao_documento(document_id).enviar_async(client_async())
+
+async def upload_documento (nome_extensao: str,
+                            conteudo: str | bytes | Caminho | BinaryIO,
+                            *,
+                            classificacao: modelos.ClassificacaoDocumentoDict | None = None) -> modelos.UploadDocumento:
+    """Realizar o upload do documento `nome_extensao` via `base64`
+    - Veja a documentação do `Documento.Upload()`
+    - `conteudo=Caminho | BinaryIO` lido em partes pelo `asyncio.to_thread()`, sem bloquear o event loop
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await rotas.upload_documento(nome_extensao, conteudo, classificacao).enviar_async(client_async())
+
+async def itens_tabela (tarefa: Tarefa, id_ou_name: str, *,
+                                        page: int = 1,
+                                        per_page: int = 100) -> list[modelos.TableItem]:
+    """Consultar itens da tabela pelo `id` ou `name` na `tarefa`
+    - `page, per_page` realizar a paginação. Default: Primeiros 100
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    return await rotas.itens_tabela(tarefa, id_ou_name, page, per_page).enviar_async(client_async())
+
+async def anexar_documento (tarefa: Tarefa, id_documento: str, documento: tuple[str, bytes | Caminho | BinaryIO], *,
+                            mime_type: str | None = None) -> Tarefa:
+    """Realizar upload do documento `id_documento` com o conteúdo `documento` na `tarefa`
+    - Veja a documentação do `Tarefa.AnexarDocumento()`
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    await rotas.anexar_documento(tarefa, id_documento, documento, mime_type).enviar_async(client_async())
+    if tarefa.obter_documento(lambda d: d.id == id_documento) is None:
+        tarefa.documents = (await consultar_tarefa(tarefa.id)).documents
+    return tarefa
+
+async def assumir_tarefa (tarefa: Tarefa, id_usuario: str | None = None) -> Tarefa:
+    """Assumir a `tarefa` para o `id_usuario`
+    - Variáveis utilizadas `[holmes] -> host, token, [id_usuario]`"""
+    return await rotas.assumir_tarefa(tarefa, id_usuario).enviar_async(client_async())
+
+async def tomar_acao (tarefa: Tarefa, acao: str, *,
+                      propriedades: list[dict[Literal["id", "value", "text"], str]] | None = None) -> Tarefa:
+    """Tomar `ação` na `tarefa` e retornar a tarefa atualizada
+    - `acao` pode ser o `id` ou o `name`
+    - `propriedades` caso seja necessário informar algum adicional (motivo de pendência)
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    await rotas.tomar_acao(tarefa, acao, propriedades).enviar_async(client_async())
+    return await consultar_tarefa(tarefa.id)
+
+class TarefaCompleta:
+    """Tarefa com o processo, detalhes, histórico e documentos consultados de forma concorrente
+    ### Utilizar `consultar_tarefa_completa()` para realizar a consulta"""
+
+    tarefa: Tarefa
+    processo: Processo
+    detalhes: list[modelos.DetalhesProcesso]
+    historico: list[modelos.HistoryItem]
+    documentos: list[modelos.DocumentItem]
+
+    def __init__ (self, tarefa: Tarefa,
+                        processo: Processo,
+                        detalhes: list[modelos.DetalhesProcesso],
+                        historico: list[modelos.HistoryItem],
+                        documentos: list[modelos.DocumentItem]) -> None:
+        self.tarefa = tarefa
+        self.processo = processo
+        self.detalhes = detalhes
+        self.historico = historico
+        self.documentos = documentos
+
+    def __repr__ (self) -> str:
+        return (f"<holmes.aio.TarefaCompleta tarefa={self.tarefa.id!r} processo={self.processo.id!r} "
+                f"historico={len(self.historico)} documentos={len(self.documentos)}>")
+
+async def consultar_tarefa_completa (id_tarefa: str) -> TarefaCompleta:
+    """Consultar a tarefa `id_tarefa` e, de forma concorrente, o processo, detalhes, histórico e documentos do processo
+    - 2 etapas de latência ao invés das 5 consultas sequenciais
+    - Variáveis utilizadas `[holmes] -> host, token`"""
+    tarefa = await consultar_tarefa(id_tarefa)
+    processo, detalhes, historico, documentos = await asyncio.gather(
+        consultar_processo(tarefa.process_id),
+        detalhes_processo(tarefa.process_id),
+        historico_processo(tarefa.process_id),
+        documentos_processo(tarefa.process_id),
+    )
+    return TarefaCompleta(tarefa, processo, detalhes, historico, documentos)
+
+__all__ = [
+    "client_async",
+    "fechar_client",
+    "TarefaCompleta",
+    "consultar_tarefa",
+    "consultar_tarefa_completa",
+    "consultar_processo",
+    "detalhes_processo",
+    "historico_processo",
+    "documentos_processo",
+    "consultar_documento",
+    "consultar_documentos",
+    "documento_tarefa",
+    "remover_documento",
+    "classificacao_documento",
+    "upload_documento",
+    "itens_tabela",
+    "anexar_documento",
+    "assumir_tarefa",
+    "tomar_acao",
+]
@@ -0,0 +1,189 @@
+# std
+from __future__ import annotations
+import copy, time, typing, threading
+from collections import OrderedDict
+# interno
+import dclick
+# externo
+import bot
+
+type TipoModelo = typing.Literal["tarefa", "processo", "classificacao"]
+"""Modelos armazenados no `CacheModelos`
+- `tarefa` pelo `Tarefa.Consultar()`
+- `processo` pelo `Processo.Consultar()` e `Tarefa.Processo()`
+- `classificacao` pelo `Documento.Classificacao()`"""
+
+class _Contadores:
+    """Contadores de uso do cache por tipo de modelo"""
+
+    def __init__ (self) -> None:
+        self.acertos = self.falhas = self.invalidacoes = 0
+
+class CacheModelos:
+    """Cache em memória, com validade (TTL) e remoção do menos utilizado recentemente (LRU), dos modelos consultados no Holmes
+    - Chave pelo tipo do modelo e o `id`. Veja `TipoModelo`
+    - Desabilitado por padrão. Habilitado pela variável `cache_modelos_ttl` da seção `[holmes]` ou pelo atributo `ttl`
+    - Operações de escrita removem as entradas afetadas:
+        - `Tarefa.Assumir()`, `Tarefa.AnexarDocumento()` removem a tarefa
+        - `Tarefa.TomarAcao()` remove a tarefa e o processo
+        - `Documento.Remover()` e `Documento.Upload()` removem a classificação do documento
+    - Modelos armazenados e obtidos como cópia, então alterações no modelo retornado, como pelo `Tarefa.Assumir()`, não afetam o cache
+    - `acertos, falhas, invalidacoes` contadores de uso, também por tipo no `as_dict()`
+    - Seguro entre threads
+
+    ### Exemplo
+    ```
+    from dclick.holmes import Tarefa, cache_modelos
+
+    cache_modelos.ttl = 300
+    tarefa = Tarefa.Consultar(id_tarefa)
+    tarefa.Processo()
+    Tarefa.Consultar(id_tarefa).Processo() # ambos do cache
+    cache_modelos.estatisticas()
+    ```"""
+
+    ttl: float | None
+    """Segundos em que um modelo armazenado é utilizado sem consultar o Holmes
+    - `0` para desabilitar
+    - `None` para utilizar a variável `[holmes] -> [cache_modelos_ttl: 0]`"""
+    maximo: int | None
+    """Quantidade máxima de modelos armazenados
+    - `None` para utilizar a variável `[holmes] -> [cache_modelos_itens: 1024]`"""
+
+    def __init__ (self, ttl: float | None = None, maximo: int | None = None) -> None:
+        self.ttl = ttl
+        self.maximo = maximo
+        self._entradas = OrderedDict[tuple[str, str], tuple[float, typing.Any]]()
+        self._contadores = dict[str, _Contadores]()
+        self._lock = threading.Lock()
+
+    def __repr__ (self) -> str:
+        return (f"<CacheModelos itens={len(self)} acertos={self.acertos} falhas={self.falhas} "
+                f"invalidacoes={self.invalidacoes} taxa_acerto={self.taxa_acerto:.1%}>")
+
+    def __len__ (self) -> int:
+        return len(self._entradas)
+
+    @property
+    def validade (self) -> float:
+        """Segundos de validade conforme o `ttl` ou a variável `cache_modelos_ttl`"""
+        if self.ttl is not None: return self.ttl
+        return bot.config.holmes.obter_ou("cache_modelos_ttl", 0.0)
+
+    @property
+    def habilitado (self) -> bool:
+        return self.validade > 0
+
+    @property
+    def acertos (self) -> int:
+        return sum(contadores.acertos for contadores in self._contadores.values())
+
+    @property
+    def falhas (self) -> int:
+        return sum(contadores.falhas for contadores in self._contadores.values())
+
+    @property
+    def invalidacoes (self) -> int:
+        return sum(contadores.invalidacoes for contadores in self._contadores.values())
+
+    @property
+    def taxa_acerto (self) -> float:
+        """Proporção das consultas atendidas pelo cache"""
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+    def obter (self, tipo: TipoModelo, id: str) -> typing.Any | None:
+        """Obter uma cópia do modelo `tipo` do `id` caso armazenado e dentro da validade
+        - `None` caso não encontrado, expirado ou cache desabilitado
+        - Contabilizado o `acertos` ou `falhas`"""
+        validade = self.validade
+        if validade <= 0: return None
+
+        chave = (tipo, id)
+        with self._lock:
+            contadores = self._contadores.setdefault(tipo, _Contadores())
+            entrada = self._entradas.get(chave)
+            if entrada is None or time.monotonic() - entrada[0] >= validade:
+                if entrada is not None: del self._entradas[chave]
+                contadores.falhas += 1
+                return None
+            self._entradas.move_to_end(chave)
+            contadores.acertos += 1
+        # Cópia fora do `lock`. O modelo armazenado nunca é alterado
+        return copy.deepcopy(entrada[1])
+
+    def armazenar[T] (self, tipo: TipoModelo, id: str, modelo: T) -> T:
+        """Armazenar uma cópia do `modelo` do `tipo` e `id`, caso o cache esteja habilitado, e retorná-lo"""
+        if not self.habilitado: return modelo
+        armazenado = copy.deepcopy(modelo)
+
+        maximo = self.maximo if self.maximo is not None else bot.config.holmes.obter_ou("cache_modelos_itens", 1024)
+        chave = (tipo, id)
+        with self._lock:
+            self._entradas[chave] = (time.monotonic(), armazenado)
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > maximo:
+                self._entradas.popitem(last=False)
+        return modelo
+
+    def consultar[T] (self, tipo: TipoModelo, id: str, consulta: typing.Callable[[], T]) -> T:
+        """Obter o modelo `tipo` do `id` do cache ou realizar a `consulta` e armazená-la"""
+        modelo = self.obter(tipo, id)
+        if modelo is not None: return modelo
+        return self.armazenar(tipo, id, consulta())
+
+    def invalidar (self, tipo: TipoModelo, *ids: str) -> None:
+        """Remover os modelos `tipo` dos `ids`"""
+        with self._lock:
+            contadores = self._contadores.setdefault(tipo, _Contadores())
+            for id in ids:
+                if self._entradas.pop((tipo, id), None) is not None:
+                    contadores.invalidacoes += 1
+
+    def limpar (self) -> None:
+        """Remover todos os modelos armazenados. Contadores são mantidos"""
+        with self._lock: self._entradas.clear()
+
+    def as_dict (self) -> dict[str, typing.Any]:
+        """Estatísticas do cache em formato serializável para `json`"""
+        with self._lock:
+            tipos = {
+                tipo: {
+                    "acertos": contadores.acertos,
+                    "falhas": contadores.falhas,
+                    "invalidacoes": contadores.invalidacoes,
+                    "taxa_acerto": round(contadores.acertos / (contadores.acertos + contadores.falhas), 4)
+                                   if contadores.acertos + contadores.falhas else 0.0,
+                }
+                for tipo, contadores in self._contadores.items()
+            }
+        return {
+            "itens": len(self),
+            "ttl": self.validade,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "invalidacoes": self.invalidacoes,
+            "taxa_acerto": round(self.taxa_acerto, 4),
+            "tipos": tipos,
+        }
+
+    def estatisticas (self) -> dict[str, typing.Any]:
+        """Gerar o log da taxa de acerto geral e por tipo de modelo
+        - Retornado o `as_dict()`"""
+        dados = self.as_dict()
+        partes = [f"Estatísticas cache modelos Holmes | Itens({dados['itens']}) | Taxa acerto({dados['taxa_acerto']:.1%})"]
+        partes.extend(
+            f"{tipo.capitalize()}(acertos {item['acertos']}, falhas {item['falhas']}, invalidacoes {item['invalidacoes']})"
+            for tipo, item in dados["tipos"].items()
+        )
+        dclick.logger.informar(" | ".join(partes))
+        return dados
+
+cache_modelos = CacheModelos()
+"""Cache dos modelos consultados no Holmes compartilhado pelo `dclick.holmes`"""
+
+__all__ = [
+    "TipoModelo",
+    "CacheModelos",
+    "cache_modelos",
+]
@@ -0,0 +1,415 @@
+"""Rotas do `Holmes API` compartilhadas entre o `dclick.holmes` e o `dclick.holmes.aio`
+- Cada função monta a `Rota` de uma operação: o request e o tratamento da sua resposta, incluindo o `cache_modelos`
+- `dclick.holmes` envia pelo `Rota.enviar()` e o `dclick.holmes.aio` pelo `Rota.enviar_async()`"""
+
+# std
+from __future__ import annotations
+import os, json, math, base64, typing, asyncio, tempfile, functools, mimetypes, contextlib
+from typing import Any, Literal, Mapping, Callable, Iterator, BinaryIO, AsyncIterator
+# interno
+import dclick
+from dclick.holmes import modelos
+from dclick.holmes.cache import TipoModelo, cache_modelos
+# externo
+import bot
+from bot.estruturas import Caminho
+from bot.formatos import Unmarshaller
+
+if typing.TYPE_CHECKING:
+    from dclick.holmes.setup import Tarefa
+
+class Rota[T]:
+    """Request de uma operação do Holmes e o tratamento da sua resposta
+    - `tratar_response` valida a resposta e cria o resultado
+    - `prefixo` adicionado pelo `bot.erro.adicionar_prefixo` aos erros do envio e do tratamento
+    - `cache` modelo obtido do `cache_modelos` antes do envio e armazenado após o tratamento
+    - `invalidar` modelos removidos do `cache_modelos` após o tratamento
+    - `recursos` fechados após o envio, como os arquivos abertos para o `multipart`. Utilizar a rota uma única vez"""
+
+    metodo: dclick.http.METODOS_HTTP
+    url: str
+    opcoes: dict[str, Any]
+    """Argumentos do `ClienteHttp.request()`. Ex: `query, json, headers, conteudo, arquivos`"""
+    tratar_response: Callable[[dclick.http.ResponseHttp], T]
+    prefixo: str | None
+    cache: tuple[TipoModelo, str] | None
+    invalidar: list[tuple[TipoModelo, str]]
+    recursos: contextlib.ExitStack
+
+    def __init__ (self, metodo: dclick.http.METODOS_HTTP,
+                        url: str,
+                        tratar_response: Callable[[dclick.http.ResponseHttp], T],
+                        *,
+                        prefixo: str | None = None,
+                        cache: tuple[TipoModelo, str] | None = None,
+                        invalidar: list[tuple[TipoModelo, str]] | None = None,
+                        **opcoes: Any) -> None:
+        self.metodo = metodo
+        self.url = url
+        self.opcoes = opcoes
+        self.tratar_response = tratar_response
+        self.prefixo = prefixo
+        self.cache = cache
+        self.invalidar = invalidar or []
+        self.recursos = contextlib.ExitStack()
+
+    def __repr__ (self) -> str:
+        return f"<holmes.Rota {self.metodo} {self.url!r}>"
+
+    def tratar (self, response: dclick.http.ResponseHttp) -> T:
+        """Tratar a `response` e atualizar o `cache_modelos`
+        - Erro com o `prefixo` caso a resposta não seja a esperada"""
+        return self._prefixar(lambda: self._tratar(response))
+
+    def tratar_lote (self, resultado: dclick.http.ResultadoLote) -> T:
+        """Tratar o `resultado` da rota enviada pelo `ClienteHttp.executar_lote()`
+        - Erro do envio ou da resposta com o `prefixo`, assim como no `enviar()`"""
+        return self._prefixar(lambda: self._tratar(resultado.esperar_response()))
+
+    def _tratar (self, response: dclick.http.ResponseHttp) -> T:
+        resultado = self.tratar_response(response)
+        for tipo, id in self.invalidar: cache_modelos.invalidar(tipo, id)
+        if self.cache is not None: cache_modelos.armazenar(*self.cache, resultado)
+        return resultado
+
+    def enviar (self, client: dclick.http.ClienteHttp) -> T:
+        """Enviar a rota pelo `client` e tratar a resposta"""
+        if self.cache is not None and (modelo := cache_modelos.obter(*self.cache)) is not None:
+            return modelo
+        with self.recursos:
+            response = self._prefixar(lambda: client.request(self.metodo, self.url, **self.opcoes))
+            return self.tratar(response)
+
+    async def enviar_async (self, client: dclick.http.ClienteHttpAsync) -> T:
+        """Enviar a rota pelo `client` assíncrono e tratar a resposta
+        - `conteudo` em partes síncronas lido em uma thread, sem bloquear o event loop"""
+        if self.cache is not None and (modelo := cache_modelos.obter(*self.cache)) is not None:
+            return modelo
+        opcoes = dict(self.opcoes)
+        if isinstance(opcoes.get("conteudo"), Iterator):
+            opcoes["conteudo"] = _iterar_async(opcoes["conteudo"])
+
+        with self.recursos:
+            try: response = await client.request(self.metodo, self.url, **opcoes)
+            except Exception as erro: return self._prefixar(functools.partial(_relancar, erro))
+            return self.tratar(response)
+
+    def _prefixar[R] (self, funcao: Callable[[], R]) -> R:
+        if self.prefixo is None: return funcao()
+        return bot.erro.adicionar_prefixo(self.prefixo)(funcao)()
+
+def _relancar (erro: Exception) -> typing.NoReturn:
+    raise erro
+
+async def _iterar_async (iterador: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Iterar sobre o `iterador` síncrono lendo cada parte pelo `asyncio.to_thread()`, sem bloquear o event loop"""
+    fim = object()
+    while (parte := await asyncio.to_thread(next, iterador, fim)) is not fim:
+        yield typing.cast(bytes, parte)
+
+def _esperar_status_code (status_code: int, mensagem: str) -> Callable[[dclick.http.ResponseHttp], None]:
+    """Tratamento das rotas sem resultado, apenas validando o `status_code`"""
+    def tratar_response (response: dclick.http.ResponseHttp) -> None:
+        response.esperar_status_code(status_code, mensagem)
+    return tratar_response
+
+def json_base64_stream (prefixo: str,
+                        conteudo: Caminho | BinaryIO,
+                        sufixo: str,
+                        tamanho_chunk: int = 3 * 16 * 1024) -> tuple[Iterator[bytes], int | None]:
+    """Criar o corpo de um json com o `conteudo` transformado para `base64` em partes entre o `prefixo` e `sufixo`
+    - `tamanho_chunk` múltiplo de 3 para não haver padding entre as partes
+    - Retornado o `(iterador do corpo, tamanho total em bytes)`
+    - Tamanho `None` caso não seja possível obter o tamanho do `conteudo`"""
+    inicio, fim = prefixo.encode(), sufixo.encode()
+
+    try:
+        if isinstance(conteudo, Caminho): restante = os.path.getsize(conteudo.path)
+        else: restante = os.fstat(conteudo.fileno()).st_size - conteudo.tell()
+        tamanho = len(inicio) + 4 * math.ceil(restante / 3) + len(fim)
+    except Exception: tamanho = None
+
+    def iterador () -> Iterator[bytes]:
+        with contextlib.ExitStack() as stack:
+            reader = stack.enter_context(open(conteudo.path, "rb")) if isinstance(conteudo, Caminho) else conteudo
+            yield inicio
+            pendente = b""
+            while chunk := reader.read(tamanho_chunk):
+                pendente += chunk
+                corte = len(pendente) - len(pendente) % 3
+                if corte:
+                    yield base64.b64encode(pendente[:corte])
+                    pendente = pendente[corte:]
+            if pendente: yield base64.b64encode(pendente)
+            yield fim
+
+    return iterador(), tamanho
+
+def consultar_tarefa[T: Unmarshaller] (id_tarefa: str, modelo: type[T]) -> Rota[T]:
+    dclick.logger.debug("Consultando uma tarefa no Holmes", id_tarefa=id_tarefa)
+    return Rota(
+        "GET", f"/v1/tasks/{id_tarefa}",
+        lambda response: response.esperar_sucesso().unmarshal(modelo),
+        prefixo = f"Falha Tarefa.Consultar(id_tarefa={id_tarefa!r}) no Holmes",
+        cache = ("tarefa", id_tarefa),
+    )
+
+def consultar_processo[T: Unmarshaller] (id_processo: str, modelo: type[T]) -> Rota[T]:
+    dclick.logger.debug(f"Consultando processo({id_processo}) no Holmes")
+    return Rota(
+        "GET", f"/v1/processes/{id_processo}",
+        lambda response: response.esperar_status_code(200).unmarshal(modelo),
+        prefixo = f"Falha Processo.Consultar(id_processo={id_processo!r}) no Holmes",
+        cache = ("processo", id_processo),
+    )
+
+def detalhes_processo (id_processo: str) -> Rota[list[modelos.DetalhesProcesso]]:
+    dclick.logger.debug(f"Consultando detalhes do processo({id_processo}) no Holmes")
+    return Rota(
+        "GET", f"/v1/processes/{id_processo}/details",
+        lambda response: modelos.DetalhesProcesso.UnmarshalMany(
+            response
+            .esperar_status_code(200)
+            .json(esperar=dict[str, dict[str, Any]])
+                .get("instance", {})
+                .get("property_values", [])
+        ),
+    )
+
+def historico_processo (id_processo: str) -> Rota[list[modelos.HistoryItem]]:
+    dclick.logger.debug(f"Consultando histórico do processo({id_processo}) no Holmes")
+    return Rota(
+        "GET", f"/v1/processes/{id_processo}/history",
+        lambda response: modelos.HistoryItem.UnmarshalMany(
+            response
+            .esperar_status_code(200)
+            .json(esperar=dict[str, list[dict[str, Any]]])
+            .get("histories", [])
+        ),
+    )
+
+def documentos_processo (id_processo: str) -> Rota[list[modelos.DocumentItem]]:
+    dclick.logger.debug(f"Consultando documentos do processo({id_processo}) no Holmes")
+    return Rota(
+        "GET", f"/v1/processes/{id_processo}/documents",
+        lambda response: modelos.DocumentItem.UnmarshalMany(
+            response
+            .esperar_status_code(200)
+            .json(esperar=dict[str, list[dict[str, Any]]])
+            .get("documents", [])
+        ),
+    )
+
+def url_documento (document_id: str) -> tuple[str, str]:
+    """Obter o `(url, mensagem de erro)` do download do documento `document_id`"""
+    dclick.logger.debug(f"Consultando documento({document_id}) no Holmes")
+    return f"/v1/documents/{document_id}/download", f"Falha ao consultar documento({document_id}) no Holmes"
+
+def url_documento_tarefa (tarefa: Tarefa, id_ou_conditional: str) -> tuple[str, str]:
+    """Obter o `(url, mensagem de erro)` do download do documento pelo `id` ou pelo `conditional` da `tarefa`"""
+    dclick.logger.debug(f"Consultando documento({id_ou_conditional}) da tarefa({tarefa.id}) no Holmes")
+    documento = tarefa.obter_documento(
+        lambda d: id_ou_conditional == d.id
+                  or id_ou_conditional.lower() in d.conditional.lower())
+    assert documento is not None, f"Documento {id_ou_conditional!r} não encontrado na tarefa({tarefa.id})"
+    return (f"/v1/tasks/{tarefa.id}/documents/{documento.id}",
+            f"Falha ao consultar documento({id_ou_conditional}) da tarefa({tarefa.id}) no Holmes")
+
+def baixar[T] (url: str, mensagem: str, modelo: Callable[[bytes, Mapping[str, str]], T]) -> Rota[T]:
+    """Download em memória do `url` criando o `modelo` com o `(conteúdo, headers)`"""
+    return Rota(
+        "GET", url,
+        lambda response: modelo(response.esperar_status_code(200, mensagem).conteudo, response.headers_dict),
+    )
+
+class DownloadDisco[T]:
+    """Download em `stream` do `url` para um arquivo temporário criando o `modelo` com o `(caminho, headers)`
+    - Memória limitada ao `dclick.http.TAMANHO_CHUNK` independente do tamanho do documento
+    - Arquivo temporário removido caso ocorra erro na escrita
+    - Obtido pelo `baixar_em_disco()`"""
+
+    url: str
+    mensagem: str | None
+    modelo: Callable[[Caminho, Mapping[str, str]], T]
+
+    def __init__ (self, url: str, mensagem: str | None, modelo: Callable[[Caminho, Mapping[str, str]], T]) -> None:
+        self.url = url
+        self.mensagem = mensagem
+        self.modelo = modelo
+
+    def __repr__ (self) -> str:
+        return f"<holmes.DownloadDisco {self.url!r}>"
+
+    def enviar (self, client: dclick.http.ClienteHttp) -> T:
+        """Realizar o download pelo `client`"""
+        with client.stream("GET", self.url) as response:
+            with self._temporario(response) as temporario:
+                response.salvar_em(temporario)
+            return self.modelo(Caminho(temporario), response.headers_dict)
+
+    async def enviar_async (self, client: dclick.http.ClienteHttpAsync) -> T:
+        """Realizar o download pelo `client` assíncrono"""
+        async with client.stream("GET", self.url) as response:
+            with self._temporario(response) as temporario:
+                await response.asalvar_em(temporario)
+            return self.modelo(Caminho(temporario), response.headers_dict)
+
+    @contextlib.contextmanager
+    def _temporario (self, response: dclick.http.ResponseHttp) -> Iterator[str]:
+        response.esperar_status_code(200, self.mensagem)
+        descritor, temporario = tempfile.mkstemp(prefix="holmes_")
+        os.close(descritor)
+        try: yield temporario
+        except BaseException:
+            os.remove(temporario)
+            raise
+
+def baixar_em_disco[T] (url: str, mensagem: str | None, modelo: Callable[[Caminho, Mapping[str, str]], T]) -> DownloadDisco[T]:
+    """Download em `stream` do `url` para um arquivo temporário criando o `modelo` com o `(caminho, headers)`"""
+    return DownloadDisco(url, mensagem, modelo)
+
+def remover_documento (document_id: str, descricao: str | None = None) -> Rota[None]:
+    dclick.logger.debug(f"Removendo documento({document_id}) no Holmes")
+    return Rota(
+        "DELETE", f"/v1/documents/{document_id}",
+        _esperar_status_code(204, f"Falha ao remover documento({document_id}) no Holmes"),
+        invalidar = [("classificacao", document_id)],
+        query = { "description": descricao } if descricao else None,
+    )
+
+def classificacao_documento (document_id: str) -> Rota[modelos.ClassificacaoDocumento]:
+    dclick.logger.debug(f"Consultando classificação do documento({document_id}) no Holmes")
+    return Rota(
+        "GET", f"/v1/documents/{document_id}/classify",
+        lambda response: response.esperar_status_code(200).unmarshal(modelos.ClassificacaoDocumento),
+        cache = ("classificacao", document_id),
+    )
+
+def upload_documento (nome_extensao: str,
+                      conteudo: str | bytes | Caminho | BinaryIO,
+                      classificacao: modelos.ClassificacaoDocumentoDict | None = None) -> Rota[modelos.UploadDocumento]:
+    dclick.logger.debug(f"Realizando upload de documento({nome_extensao}) no Holmes")
+
+    def tratar_response (response: dclick.http.ResponseHttp) -> modelos.UploadDocumento:
+        upload = (
+            response
+            .esperar_status_code(200, "Falha ao realizar upload de documento no Holmes")
+            .unmarshal(modelos.UploadDocumento)
+        )
+        cache_modelos.invalidar("classificacao", upload.id)
+        return upload
+
+    if not isinstance(conteudo, (str, bytes)):
+        corpo, tamanho = json_base64_stream(
+            f'{{"classification": {json.dumps(classificacao or {})}, "document": {{"filename": {json.dumps(nome_extensao)}, "base64_file": "',
+            conteudo,
+            '"}}',
+        )
+        headers = { "Content-Type": "application/json" }
+        if tamanho is not None: headers["Content-Length"] = str(tamanho)
+        return Rota("POST", "/v1/documents", tratar_response, headers=headers, conteudo=corpo)
+
+    return Rota(
+        "POST", "/v1/documents", tratar_response,
+        json = {
+            "classification": classificacao or {},
+            "document": {
+                "filename": nome_extensao,
+                "base64_file": conteudo if isinstance(conteudo, str) else base64.b64encode(conteudo).decode()
+            }
+        }
+    )
+
+def itens_tabela (tarefa: Tarefa, id_ou_name: str, page: int = 1, per_page: int = 100) -> Rota[list[modelos.TableItem]]:
+    dclick.logger.debug(f"Consultando itens da tabela({id_ou_name}) da tarefa({tarefa.id}) no Holmes")
+    tabela = tarefa.obter_tabela(
+        lambda t: id_ou_name == t.id
+                  or id_ou_name.lower() in t.name.lower())
+    assert tabela is not None, f"Tabela {id_ou_name!r} não encontrada na tarefa({tarefa.id})"
+
+    return Rota(
+        "GET", f"/v1/tasks/{tarefa.id}/tables/{tabela.id}/table_items",
+        lambda response: modelos.TableItem.UnmarshalMany(
+            response
+            .esperar_status_code(200, f"Falha ao consultar itens da tabela({id_ou_name}) da tarefa({tarefa.id}) no Holmes")
+            .json(esperar=dict[str, Any])
+            .get("items", [])
+        ),
+        query = { "page": page, "per_page": per_page },
+    )
+
+def anexar_documento (tarefa: Tarefa,
+                      id_documento: str,
+                      documento: tuple[str, bytes | Caminho | BinaryIO],
+                      mime_type: str | None = None) -> Rota[None]:
+    """Arquivo do `Caminho` aberto nos `recursos` da rota"""
+    dclick.logger.debug(f"Anexando documento id({id_documento}) nome({documento[0]}) na tarefa({tarefa.id}) no Holmes")
+    nome_extensao, conteudo = documento
+    mime = (mime_type or mimetypes.guess_type(nome_extensao)[0]) or "application/octet-stream"
+    rota = Rota(
+        "POST", f"/v1/tasks/{tarefa.id}/documents/{id_documento}",
+        _esperar_status_code(204, f"Falha ao anexar documento na tarefa({tarefa.id}) do Holmes"),
+        invalidar = [("tarefa", tarefa.id)],
+    )
+    if isinstance(conteudo, Caminho):
+        conteudo = rota.recursos.enter_context(open(conteudo.path, "rb"))
+    rota.opcoes["arquivos"] = { "file": (nome_extensao, conteudo, mime) }
+    return rota
+
+def assumir_tarefa[T: Tarefa] (tarefa: T, id_usuario: str | None = None) -> Rota[T]:
+    """Atualizado o `assignee_id` da `tarefa` após o sucesso"""
+    dclick.logger.debug(f"Assumindo tarefa({tarefa.id}) no Holmes")
+    id_usuario = id_usuario or bot.config.holmes.id_usuario
+
+    def tratar_response (response: dclick.http.ResponseHttp) -> T:
+        response.esperar_sucesso(f"Falha ao assumir tarefa({tarefa.id}) no Holmes")
+        tarefa.assignee_id = id_usuario
+        return tarefa
+
+    return Rota(
+        "PUT", f"/v1/tasks/{tarefa.id}/assign", tratar_response,
+        invalidar = [("tarefa", tarefa.id)],
+        json = { "user_id": id_usuario },
+    )
+
+def tomar_acao (tarefa: Tarefa, acao: str,
+                propriedades: list[dict[Literal["id", "value", "text"], str]] | None = None) -> Rota[None]:
+    """Necessário consultar a tarefa após o envio para obtê-la atualizada"""
+    dclick.logger.debug(f"Tomando ação({acao}) na tarefa({tarefa.id}) no Holmes")
+    action = tarefa.obter_acao(lambda a: acao == a.id or acao.lower() in a.name.lower())
+    assert action is not None, f"Ação {acao!r} não encontrada na tarefa({tarefa.id})"
+
+    return Rota(
+        "POST", f"/v1/tasks/{tarefa.id}/action",
+        _esperar_status_code(200, f"Falha ao tomar ação na tarefa({tarefa.id}) no Holmes"),
+        invalidar = [("tarefa", tarefa.id), ("processo", tarefa.process_id)],
+        json = {
+            "task": {
+                "action_id": action.id,
+                "confirm_action": True,
+                "property_values": propriedades or []
+            }
+        },
+    )
+
+__all__ = [
+    "Rota",
+    "json_base64_stream",
+    "consultar_tarefa",
+    "consultar_processo",
+    "detalhes_processo",
+    "historico_processo",
+    "documentos_processo",
+    "url_documento",
+    "url_documento_tarefa",
+    "baixar",
+    "DownloadDisco",
+    "baixar_em_disco",
+    "remover_documento",
+    "classificacao_documento",
+    "upload_documento",
+    "itens_tabela",
+    "anexar_documento",
+    "assumir_tarefa",
+    "tomar_acao",
+]
@@ -2,29 +2,215 @@
 from datetime import datetime
 from email.message import Message
 from email.parser import HeaderParser
-import base64, certifi, mimetypes, functools
-from typing import Any, Self, Literal, Callable
+import os, re, time, codecs, certifi, weakref, tempfile, threading, contextlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Self, Literal, Mapping, Callable, Iterable, Iterator, BinaryIO, cast
 # interno
 import dclick
-from dclick.holmes import modelos
+from dclick.holmes import modelos, rotas
+from dclick.holmes.cache import TipoModelo, cache_modelos
 # externo
 import bot
 from bot.estruturas import Caminho
 from bot.tipagem import SupportsBool
 from bot.formatos import Unmarshaller
 
-@functools.cache
+@dclick.http.registro_clientes.cliente("holmes")
 def client_singleton () -> dclick.http.ClienteHttp:
     """Criar o http `Client` configurado com o `host`, `token` e timeout
-    - O Client ficará aberto após a primeira chamada na função devido ao `@cache`"""
+    - Client gerenciado pelo `registro_clientes`: criado na primeira chamada, fechado ao final da execução e recriado após `fork` ou alteração da seção
+    - Opções de conexão, timeouts e retentativas conforme as variáveis da seção `[holmes]`"""
     host, token = bot.config.holmes.obter("host", "token")
-    return dclick.http.ClienteHttp(
+    return dclick.http.ClienteHttp.FromConfig(
+        "holmes",
+        timeout  = 120,
         base_url = host,
         headers  = { "api_token": token },
-        timeout  = 120,
         verify   = certifi.where(),
+        compartilhar_transporte = True,
     )
 
+class ResultadoConsultas[T]:
+    """Resultado das consultas em lote do `Tarefa.ConsultarMuitos()` e `Processo.ConsultarMuitos()`
+    - `ids` sem repetições, na ordem em que foram informados
+    - `sucessos` e `erros` por id, também na ordem dos `ids`"""
+
+    ids: list[str]
+    sucessos: dict[str, T]
+    erros: dict[str, Exception]
+    segundos: float
+    """Tempo total das consultas em segundos"""
+    segundos_serial: float
+    """Soma das latências de cada consulta em segundos, estimativa do tempo caso realizadas uma por vez
+    - Latências medidas sob concorrência, então a estimativa tende a ser maior que o tempo serial real"""
+
+    def __init__ (self, ids: list[str]) -> None:
+        self.ids = ids
+        self.sucessos = {}
+        self.erros = {}
+        self.segundos = 0.0
+        self.segundos_serial = 0.0
+
+    def __repr__ (self) -> str:
+        return f"<holmes.ResultadoConsultas sucessos={len(self.sucessos)} erros={len(self.erros)} segundos={self.segundos:.2f}>"
+
+    def __len__ (self) -> int:
+        return len(self.ids)
+
+    def __iter__ (self) -> Iterator[T]:
+        """Iterar sobre os `sucessos` na ordem dos `ids`"""
+        return iter(self.sucessos.values())
+
+    def __getitem__ (self, id: str) -> T:
+        """Obter o resultado do `id` ou lançar o erro capturado na consulta"""
+        if id in self.erros: raise self.erros[id]
+        return self.sucessos[id]
+
+    def esperar_sucesso (self) -> list[T]:
+        """Obter os resultados na ordem dos `ids` ou lançar o erro do primeiro id que falhou"""
+        for id in self.erros: raise self.erros[id]
+        return list(self.sucessos.values())
+
+def _consultar_muitos[T: Unmarshaller] (cls: type[T],
+                                          tipo: TipoModelo,
+                                          ids: Iterable[str],
+                                          rota: Callable[[str, type[T]], rotas.Rota[T]],
+                                          concorrencia: int) -> ResultadoConsultas[T]:
+    """Consultar os `ids` em lote pelo `ClienteHttp.executar_lote()` e realizar o `unmarshal` para o `cls`
+    - `rota` da consulta de cada id, a mesma do `Consultar()`, com os erros por id prefixados da mesma forma
+    - Ids presentes no `cache_modelos` não são consultados e os consultados são armazenados
+    - Log do tempo total comparado com a estimativa serial"""
+    unicos = list(dict.fromkeys(ids))
+    resultado = ResultadoConsultas[T](unicos)
+    inicio = time.perf_counter()
+
+    armazenados = dict[str, T]()
+    for id in unicos:
+        modelo = cache_modelos.obter(tipo, id)
+        if modelo is not None: armazenados[id] = modelo
+    pendentes = [id for id in unicos if id not in armazenados]
+    dclick.logger.debug(f"Consultando {len(pendentes)} {cls.__name__}(s) no Holmes com concorrência {concorrencia}")
+
+    consultados = dict[str, T]()
+    rotas_pendentes = [rota(id, cls) for id in pendentes]
+    lote = client_singleton().executar_lote(((item.metodo, item.url) for item in rotas_pendentes), concorrencia)
+    for item in lote:
+        id = pendentes[item.indice]
+        try: consultados[id] = rotas_pendentes[item.indice].tratar_lote(item)
+        except Exception as erro: resultado.erros[id] = erro
+        if item.response is not None:
+            resultado.segundos_serial += sum(tentativa.segundos for tentativa in item.response.tentativas)
+
+    for id in unicos:
+        if id in armazenados: resultado.sucessos[id] = armazenados[id]
+        elif id in consultados: resultado.sucessos[id] = consultados[id]
+    resultado.segundos = time.perf_counter() - inicio
+
+    ganho = resultado.segundos_serial / resultado.segundos if resultado.segundos else 0.0
+    dclick.logger.informar(
+        f"Consultado {len(unicos)} {cls.__name__}(s) no Holmes em {resultado.segundos:.2f}s | "
+        f"estimativa serial {resultado.segundos_serial:.2f}s ({ganho:.1f}x) | cache {len(armazenados)} | erros {len(resultado.erros)}"
+    )
+    return resultado
+
+class DocumentoBaixado:
+    """Item do manifesto retornado pelo `Processo.BaixarDocumentos()`"""
+
+    item: modelos.DocumentItem
+    """Item do documento no processo"""
+    caminho: Caminho | None
+    """Arquivo com o conteúdo do documento
+    - Arquivo do documento original caso `duplicado_de`
+    - `None` caso tenha ocorrido erro"""
+    tamanho: int
+    sha256: str
+    duplicado_de: str | None
+    """`document_id` do documento com conteúdo idêntico já salvo
+    - `None` caso o conteúdo seja inédito"""
+    erro: Exception | None
+    """Erro capturado ao baixar o documento ou lançado pelo `filtro`"""
+
+    def __init__ (self, item: modelos.DocumentItem,
+                        caminho: Caminho | None = None,
+                        tamanho: int = 0,
+                        sha256: str = "",
+                        duplicado_de: str | None = None,
+                        erro: Exception | None = None) -> None:
+        self.item = item
+        self.caminho = caminho
+        self.tamanho = tamanho
+        self.sha256 = sha256
+        self.duplicado_de = duplicado_de
+        self.erro = erro
+
+    def __repr__ (self) -> str:
+        resultado = type(self.erro).__name__ if self.erro is not None else self.caminho
+        return f"<holmes.DocumentoBaixado document_id={self.item.document_id!r} resultado={resultado!r}>"
+
+    @property
+    def sucesso (self) -> bool:
+        return self.erro is None
+
+    def as_dict (self) -> dict[str, Any]:
+        """Item do manifesto em formato serializável para `json`"""
+        return {
+            "document_id": self.item.document_id,
+            "nome": self.item.name,
+            "arquivo": self.caminho.path if self.caminho is not None else None,
+            "tamanho": self.tamanho,
+            "sha256": self.sha256,
+            "duplicado_de": self.duplicado_de,
+            "erro": f"{type(self.erro).__name__}: {self.erro}" if self.erro is not None else None,
+        }
+
+class _DestinoDocumentos:
+    """Controle, entre as threads do `Processo.BaixarDocumentos()`, dos nomes utilizados e do conteúdo já salvo"""
+
+    def __init__ (self, diretorio: Caminho) -> None:
+        self.diretorio = diretorio
+        self.nomes = set[str](nome.lower() for nome in os.listdir(diretorio.path))
+        self.hashes = dict[str, DocumentoBaixado]()
+        self.lock = threading.Lock()
+
+    def nome_livre (self, nome: str) -> str:
+        """Reservar o `nome` ou, caso utilizado, o `nome_{n}` livre
+        - Necessário o `lock`"""
+        nome = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", os.path.basename(nome)).strip(" .") or "documento"
+        base, extensao = os.path.splitext(nome)
+        candidato, numero = nome, 1
+        while candidato.lower() in self.nomes:
+            numero += 1
+            candidato = f"{base}_{numero}{extensao}"
+        self.nomes.add(candidato.lower())
+        return candidato
+
+    def baixar (self, item: modelos.DocumentItem) -> DocumentoBaixado:
+        """Baixar o documento do `item` em `stream` para um arquivo temporário no diretório e movê-lo para o nome final
+        - Conteúdo idêntico a um documento já salvo tem o arquivo temporário removido"""
+        descritor, temporario = tempfile.mkstemp(prefix=".holmes_", suffix=".parcial", dir=self.diretorio.path)
+        os.close(descritor)
+        try:
+            url = f"/v1/documents/{item.document_id}/download"
+            with client_singleton().stream("GET", url) as response:
+                response.esperar_status_code(200, f"Falha ao consultar documento({item.document_id}) no Holmes")
+                sha256 = cast(str, response.salvar_em(temporario, algoritmo_hash="sha256"))
+            tamanho = os.path.getsize(temporario)
+
+            with self.lock:
+                original = self.hashes.get(sha256)
+                if original is None:
+                    destino = self.diretorio / self.nome_livre(item.file_name or item.document_id)
+                    os.replace(temporario, destino.path)
+                    baixado = self.hashes[sha256] = DocumentoBaixado(item, destino, tamanho, sha256)
+                    return baixado
+
+            os.remove(temporario)
+            return DocumentoBaixado(item, original.caminho, tamanho, sha256, duplicado_de=original.item.document_id)
+
+        except Exception as erro:
+            with contextlib.suppress(Exception): os.remove(temporario)
+            return DocumentoBaixado(item, erro=erro)
+
 class Processo (Unmarshaller):
     """Modelo de um processo no Holmes
     ### Utilizar `Processo.Consultar()` para realizar a consulta"""
@@ -38,17 +224,19 @@ class Processo (Unmarshaller):
     current_activities: list[modelos.Activity]
 
     @classmethod
-    @bot.erro.adicionar_prefixo(lambda args, _: f"Falha Processo.Consultar(id_processo={args[1]!r}) no Holmes")
     def Consultar (cls, id_processo: str) -> "Processo":
         """Consultar o processo `id_processo`
+        - Obtido do `cache_modelos` caso habilitado e armazenado
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Consultando processo({id_processo}) no Holmes")
-        return (
-            client_singleton()
-            .get(f"/v1/processes/{id_processo}")
-            .esperar_status_code(200)
-            .unmarshal(Processo)
-        )
+        return rotas.consultar_processo(id_processo, Processo).enviar(client_singleton())
+
+    @classmethod
+    def ConsultarMuitos (cls, ids_processos: Iterable[str], *, concorrencia: int = 8) -> "ResultadoConsultas[Processo]":
+        """Consultar os processos `ids_processos` com até `concorrencia` requests simultâneos
+        - Ids repetidos consultados uma única vez
+        - Erros capturados por id no `ResultadoConsultas.erros`, com o mesmo prefixo do `Processo.Consultar()`, sem interromper as demais consultas
+        - Variáveis utilizadas `[holmes] -> host, token`"""
+        return _consultar_muitos(Processo, "processo", ids_processos, rotas.consultar_processo, concorrencia)
 
     def __repr__ (self) -> str:
         return f"<holmes.Processo id={self.id!r} status={self.status!r}>"
@@ -70,128 +258,142 @@ class Processo (Unmarshaller):
     def Detalhes (self) -> list[modelos.DetalhesProcesso]:
         """Consultar o campo `property_values` nos detalhes do processo `self.id`
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Consultando detalhes do processo({self.id}) no Holmes")
-        property_values = (
-            client_singleton()
-            .get(f"/v1/processes/{self.id}/details")
-            .esperar_status_code(200)
-            .json(esperar=dict[str, dict[str, Any]])
-                .get("instance", {})
-                .get("property_values", [])
-        )
-        return modelos.DetalhesProcesso.UnmarshalMany(property_values)
+        return rotas.detalhes_processo(self.id).enviar(client_singleton())
 
     def Historico (self) -> list[modelos.HistoryItem]:
         """Consultar o histórico do processo `self.id`
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Consultando histórico do processo({self.id}) no Holmes")
-        histories = (
-            client_singleton()
-            .get(f"/v1/processes/{self.id}/history")
-            .esperar_status_code(200)
-            .json(esperar=dict[str, list[dict[str, Any]]])
-            .get("histories", [])
-        )
-        return modelos.HistoryItem.UnmarshalMany(histories)
+        return rotas.historico_processo(self.id).enviar(client_singleton())
 
     def Documentos (self) -> list[modelos.DocumentItem]:
         """Consultar os documentos do processo `self.id`
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Consultando documentos do processo({self.id}) no Holmes")
-        documents = (
-            client_singleton()
-            .get(f"/v1/processes/{self.id}/documents")
-            .esperar_status_code(200)
-            .json(esperar=dict[str, list[dict[str, Any]]])
-            .get("documents", [])
+        return rotas.documentos_processo(self.id).enviar(client_singleton())
+
+    def BaixarDocumentos (self, diretorio: Caminho, *,
+                                concorrencia: int = 4,
+                                filtro: Callable[[modelos.DocumentItem], SupportsBool] | None = None) -> list[DocumentoBaixado]:
+        """Baixar os documentos do processo `self.id` para o `diretorio` com até `concorrencia` downloads simultâneos
+        - Cada arquivo salvo em `stream`, com memória limitada ao `dclick.http.TAMANHO_CHUNK`
+        - Ignorados os itens `removed`, sem arquivo ou não aceitos pelo `filtro`
+        - Erro lançado pelo `filtro` registrado no `DocumentoBaixado.erro` do item, sem baixá-lo, e gerado um alerta no log
+        - Nome do arquivo pelo `file_name` do item, com sufixo `_2, _3...` caso já exista no `diretorio`
+        - Conteúdo idêntico, pelo `sha256`, salvo uma única vez. Demais itens apontam para o mesmo arquivo com o `duplicado_de`
+        - Erros capturados por item no `DocumentoBaixado.erro`, sem interromper os demais downloads
+        - Retornado o manifesto na ordem dos documentos do processo
+        - Variáveis utilizadas `[holmes] -> host, token`
+
+        ### Exemplo
+        ```
+        manifesto = processo.BaixarDocumentos(
+            Caminho("./documentos"),
+            concorrencia = 8,
+            filtro = lambda item: item.file_name.lower().endswith(".pdf")
         )
-        return modelos.DocumentItem.UnmarshalMany(documents)
+        for baixado in manifesto:
+            print(baixado.as_dict())
+        ```"""
+        inicio = time.perf_counter()
+        itens = list[tuple[modelos.DocumentItem, Exception | None]]()
+        for item in self.Documentos():
+            if item.removed or not item.file: continue
+            try:
+                if filtro is not None and not filtro(item): continue
+            except Exception as erro:
+                dclick.logger.alertar(f"Falha no filtro do documento({item.document_id}) do processo({self.id}). Registrado como erro no manifesto | {type(erro).__name__}: {erro}")
+                itens.append((item, erro))
+                continue
+            itens.append((item, None))
+
+        os.makedirs(diretorio.path, exist_ok=True)
+        destino = _DestinoDocumentos(diretorio)
+        dclick.logger.debug(f"Baixando {len(itens)} documento(s) do processo({self.id}) no Holmes com concorrência {concorrencia}")
+
+        def baixar (selecionado: tuple[modelos.DocumentItem, Exception | None]) -> DocumentoBaixado:
+            item, erro = selecionado
+            return DocumentoBaixado(item, erro=erro) if erro is not None else destino.baixar(item)
+
+        with ThreadPoolExecutor(max(1, concorrencia), thread_name_prefix="baixar_documentos") as executor:
+            manifesto = list(executor.map(baixar, itens))
+
+        duplicados = sum(1 for baixado in manifesto if baixado.duplicado_de is not None)
+        erros = sum(1 for baixado in manifesto if baixado.erro is not None)
+        dclick.logger.informar(
+            f"Baixado {len(manifesto) - erros} documento(s) do processo({self.id}) no Holmes em {time.perf_counter() - inicio:.2f}s | "
+            f"duplicados {duplicados} | bytes {sum(baixado.tamanho for baixado in manifesto if baixado.duplicado_de is None)} | erros {erros}"
+        )
+        return manifesto
+
+def _remover_temporario (caminho: str) -> None:
+    """Remover o arquivo temporário de um `Documento` em disco, caso ainda exista"""
+    with contextlib.suppress(OSError): os.remove(caminho)
 
 class Documento:
     """Modelo com conteúdo de um arquivo de Documento no Holmes
     ### Utilizar `Documento.Consultar()` para realizar a consulta
     ### Utilizar `Documento.Remover()` para remover um documento
     ### Utilizar `Documento.Upload()` para criar um documento
-    ### Utilizar `Documento.Classificacao()` para consultar a classificação de um documento"""
+    ### Utilizar `Documento.Classificacao()` para consultar a classificação de um documento
+    ### Utilizar `em_disco=True` nas consultas para o conteúdo ser salvo em um arquivo temporário ao invés da memória
+    ### Utilizar `with` ou `fechar()` para remover o arquivo temporário assim que não for mais necessário"""
 
-    conteudo: bytes
-    """Conteúdo do documento em bytes"""
+    __conteudo: bytes | None
+    __arquivo: Caminho | None
+    __finalizador: weakref.finalize | None
     __message: Message
 
     @classmethod
-    def Consultar (cls, document_id: str) -> "Documento":
+    def Consultar (cls, document_id: str, *, em_disco: bool = False) -> "Documento":
         """Consultar o documento `document_id`
+        - `em_disco` para realizar o download em `stream` para um arquivo temporário
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Consultando documento({document_id}) no Holmes")
-        response = (
-            client_singleton()
-            .get(f"/v1/documents/{document_id}/download")
-            .esperar_status_code(200, f"Falha ao consultar documento({document_id}) no Holmes")
-        )
-        return Documento(response.content, response.headers_dict)
+        url, mensagem = rotas.url_documento(document_id)
+        if em_disco: return cls.Download(url, mensagem)
+        return rotas.baixar(url, mensagem, Documento).enviar(client_singleton())
+
+    @classmethod
+    def Download (cls, url: str, mensagem: str | None = None) -> "Documento":
+        """Realizar o download em `stream` do `url` para um arquivo temporário
+        - Memória limitada ao `dclick.http.TAMANHO_CHUNK` independente do tamanho do documento
+        - Arquivo temporário removido pelo `Documento.fechar()`, ao sair do `with`, quando o `Documento` for coletado ou ao final da execução
+        - Variáveis utilizadas `[holmes] -> host, token`"""
+        return rotas.baixar_em_disco(url, mensagem, Documento).enviar(client_singleton())
 
     @classmethod
     def Remover (cls, document_id: str, descricao: str | None = None) -> None:
         """Remover o documento `document_id`
         - `descricao` para informar o motivo da remoção
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Removendo documento({document_id}) no Holmes")
-        (
-            client_singleton()
-            .delete(
-                url = f"/v1/documents/{document_id}",
-                query = { "description": descricao } if descricao else None
-            )
-            .esperar_status_code(204, f"Falha ao remover documento({document_id}) no Holmes")
-        )
+        rotas.remover_documento(document_id, descricao).enviar(client_singleton())
 
     @classmethod
     def Classificacao (cls, document_id: str) -> modelos.ClassificacaoDocumento:
         """Consultar a classificação do documento `id_documento`
+        - Obtido do `cache_modelos` caso habilitado e armazenado
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Consultando classificação do documento({document_id}) no Holmes")
-        return (
-            client_singleton()
-            .get(f"/v1/documents/{document_id}/classify")
-            .esperar_status_code(200)
-            .unmarshal(modelos.ClassificacaoDocumento)
-        )
+        return rotas.classificacao_documento(document_id).enviar(client_singleton())
 
     @classmethod
     def Upload (cls, nome_extensao: str,
-                     conteudo: str | bytes,
+                     conteudo: str | bytes | Caminho | BinaryIO,
                      *,
                      classificacao: modelos.ClassificacaoDocumentoDict | None = None) -> modelos.UploadDocumento:
         """Realizar o upload do documento `nome_extensao` via `base64`
         - `conteudo=bytes` transformado para `base64`
         - `conteudo=str` esperado como `base64`
+        - `conteudo=Caminho | BinaryIO` lido e transformado para `base64` em partes durante o envio
+            - Memória constante independente do tamanho do documento
         - `classificacao` aplicar classificação no documento
             - `{ "nature_id": "60f862d9f5a395000da95cf2", "property_values": [] }`
             - `{ "nature_id": "60f862d9f5a395000da95cf2", "property_values": [{ "id": "cnpj", "value": "03095314000618" }] }`
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Realizando upload de documento({nome_extensao}) no Holmes")
-        return ( 
-            client_singleton()
-            .post(
-                url = "/v1/documents",
-                json = {
-                    "classification": classificacao or {},
-                    "document": {
-                        "filename": nome_extensao,
-                        "base64_file": (
-                            conteudo
-                            if isinstance(conteudo, str)
-                            else base64.b64encode(conteudo).decode()
-                        )
-                    }
-                }
-            )
-            .esperar_status_code(200, "Falha ao realizar upload de documento no Holmes")
-            .unmarshal(modelos.UploadDocumento)
-        )
+        return rotas.upload_documento(nome_extensao, conteudo, classificacao).enviar(client_singleton())
 
-    def __init__ (self, conteudo: bytes, headers: dict[str, str]) -> None:
-        self.conteudo = conteudo
+    def __init__ (self, conteudo: bytes | Caminho, headers: Mapping[str, str]) -> None:
+        """`conteudo` em memória como `bytes` ou o `Caminho` de um arquivo temporário que passa a pertencer ao documento"""
+        self.__conteudo, self.__arquivo = (None, conteudo) if isinstance(conteudo, Caminho) else (conteudo, None)
+        # Remoção do arquivo temporário pelo `fechar()`, quando o documento for coletado ou ao final da execução
+        self.__finalizador = weakref.finalize(self, _remover_temporario, conteudo.path) if isinstance(conteudo, Caminho) else None
         self.__message = HeaderParser().parsestr("\n".join(
             f"{header}: {valor}"
             for header, valor in headers.items()
@@ -200,13 +402,48 @@ class Documento:
     def __repr__ (self) -> str:
         return f"<holmes.Documento nome={self.__message.get_filename('blob')!r} tipo={self.tipo!r}>"
 
+    def __enter__ (self) -> Self:
+        return self
+
+    def __exit__ (self, *_: Any) -> None:
+        self.fechar()
+
+    def fechar (self) -> None:
+        """Remover o arquivo temporário do documento em disco
+        - Conteúdo não lido pelo `conteudo` deixa de estar disponível
+        - Chamado automaticamente ao sair do `with`, quando o documento for coletado ou ao final da execução"""
+        if self.__finalizador is not None: self.__finalizador()
+
+    @property
+    def conteudo (self) -> bytes:
+        """Conteúdo do documento em bytes
+        - Documento em disco tem o arquivo temporário lido no primeiro acesso e mantido em memória.
+        Utilizar o `iter_bytes()` ou `salvar()` para não carregar o conteúdo"""
+        if self.__conteudo is None and self.__arquivo is not None:
+            with open(self.__arquivo.path, "rb") as reader:
+                self.__conteudo = reader.read()
+        return cast(bytes, self.__conteudo)
+
+    @conteudo.setter
+    def conteudo (self, conteudo: bytes) -> None:
+        self.__conteudo = conteudo
+        self.fechar()
+        self.__arquivo = None
+
+    @property
+    def em_disco (self) -> bool:
+        """Checar se o conteúdo está em um arquivo temporário"""
+        return self.__arquivo is not None
+
     @property
     def tipo (self) -> str:
         return self.__message.get_content_type()
 
     @property
     def tamanho (self) -> int:
-        return len(self.conteudo)
+        if self.__conteudo is None and self.__arquivo is not None:
+            return os.path.getsize(self.__arquivo.path)
+        return len(cast(bytes, self.__conteudo))
 
     @property
     def charset (self) -> str | None:
@@ -217,13 +454,35 @@ class Documento:
         - `default` caso não encontrado"""
         return self.__message.get_filename(default)
 
+    def iter_bytes (self, tamanho_chunk: int = dclick.http.TAMANHO_CHUNK) -> Iterator[bytes]:
+        """Iterar sobre o conteúdo em partes de `tamanho_chunk` bytes sem carregar o documento em disco para a memória"""
+        if self.__conteudo is not None or self.__arquivo is None:
+            conteudo = memoryview(cast(bytes, self.__conteudo))
+            for inicio in range(0, len(conteudo), tamanho_chunk):
+                yield bytes(conteudo[inicio : inicio + tamanho_chunk])
+            return
+
+        with open(self.__arquivo.path, "rb") as reader:
+            while chunk := reader.read(tamanho_chunk):
+                yield chunk
+
     def salvar (self, diretorio: Caminho) -> Caminho:
-        """Salvar o conteúdo no `diretório`, conforme charset, e retornar o caminho"""
+        """Salvar o conteúdo no `diretório`, conforme charset, e retornar o caminho
+        - Escrito em partes, sem cópia integral do conteúdo em memória"""
         charset = self.charset
-        mode = "wb" if not charset else "w"
         destino = diretorio / self.nome_arquivo()
-        with open(destino.path, mode, encoding=charset) as writer:
-            writer.write(self.conteudo.decode(charset) if charset else self.conteudo)
+
+        if not charset:
+            with open(destino.path, "wb") as writer:
+                for chunk in self.iter_bytes():
+                    writer.write(chunk)
+            return destino
+
+        decoder = codecs.getincrementaldecoder(charset)()
+        with open(destino.path, "w", encoding=charset) as writer:
+            for chunk in self.iter_bytes():
+                writer.write(decoder.decode(chunk))
+            writer.write(decoder.decode(b"", final=True))
         return destino
 
 class Tarefa (Unmarshaller):
@@ -249,17 +508,28 @@ class Tarefa (Unmarshaller):
     properties: list[modelos.Property]
 
     @classmethod
-    @bot.erro.adicionar_prefixo(lambda args, _: f"Falha Tarefa.Consultar(id_tarefa={args[1]!r}) no Holmes")
     def Consultar (cls, id_tarefa: str) -> "Tarefa":
         """Consultar a tarefa `id_tarefa`
+        - Obtido do `cache_modelos` caso habilitado e armazenado
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug("Consultando uma tarefa no Holmes", id_tarefa=id_tarefa)
-        return (
-            client_singleton()
-            .get(f"/v1/tasks/{id_tarefa}")
-            .esperar_sucesso()
-            .unmarshal(Tarefa)
-        )
+        return rotas.consultar_tarefa(id_tarefa, Tarefa).enviar(client_singleton())
+
+    @classmethod
+    def ConsultarMuitos (cls, ids_tarefas: Iterable[str], *, concorrencia: int = 8) -> "ResultadoConsultas[Tarefa]":
+        """Consultar as tarefas `ids_tarefas` com até `concorrencia` requests simultâneos
+        - Ids repetidos consultados uma única vez
+        - Erros capturados por id no `ResultadoConsultas.erros`, com o mesmo prefixo do `Tarefa.Consultar()`, sem interromper as demais consultas
+        - Variáveis utilizadas `[holmes] -> host, token`
+
+        ### Exemplo
+        ```
+        resultado = Tarefa.ConsultarMuitos(ids, concorrencia=10)
+        for id, erro in resultado.erros.items():
+            print(id, erro)
+        for tarefa in resultado:
+            print(tarefa)
+        ```"""
+        return _consultar_muitos(Tarefa, "tarefa", ids_tarefas, rotas.consultar_tarefa, concorrencia)
 
     def __repr__ (self) -> str:
         return f"<holmes.Tarefa id={self.id!r} status={self.status!r}>"
@@ -307,40 +577,23 @@ class Tarefa (Unmarshaller):
         - Variáveis utilizadas `[holmes] -> host, token`"""
         return Processo.Consultar(self.process_id)
 
-    def Documento (self, id_ou_conditional: str) -> "Documento":
+    def Documento (self, id_ou_conditional: str, *, em_disco: bool = False) -> "Documento":
         """Consultar o documento pelo `id` ou pelo `conditional` da tarefa `id_tarefa`
+        - `em_disco` para realizar o download em `stream` para um arquivo temporário
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Consultando documento({id_ou_conditional}) da tarefa({self.id}) no Holmes")
-
-        documento = self.obter_documento(
-            lambda d: id_ou_conditional == d.id
-                      or id_ou_conditional.lower() in d.conditional.lower())
-        assert documento is not None, f"Documento {id_ou_conditional!r} não encontrado na tarefa({self.id})"
-
-        response = (
-            client_singleton()
-            .get(f"/v1/tasks/{self.id}/documents/{documento.id}")
-            .esperar_status_code(200, f"Falha ao consultar documento({id_ou_conditional}) da tarefa({self.id}) no Holmes")
-        )
-        return Documento(response.conteudo, response.headers_dict)
+        url, mensagem = rotas.url_documento_tarefa(self, id_ou_conditional)
+        if em_disco: return Documento.Download(url, mensagem)
+        return rotas.baixar(url, mensagem, Documento).enviar(client_singleton())
 
-    def AnexarDocumento (self, id_documento: str, documento: tuple[str, bytes], *,
+    def AnexarDocumento (self, id_documento: str, documento: tuple[str, bytes | Caminho | BinaryIO], *,
                                mime_type: str | None = None) -> Self:
         """Realizar upload do documento `id_documento` com o conteúdo `documento` na tarefa
         - `documento` sendo o `(nome_extensão, conteúdo)`
+        - `conteúdo=Caminho | BinaryIO` enviado em partes via `multipart` sem carregar o arquivo em memória
         - `mime_type` para informar manualmente o tipo do conteúdo
         - `mime_type=None` feito o advinho do tipo com base na extensão com fallback para `application/octet-stream`
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Anexando documento id({id_documento}) nome({documento[0]}) na tarefa({self.id}) no Holmes")
-        nome_extensao, conteudo = documento
-        mime = (mime_type or mimetypes.guess_type(nome_extensao)[0]) or "application/octet-stream"
-        (
-            client_singleton()
-            .post(url = f"/v1/tasks/{self.id}/documents/{id_documento}",
-                  arquivos = { "file": (nome_extensao, conteudo, mime) })
-            .esperar_status_code(204, f"Falha ao anexar documento na tarefa({self.id}) do Holmes")
-        )
-
+        rotas.anexar_documento(self, id_documento, documento, mime_type).enviar(client_singleton())
         if self.obter_documento(lambda d: d.id == id_documento) is None:
             self.documents = self.Consultar(self.id).documents
 
@@ -349,16 +602,7 @@ class Tarefa (Unmarshaller):
     def Assumir (self, id_usuario: str | None = None) -> Self:
         """Assumir a tarefa para o `id_usuario`
         - Variáveis utilizadas `[holmes] -> host, token, [id_usuario]`"""
-        dclick.logger.debug(f"Assumindo tarefa({self.id}) no Holmes")
-        id_usuario = id_usuario or bot.config.holmes.id_usuario
-        (
-            client_singleton()
-            .put(url = f"/v1/tasks/{self.id}/assign",
-                 json = { "user_id": id_usuario })
-            .esperar_sucesso(f"Falha ao assumir tarefa({self.id}) no Holmes")
-        )
-        self.assignee_id = id_usuario
-        return self
+        return rotas.assumir_tarefa(self, id_usuario).enviar(client_singleton())
 
     def TomarAcao (self, acao: str, *,
                          propriedades: list[dict[Literal["id", "value", "text"], str]] | None = None) -> "Tarefa":
@@ -366,24 +610,7 @@ class Tarefa (Unmarshaller):
         - `acao` pode ser o `id` ou o `name`
         - `propriedades` caso seja necessário informar algum adicional (motivo de pendência)
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Tomando ação({acao}) na tarefa({self.id}) no Holmes")
-
-        action = self.obter_acao(lambda a: acao == a.id or acao.lower() in a.name.lower())
-        assert action is not None, f"Ação {acao!r} não encontrada na tarefa({self.id})"
-
-        (
-            client_singleton()
-            .post(
-                url = f"/v1/tasks/{self.id}/action",
-                json = {
-                    "task": { 
-                        "action_id": action.id,
-                        "confirm_action": True,
-                        "property_values": propriedades or []
-                    }
-            })
-            .esperar_status_code(200, f"Falha ao tomar ação na tarefa({self.id}) no Holmes")
-        )
+        rotas.tomar_acao(self, acao, propriedades).enviar(client_singleton())
         return self.Consultar(self.id)
 
     def ItensTabela (self, id_ou_name: str, *,
@@ -391,26 +618,63 @@ class Tarefa (Unmarshaller):
                            per_page: int = 100) -> list[modelos.TableItem]:
         """Consultar itens da tabela pelo `id` ou `name` na tarefa `self.id`
         - `page, per_page` realizar a paginação. Default: Primeiros 100
+        - Utilizar o `IterarItensTabela()` para consultar todas as páginas
         - Variáveis utilizadas `[holmes] -> host, token`"""
-        dclick.logger.debug(f"Consultando itens da tabela({id_ou_name}) da tarefa({self.id}) no Holmes")
-
-        tabela = self.obter_tabela(
-            lambda t: id_ou_name == t.id
-                      or id_ou_name.lower() in t.name.lower())
-        assert tabela is not None, f"Tabela {id_ou_name!r} não encontrada na tarefa({self.id})"
-
-        items = (
-            client_singleton()
-            .get(url = f"/v1/tasks/{self.id}/tables/{tabela.id}/table_items",
-                 query = { "page": page, "per_page": per_page })
-            .esperar_status_code(200, f"Falha ao consultar itens da tabela({id_ou_name}) da tarefa({self.id}) no Holmes")
-            .json(esperar=dict[str, Any])
-            .get("items", [])
-        )
-        return modelos.TableItem.UnmarshalMany(items)
+        return rotas.itens_tabela(self, id_ou_name, page, per_page).enviar(client_singleton())
+
+    def IterarItensTabela (self, id_ou_name: str, *,
+                                 per_page: int = 100,
+                                 limite: int | None = None,
+                                 prefetch: bool = True) -> Iterator[modelos.TableItem]:
+        """Iterar sobre todos os itens da tabela pelo `id` ou `name` na tarefa `self.id`, consultando as páginas pelo `ItensTabela()`
+        - `per_page` quantidade de itens por página
+        - `limite` quantidade máxima de itens retornados. `None` para todos
+        - `prefetch` para consultar a página seguinte em uma thread enquanto a página atual é processada.
+        Sem o `prefetch` a página seguinte é consultada apenas após o último item da atual
+        - Encerrar a iteração antes do fim aguarda a consulta antecipada em andamento
+        - Encerrado na primeira página com menos de `per_page` itens
+        - Erro de uma página lançado apenas ao alcançá-la, após os itens das páginas anteriores
+        - Variáveis utilizadas `[holmes] -> host, token`
+
+        ### Exemplo
+        ```
+        for item in tarefa.IterarItensTabela("Itens", limite=5000):
+            print(item.property_values)
+        ```"""
+        if limite is not None and limite <= 0: return
+        if limite is not None: per_page = min(per_page, limite)
+        executor = ThreadPoolExecutor(1, thread_name_prefix="itens_tabela") if prefetch else None
+
+        def consultar (page: int) -> Future[list[modelos.TableItem]]:
+            if executor is not None:
+                return executor.submit(self.ItensTabela, id_ou_name, page=page, per_page=per_page)
+            futuro = Future[list[modelos.TableItem]]()
+            try: futuro.set_result(self.ItensTabela(id_ou_name, page=page, per_page=per_page))
+            except Exception as erro: futuro.set_exception(erro)
+            return futuro
+
+        page, retornados = 1, 0
+        futuro: Future[list[modelos.TableItem]] | None = consultar(page)
+        try:
+            while futuro is not None:
+                itens = futuro.result()
+                if limite is not None: itens = itens[:limite - retornados]
+                proxima = len(itens) >= per_page and (limite is None or retornados + len(itens) < limite)
+                # Com o `prefetch` a próxima página é consultada antes de retornar os itens da atual
+                futuro = consultar(page + 1) if proxima and executor is not None else None
+                page += 1
+                for item in itens:
+                    retornados += 1
+                    yield item
+                if proxima and executor is None: futuro = consultar(page)
+        finally:
+            if futuro is not None: futuro.cancel()
+            if executor is not None: executor.shutdown(wait=True, cancel_futures=True)
 
 __all__ = [
     "Tarefa",
     "Processo",
     "Documento",
+    "ResultadoConsultas",
+    "DocumentoBaixado",
 ]
\ No newline at end of file
@@ -1,4 +1,28 @@
 """Pacote destinado ao protocolo http
-- Realizado logs de `erros.api` automaticamente para o `request e response` dos métodos novos/modificados"""
+- Realizado logs de `erros.api` automaticamente para o `request e response` dos métodos novos/modificados
+- Módulo `retentativa` contém a política de retentativa aplicada pelos clientes
+- Módulo `conexao` contém as opções de conexão por seção do .ini e as estatísticas do pool
+- Módulo `decodificador` contém a decodificação rápida e incremental de `json` e `xml`
+- Módulo `cache` contém o cache de respostas com revalidação condicional
+- Módulo `coalescencia` contém o agrupamento de requests idênticos em andamento
+- Módulo `limite` contém o limitador de requests por segundo
+- Módulo `disjuntor` contém o circuit breaker por serviço
+- Módulo `metricas` contém a medição das fases dos requests agregada por serviço e rota
+- Módulo `cassete` contém os transportes de gravação e reprodução offline dos requests
+- Módulo `lote` contém o resultado do `ClienteHttp.executar_lote()`
+- Módulo `compressao` contém a compressão do corpo dos requests
+- Módulo `registro` contém o registro que gerencia o ciclo de vida dos clientes dos pacotes"""
 
-from dclick.http.setup import *
\ No newline at end of file
+from dclick.http.setup import *
+from dclick.http.conexao import *
+from dclick.http.decodificador import *
+from dclick.http.cache import *
+from dclick.http.coalescencia import *
+from dclick.http.limite import *
+from dclick.http.disjuntor import *
+from dclick.http.metricas import *
+from dclick.http.cassete import *
+from dclick.http.lote import *
+from dclick.http.compressao import *
+from dclick.http.registro import *
+from dclick.http.retentativa import *
\ No newline at end of file
@@ -0,0 +1,431 @@
+# std
+from __future__ import annotations
+import os, abc, json, time, typing, hashlib, tempfile, threading
+from collections import OrderedDict
+# externo
+import bot
+import httpx
+from bot.estruturas import Caminho
+
+HEADERS_CHAVE = ("Accept", "Authorization", "api_token")
+"""Headers do request que diferenciam as entradas do cache por padrão"""
+
+HEADERS_DESCARTADOS = frozenset(("content-encoding", "content-length", "transfer-encoding", "set-cookie"))
+"""Headers da resposta não armazenados
+- Conteúdo armazenado já decodificado
+- `Set-Cookie` não é reaplicado pelo cache e não deve ser persistido"""
+
+HEADERS_SENSIVEIS = frozenset(("authorization", "proxy-authorization", "cookie", "api_token"))
+"""Headers do request armazenados apenas como hash quando listados no `Vary` da resposta"""
+
+def _valor_vary (nome: str, valor: str) -> str:
+    """Valor do header `nome` do request armazenado para comparar o `Vary`"""
+    if nome.lower() not in HEADERS_SENSIVEIS or not valor: return valor
+    return f"sha256:{hashlib.sha256(valor.encode()).hexdigest()}"
+
+def _diretivas (headers: httpx.Headers) -> list[str]:
+    """Diretivas do `Cache-Control` em `lower`"""
+    return [diretiva.strip().lower() for diretiva in headers.get("Cache-Control", "").split(",")]
+
+class EntradaCache:
+    """Resposta armazenada no `CacheHttp`"""
+
+    url: str
+    """URL do request armazenado"""
+    status_code: int
+    headers: list[tuple[str, str]]
+    conteudo: bytes
+    etag: str | None
+    last_modified: str | None
+    vary: dict[str, str]
+    """Valores dos headers do request listados no `Vary` da resposta
+    - Headers em `HEADERS_SENSIVEIS` armazenados apenas como hash"""
+    armazenado_em: float
+    """Momento, pelo `time.time()`, do armazenamento ou última revalidação"""
+    validade: float
+    """Segundos em que a entrada pode ser utilizada sem revalidar"""
+
+    def __init__ (self, url: str,
+                        status_code: int,
+                        headers: list[tuple[str, str]],
+                        conteudo: bytes,
+                        etag: str | None = None,
+                        last_modified: str | None = None,
+                        vary: dict[str, str] | None = None,
+                        armazenado_em: float | None = None,
+                        validade: float = 0.0) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.conteudo = conteudo
+        self.etag = etag
+        self.last_modified = last_modified
+        self.vary = vary or {}
+        self.armazenado_em = time.time() if armazenado_em is None else armazenado_em
+        self.validade = validade
+
+    def __repr__ (self) -> str:
+        return f"<EntradaCache status_code={self.status_code} etag={self.etag!r} tamanho={len(self.conteudo)} fresca={self.fresca}>"
+
+    @property
+    def fresca (self) -> bool:
+        """Checar se a entrada pode ser utilizada sem revalidar com o servidor"""
+        return time.time() - self.armazenado_em < self.validade
+
+    def corresponde (self, requisicao: httpx.Request) -> bool:
+        """Checar se os headers do `Vary` da `requisicao` são os mesmos da entrada"""
+        return all(_valor_vary(nome, requisicao.headers.get(nome, "")) == valor for nome, valor in self.vary.items())
+
+    def condicionar (self, requisicao: httpx.Request) -> None:
+        """Adicionar os headers `If-None-Match` e `If-Modified-Since` na `requisicao`"""
+        if self.etag: requisicao.headers["If-None-Match"] = self.etag
+        if self.last_modified: requisicao.headers["If-Modified-Since"] = self.last_modified
+
+    def response (self, requisicao: httpx.Request) -> httpx.Response:
+        """Criar o `httpx.Response` da entrada para a `requisicao`"""
+        return httpx.Response(self.status_code, headers=self.headers, content=self.conteudo, request=requisicao)
+
+class CacheHttp (abc.ABC):
+    """Cache de respostas `GET` com revalidação condicional por `ETag` e `Last-Modified`
+    - Opt-in pelo atributo `ClienteHttp.cache` ou pela variável `cache` da seção do .ini no `ClienteHttp.FromConfig()`
+    - Entrada fresca pelo `Cache-Control: max-age` ou `ttl` é utilizada sem realizar o request
+    - Entrada expirada é revalidada com `If-None-Match`/`If-Modified-Since`. Resposta `304` utiliza o conteúdo armazenado
+    - Respostas sem `ETag`, `Last-Modified` ou validade, e com `Cache-Control: no-store`, não são armazenadas
+    - Request com `Cache-Control: no-store` não utiliza nem armazena. Com `Cache-Control: no-cache` ou `max-age=0` sempre revalida
+    - Requests `POST, PUT, PATCH, DELETE` com sucesso removem as entradas do recurso. Veja `remover_url()`
+    - Headers `Set-Cookie` da resposta e os `HEADERS_SENSIVEIS` do request não são armazenados
+    - `acertos, revalidacoes, falhas` contadores de uso do cache
+    - Classe abstrata. Utilizar o `CacheMemoria` ou `CacheDisco`"""
+
+    ttl: float
+    """Segundos em que uma resposta armazenada é utilizada sem revalidar, exceto com `Cache-Control: no-cache`
+    - `0` para sempre revalidar, exceto pelo `max-age` da resposta"""
+    headers_chave: tuple[str, ...]
+    """Headers do request que diferenciam as entradas"""
+    acertos: int
+    """Respostas utilizadas do cache sem realizar o request"""
+    revalidacoes: int
+    """Respostas `304` que utilizaram o conteúdo armazenado"""
+    falhas: int
+    """Requests cacheáveis que precisaram do conteúdo completo do servidor"""
+
+    def __init__ (self, ttl: float = 0.0, headers_chave: typing.Iterable[str] = HEADERS_CHAVE) -> None:
+        self.ttl = ttl
+        self.headers_chave = tuple(headers_chave)
+        self.acertos = self.revalidacoes = self.falhas = 0
+        self._lock = threading.Lock()
+
+    def __repr__ (self) -> str:
+        return (f"<{type(self).__name__} acertos={self.acertos} revalidacoes={self.revalidacoes} "
+                f"falhas={self.falhas} taxa_acerto={self.taxa_acerto:.1%}>")
+
+    @classmethod
+    def FromConfig (cls, secao: str) -> CacheHttp | None:
+        """Criar o cache conforme a `secao` do .ini
+        - `None` caso a variável `cache` não esteja presente
+        - Variáveis utilizadas `[secao] -> [cache: memoria | disco, cache_itens: 256, cache_diretorio: ./cache_http/{secao}, cache_ttl: 0]`"""
+        config = getattr(bot.config, secao)
+        tipo = config.obter_ou("cache", "").strip().lower()
+        if not tipo: return None
+
+        ttl = config.obter_ou("cache_ttl", 0.0)
+        match tipo:
+            case "memoria": return CacheMemoria(config.obter_ou("cache_itens", 256), ttl=ttl)
+            case "disco": return CacheDisco(config.obter_ou("cache_diretorio", f"./cache_http/{secao}"), ttl=ttl)
+            case _: raise ValueError(f"Tipo de cache '{tipo}' inválido na seção [{secao}]. Esperado 'memoria' ou 'disco'")
+
+    @property
+    def taxa_acerto (self) -> float:
+        """Proporção de requests cacheáveis que não precisaram do conteúdo completo do servidor"""
+        total = self.acertos + self.revalidacoes + self.falhas
+        return (self.acertos + self.revalidacoes) / total if total else 0.0
+
+    def chave (self, requisicao: httpx.Request) -> str | None:
+        """Obter a chave da `requisicao` no cache
+        - `None` caso não seja cacheável: método diferente de `GET`, `Cache-Control: no-store` ou condicional do usuário
+        - Formato `{hash da url}_{hash dos headers_chave}`"""
+        headers = requisicao.headers
+        if requisicao.method != "GET" or "no-store" in _diretivas(headers):
+            return None
+        if "If-None-Match" in headers or "If-Modified-Since" in headers:
+            return None
+
+        valores = "\n".join(f"{nome}: {headers.get(nome, '')}" for nome in self.headers_chave)
+        return f"{self._hash_url(requisicao.url)}_{hashlib.sha256(valores.encode()).hexdigest()[:16]}"
+
+    def consultar (self, requisicao: httpx.Request, chave: str) -> EntradaCache | None:
+        """Consultar a entrada da `chave` compatível com o `Vary` da `requisicao`
+        - Contabilizado o `acertos` caso a entrada possa ser utilizada sem revalidar. Veja `utilizavel()`"""
+        entrada = self.obter(chave)
+        if entrada is None or not entrada.corresponde(requisicao):
+            return None
+        if self.utilizavel(requisicao, entrada):
+            with self._lock: self.acertos += 1
+        return entrada
+
+    @staticmethod
+    def utilizavel (requisicao: httpx.Request, entrada: EntradaCache) -> bool:
+        """Checar se a `entrada` pode ser utilizada sem revalidar
+        - Entrada deve estar `fresca` e a `requisicao` sem `Cache-Control: no-cache | max-age=0` ou `Pragma: no-cache`"""
+        if not entrada.fresca: return False
+        diretivas = _diretivas(requisicao.headers)
+        return "no-cache" not in diretivas and "max-age=0" not in diretivas \
+               and "no-cache" not in requisicao.headers.get("Pragma", "").lower()
+
+    def armazenar (self, requisicao: httpx.Request,
+                         chave: str,
+                         response: httpx.Response,
+                         entrada: EntradaCache | None = None) -> httpx.Response:
+        """Armazenar ou revalidar a `entrada` com a `response` do servidor
+        - Resposta `304` com `entrada` retorna o `httpx.Response` criado com o conteúdo armazenado
+        - Demais casos retornam a própria `response`"""
+        if response.status_code == 304 and entrada is not None:
+            entrada.headers = self._mesclar_headers(entrada.headers, response.headers)
+            entrada.etag = response.headers.get("ETag", entrada.etag)
+            entrada.last_modified = response.headers.get("Last-Modified", entrada.last_modified)
+            # Validade pelos headers armazenados atualizados com os do `304`, que pode omitir o `Cache-Control`
+            entrada.validade = self._validade(httpx.Headers(entrada.headers))
+            entrada.armazenado_em = time.time()
+            self.salvar(chave, entrada)
+            with self._lock: self.revalidacoes += 1
+            return entrada.response(requisicao)
+
+        with self._lock: self.falhas += 1
+        if response.status_code != 200 or "no-store" in _diretivas(response.headers) or "no-store" in _diretivas(requisicao.headers):
+            return response
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        validade = self._validade(response.headers)
+        if not (etag or last_modified or validade):
+            return response
+
+        vary = [nome.strip() for nome in response.headers.get("Vary", "").split(",") if nome.strip()]
+        if "*" in vary: return response
+
+        self.salvar(chave, EntradaCache(
+            str(requisicao.url),
+            response.status_code,
+            [(nome, valor) for nome, valor in response.headers.items() if nome.lower() not in HEADERS_DESCARTADOS],
+            response.content,
+            etag = etag,
+            last_modified = last_modified,
+            vary = { nome: _valor_vary(nome, requisicao.headers.get(nome, "")) for nome in vary },
+            validade = validade,
+        ))
+        return response
+
+    def invalidar (self, requisicao: httpx.Request, response: httpx.Response) -> None:
+        """Remover as entradas do recurso caso a `requisicao` não segura tenha sido realizada com sucesso
+        - `POST` cria ou executa uma ação no recurso pai, removendo as entradas da URL e dos ancestrais
+        - Demais métodos alteram o próprio recurso, removendo também as entradas dos descendentes"""
+        if requisicao.method not in ("GET", "HEAD", "OPTIONS") and response.is_success:
+            self.remover_url(requisicao.url, descendentes=requisicao.method != "POST")
+
+    def remover_url (self, url: httpx.URL | str, descendentes: bool = True) -> None:
+        """Remover as entradas da `url` e dos recursos ancestrais, independente da query
+        - Ex: `/v1/tasks/123/action` remove `/v1/tasks/123/action`, `/v1/tasks/123`, `/v1/tasks`, `/v1` e `/`
+        - `descendentes` para remover também os recursos abaixo da `url`. Ex: `/v1/documents/123/download` para `/v1/documents/123`"""
+        alvo = httpx.URL(url)
+        caminho = alvo.path.rstrip("/")
+        for chave, armazenada in self.urls().items():
+            armazenada = httpx.URL(armazenada)
+            if (armazenada.scheme, armazenada.host, armazenada.port) != (alvo.scheme, alvo.host, alvo.port):
+                continue
+            outro = armazenada.path.rstrip("/")
+            ancestral = caminho == outro or caminho.startswith(f"{outro}/")
+            descendente = descendentes and outro.startswith(f"{caminho}/")
+            if ancestral or descendente: self.remover(chave)
+
+    def _validade (self, headers: httpx.Headers) -> float:
+        """Segundos de validade conforme o `Cache-Control` da resposta e o `ttl`"""
+        diretivas = _diretivas(headers)
+        if "no-cache" in diretivas: return 0.0
+
+        max_age = 0.0
+        for diretiva in diretivas:
+            if diretiva.startswith("max-age="):
+                try: max_age = float(diretiva.removeprefix("max-age="))
+                except ValueError: pass
+        return max(max_age, self.ttl)
+
+    @staticmethod
+    def _mesclar_headers (armazenados: list[tuple[str, str]], atualizados: httpx.Headers) -> list[tuple[str, str]]:
+        """Atualizar os headers `armazenados` com os headers da resposta `304`"""
+        nomes = { nome.lower() for nome in atualizados.keys() } - HEADERS_DESCARTADOS
+        return [
+            *((nome, valor) for nome, valor in armazenados if nome.lower() not in nomes),
+            *((nome, valor) for nome, valor in atualizados.items() if nome.lower() in nomes),
+        ]
+
+    @staticmethod
+    def _hash_url (url: httpx.URL) -> str:
+        return hashlib.sha256(str(url).encode()).hexdigest()[:32]
+
+    @abc.abstractmethod
+    def obter (self, chave: str) -> EntradaCache | None:
+        """Obter a entrada armazenada na `chave`"""
+
+    @abc.abstractmethod
+    def salvar (self, chave: str, entrada: EntradaCache) -> None:
+        """Armazenar a `entrada` na `chave`"""
+
+    @abc.abstractmethod
+    def remover (self, chave: str) -> None:
+        """Remover a entrada da `chave`, caso exista"""
+
+    @abc.abstractmethod
+    def urls (self) -> dict[str, str]:
+        """Obter a URL de cada chave armazenada"""
+
+    def limpar (self) -> None:
+        """Remover todas as entradas e zerar os contadores"""
+        with self._lock: self.acertos = self.revalidacoes = self.falhas = 0
+
+class CacheMemoria (CacheHttp):
+    """Cache de respostas em memória com remoção da entrada menos utilizada recentemente (LRU)
+    - Veja o `CacheHttp` para o funcionamento
+
+    ### Exemplo
+    ```
+    client = ClienteHttp(base_url="https://httpbin.org")
+    client.cache = CacheMemoria(maximo=128)
+    client.get("/etag/abc")
+    client.get("/etag/abc") # revalidado com 304
+    print(client.cache)
+    ```"""
+
+    maximo: int
+    """Quantidade máxima de entradas"""
+
+    def __init__ (self, maximo: int = 256, **kwargs: typing.Any) -> None:
+        super().__init__(**kwargs)
+        self.maximo = maximo
+        self._entradas = OrderedDict[str, EntradaCache]()
+
+    def __len__ (self) -> int:
+        return len(self._entradas)
+
+    def obter (self, chave: str) -> EntradaCache | None:
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is not None: self._entradas.move_to_end(chave)
+            return entrada
+
+    def salvar (self, chave: str, entrada: EntradaCache) -> None:
+        with self._lock:
+            self._entradas[chave] = entrada
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.maximo:
+                self._entradas.popitem(last=False)
+
+    def remover (self, chave: str) -> None:
+        with self._lock: self._entradas.pop(chave, None)
+
+    def urls (self) -> dict[str, str]:
+        with self._lock: return { chave: entrada.url for chave, entrada in self._entradas.items() }
+
+    def limpar (self) -> None:
+        super().limpar()
+        with self._lock: self._entradas.clear()
+
+class CacheDisco (CacheHttp):
+    """Cache de respostas em disco, persistente entre execuções
+    - Cada entrada é armazenada como `{chave}.json` com os metadados e `{chave}.bin` com o conteúdo
+    - Headers sensíveis não são escritos em disco. Veja `HEADERS_DESCARTADOS` e `HEADERS_SENSIVEIS`
+    - Escrita atômica, segura para múltiplas threads e processos
+    - Veja o `CacheHttp` para o funcionamento"""
+
+    diretorio: Caminho
+
+    def __init__ (self, diretorio: str | Caminho, **kwargs: typing.Any) -> None:
+        super().__init__(**kwargs)
+        self.diretorio = diretorio if isinstance(diretorio, Caminho) else Caminho(diretorio)
+        os.makedirs(self.diretorio.path, exist_ok=True)
+        self._urls = dict[str, str]()
+        """URL de cada chave já lida do disco. A URL de uma chave não se altera, pois faz parte da chave"""
+
+    def obter (self, chave: str) -> EntradaCache | None:
+        try:
+            with open((self.diretorio / f"{chave}.json").path, encoding="utf-8") as arquivo:
+                meta = json.load(arquivo)
+            with open((self.diretorio / f"{chave}.bin").path, "rb") as arquivo:
+                conteudo = arquivo.read()
+        except (OSError, ValueError):
+            return None
+        if "url" not in meta: return None
+
+        return EntradaCache(
+            meta["url"],
+            meta["status_code"],
+            [(nome, valor) for nome, valor in meta["headers"]],
+            conteudo,
+            etag = meta["etag"],
+            last_modified = meta["last_modified"],
+            vary = meta["vary"],
+            armazenado_em = meta["armazenado_em"],
+            validade = meta["validade"],
+        )
+
+    def salvar (self, chave: str, entrada: EntradaCache) -> None:
+        meta = {
+            "url": entrada.url,
+            "status_code": entrada.status_code,
+            "headers": entrada.headers,
+            "etag": entrada.etag,
+            "last_modified": entrada.last_modified,
+            "vary": entrada.vary,
+            "armazenado_em": entrada.armazenado_em,
+            "validade": entrada.validade,
+        }
+        # conteúdo antes dos metadados, pois a entrada só é lida com o `.json` presente
+        self._escrever(f"{chave}.bin", entrada.conteudo)
+        self._escrever(f"{chave}.json", json.dumps(meta).encode())
+        with self._lock: self._urls[chave] = entrada.url
+
+    def remover (self, chave: str) -> None:
+        # metadados antes do conteúdo, pois a entrada só é lida com o `.json` presente
+        for nome in (f"{chave}.json", f"{chave}.bin"):
+            try: os.remove((self.diretorio / nome).path)
+            except FileNotFoundError: pass
+        with self._lock: self._urls.pop(chave, None)
+
+    def urls (self) -> dict[str, str]:
+        # Lido apenas os metadados das entradas ainda não conhecidas, como as criadas por outros processos
+        chaves = { nome.removesuffix(".json") for nome in os.listdir(self.diretorio.path) if nome.endswith(".json") and not nome.startswith(".") }
+        with self._lock: conhecidas = { chave: url for chave, url in self._urls.items() if chave in chaves }
+        for chave in chaves - conhecidas.keys():
+            try:
+                with open((self.diretorio / f"{chave}.json").path, encoding="utf-8") as arquivo:
+                    url = json.load(arquivo).get("url")
+            except (OSError, ValueError): continue
+            if url: conhecidas[chave] = url
+        with self._lock: self._urls = conhecidas
+        return dict(conhecidas)
+
+    def limpar (self) -> None:
+        super().limpar()
+        with self._lock: self._urls.clear()
+        for nome in os.listdir(self.diretorio.path):
+            if nome.endswith((".json", ".bin")):
+                try: os.remove((self.diretorio / nome).path)
+                except FileNotFoundError: pass
+
+    def _escrever (self, nome: str, conteudo: bytes) -> None:
+        descritor, temporario = tempfile.mkstemp(prefix=".tmp_", dir=self.diretorio.path)
+        try:
+            with os.fdopen(descritor, "wb") as arquivo:
+                arquivo.write(conteudo)
+            os.replace(temporario, (self.diretorio / nome).path)
+        except BaseException:
+            try: os.remove(temporario)
+            except FileNotFoundError: pass
+            raise
+
+__all__ = [
+    "CacheHttp",
+    "CacheMemoria",
+    "CacheDisco",
+    "EntradaCache",
+    "HEADERS_SENSIVEIS",
+]
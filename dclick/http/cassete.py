@@ -0,0 +1,371 @@
+# std
+from __future__ import annotations
+import re, gzip, json, time, atexit, base64, typing, asyncio, hashlib, threading
+from collections import deque
+# interno
+from dclick.http.cache import HEADERS_DESCARTADOS
+# externo
+import bot
+import httpx
+from bot.estruturas import Caminho
+
+CAMPOS_REDIGIDOS = frozenset(("fields", "password", "senha", "secret", "token", "access_token", "refresh_token", "api_token"))
+"""Campos do `json` das respostas com os valores substituídos por `REDIGIDO` na gravação
+- `fields` contém os valores dos segredos do `dclick.cofre`"""
+HEADERS_REDIGIDOS = frozenset(("authorization", "proxy-authorization", "x-api-key", "api_token"))
+"""Headers das respostas com os valores substituídos por `REDIGIDO` na gravação"""
+REDIGIDO = "***"
+
+_BOUNDARY = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+
+class InteracaoNaoGravada (httpx.TransportError):
+    """Request sem interação correspondente no `Cassete` durante a reprodução"""
+
+class Interacao:
+    """Request e resposta gravados no `Cassete`"""
+
+    metodo: str
+    url: str
+    hash_corpo: str
+    """`sha256` do corpo do request"""
+    status_code: int
+    headers: list[tuple[str, str]]
+    conteudo: bytes
+    """Corpo da resposta já decodificado"""
+    segundos: float
+    """Latência original da resposta"""
+
+    def __init__ (self, metodo: str, url: str, hash_corpo: str,
+                        status_code: int,
+                        headers: list[tuple[str, str]],
+                        conteudo: bytes,
+                        segundos: float = 0.0) -> None:
+        self.metodo = metodo
+        self.url = url
+        self.hash_corpo = hash_corpo
+        self.status_code = status_code
+        self.headers = headers
+        self.conteudo = conteudo
+        self.segundos = segundos
+
+    def __repr__ (self) -> str:
+        return f"<Interacao {self.metodo} {self.url!r} status_code={self.status_code} tamanho={len(self.conteudo)}>"
+
+    def as_dict (self) -> dict[str, typing.Any]:
+        return {
+            "metodo": self.metodo,
+            "url": self.url,
+            "hash_corpo": self.hash_corpo,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "conteudo": base64.b64encode(self.conteudo).decode(),
+            "segundos": round(self.segundos, 4),
+        }
+
+    @classmethod
+    def FromDict (cls, dados: dict[str, typing.Any]) -> Interacao:
+        return cls(
+            dados["metodo"], dados["url"], dados["hash_corpo"],
+            dados["status_code"],
+            [(nome, valor) for nome, valor in dados["headers"]],
+            base64.b64decode(dados["conteudo"]),
+            dados.get("segundos", 0.0),
+        )
+
+class Cassete:
+    """Arquivo com as interações http gravadas para reprodução offline
+    - Formato `json` compactado com `gzip`
+    - Interações correspondidas pelo método, URL e, opcionalmente, o `sha256` do corpo do request
+    - Boundary dos corpos `multipart/form-data` normalizado antes do `sha256`, pois o `httpx` gera um boundary aleatório por request
+    - Interações repetidas da mesma chave são reproduzidas na ordem gravada e a última se repete ao esgotar, como nos pollings
+    - Valores dos `campos_redigidos` do `json` e dos `headers_redigidos` da resposta substituídos por `REDIGIDO` na gravação
+    - Utilizado pelo `TransporteGravacao` e `TransporteReproducao`"""
+
+    caminho: Caminho
+    interacoes: list[Interacao]
+    combinar_corpo: bool
+    """Considerar o corpo do request na correspondência da interação"""
+    campos_redigidos: frozenset[str]
+    """Campos do `json` da resposta, em qualquer profundidade, gravados como `REDIGIDO`"""
+    headers_redigidos: frozenset[str]
+    """Headers da resposta, em `lower`, gravados como `REDIGIDO`"""
+
+    def __init__ (self, caminho: str | Caminho,
+                        interacoes: list[Interacao] | None = None,
+                        combinar_corpo: bool = True,
+                        *,
+                        campos_redigidos: typing.Iterable[str] = CAMPOS_REDIGIDOS,
+                        headers_redigidos: typing.Iterable[str] = HEADERS_REDIGIDOS) -> None:
+        self.caminho = caminho if isinstance(caminho, Caminho) else Caminho(caminho)
+        self.interacoes = interacoes or []
+        self.combinar_corpo = combinar_corpo
+        self.campos_redigidos = frozenset(campos_redigidos)
+        self.headers_redigidos = frozenset(header.lower() for header in headers_redigidos)
+        self._lock = threading.Lock()
+        self._filas: dict[tuple[str, str, str], deque[Interacao]] | None = None
+
+    def __repr__ (self) -> str:
+        return f"<Cassete {self.caminho.string!r} interacoes={len(self.interacoes)}>"
+
+    @classmethod
+    def Carregar (cls, caminho: str | Caminho, combinar_corpo: bool = True) -> Cassete:
+        """Carregar o cassete gravado no `caminho`"""
+        cassete = cls(caminho, combinar_corpo=combinar_corpo)
+        with gzip.open(cassete.caminho.path, "rt", encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+        cassete.interacoes = [Interacao.FromDict(interacao) for interacao in dados["interacoes"]]
+        return cassete
+
+    def salvar (self) -> None:
+        """Salvar as interações no `caminho`"""
+        with self._lock:
+            _cassetes_pendentes.discard(self)
+            dados = { "versao": 1, "interacoes": [interacao.as_dict() for interacao in self.interacoes] }
+        with gzip.open(self.caminho.path, "wt", encoding="utf-8") as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False, separators=(",", ":"))
+
+    def chave (self, metodo: str, url: str, hash_corpo: str) -> tuple[str, str, str]:
+        return (metodo.upper(), url, hash_corpo if self.combinar_corpo else "")
+
+    def gravar (self, requisicao: httpx.Request, response: httpx.Response, segundos: float) -> None:
+        """Adicionar a interação da `response` já lida
+        - Cassete salvo ao encerrar o processo caso possua interações não salvas"""
+        interacao = Interacao(
+            requisicao.method, str(requisicao.url), _hash_corpo(requisicao),
+            response.status_code,
+            [
+                (nome, REDIGIDO if nome.lower() in self.headers_redigidos else valor)
+                for nome, valor in response.headers.items()
+                if nome.lower() not in HEADERS_DESCARTADOS
+            ],
+            self._redigir(response),
+            segundos,
+        )
+        with self._lock:
+            self.interacoes.append(interacao)
+            _cassetes_pendentes.add(self)
+
+    def _redigir (self, response: httpx.Response) -> bytes:
+        """Conteúdo da `response` com os valores dos `campos_redigidos` substituídos, caso seja um `json`"""
+        if not self.campos_redigidos or "json" not in response.headers.get("Content-Type", "").lower():
+            return response.content
+        try: dados = json.loads(response.content)
+        except ValueError: return response.content
+
+        def redigir (valor: typing.Any, redigido: bool = False) -> typing.Any:
+            if isinstance(valor, dict):
+                return { chave: redigir(item, redigido or chave in self.campos_redigidos) for chave, item in valor.items() }
+            if isinstance(valor, list): return [redigir(item, redigido) for item in valor]
+            return REDIGIDO if redigido and valor is not None else valor
+
+        return json.dumps(redigir(dados), ensure_ascii=False).encode()
+
+    def proxima (self, requisicao: httpx.Request) -> Interacao:
+        """Obter a próxima interação correspondente à `requisicao`
+        - `InteracaoNaoGravada` caso não exista"""
+        with self._lock:
+            if self._filas is None:
+                self._filas = {}
+                for interacao in self.interacoes:
+                    chave = self.chave(interacao.metodo, interacao.url, interacao.hash_corpo)
+                    self._filas.setdefault(chave, deque()).append(interacao)
+
+            fila = self._filas.get(self.chave(requisicao.method, str(requisicao.url), _hash_corpo(requisicao)))
+            if not fila:
+                raise InteracaoNaoGravada(f"Interação não gravada no {self}: {requisicao.method} {requisicao.url}", request=requisicao)
+            return fila.popleft() if len(fila) > 1 else fila[0]
+
+def _hash_corpo (requisicao: httpx.Request) -> str:
+    """`sha256` do corpo do request. Corpos em stream não lidos são considerados vazios
+    - Transportes do cassete leem o corpo antes quando `combinar_corpo`
+    - Boundary do `multipart/form-data` substituído por um valor fixo"""
+    try: conteudo = requisicao.content
+    except httpx.RequestNotRead: conteudo = b""
+
+    tipo = requisicao.headers.get("Content-Type", "")
+    if conteudo and tipo.lower().startswith("multipart/") and (boundary := _BOUNDARY.search(tipo)):
+        conteudo = conteudo.replace(boundary.group(1).encode("latin-1"), b"boundary")
+    return hashlib.sha256(conteudo).hexdigest()
+
+_cassetes_pendentes: set[Cassete] = set()
+"""Cassetes com interações não salvas, salvos ao encerrar o processo pois os clientes em cache não são fechados explicitamente"""
+
+@atexit.register
+def _salvar_pendentes () -> None:
+    for cassete in list(_cassetes_pendentes):
+        cassete.salvar()
+
+class _StreamSimulado (httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Corpo da resposta entregue em partes conforme a `banda` em bytes por segundo"""
+
+    TAMANHO_PARTE = 16 * 1024
+
+    def __init__ (self, conteudo: bytes, banda: float | None) -> None:
+        self.conteudo = conteudo
+        self.banda = banda
+
+    def _partes (self) -> typing.Iterator[tuple[bytes, float]]:
+        for inicio in range(0, len(self.conteudo), self.TAMANHO_PARTE):
+            parte = self.conteudo[inicio : inicio + self.TAMANHO_PARTE]
+            yield parte, (len(parte) / self.banda if self.banda else 0.0)
+
+    def __iter__ (self) -> typing.Iterator[bytes]:
+        for parte, espera in self._partes():
+            if espera: time.sleep(espera)
+            yield parte
+
+    async def __aiter__ (self) -> typing.AsyncIterator[bytes]:
+        for parte, espera in self._partes():
+            if espera: await asyncio.sleep(espera)
+            yield parte
+
+class TransporteGravacao (httpx.BaseTransport):
+    """Transporte que realiza os requests reais e grava as interações no `cassete`
+    - Cassete salvo ao fechar o cliente e ao encerrar o processo
+
+    ### Exemplo
+    ```
+    cassete = Cassete("./holmes.cassete")
+    with ClienteHttp(base_url="https://app-api.holmesdoc.io", transport=TransporteGravacao(cassete)) as client:
+        client.get("/v1/tasks/123")
+    ```"""
+
+    def __init__ (self, cassete: Cassete, transport: httpx.BaseTransport | None = None) -> None:
+        self.cassete = cassete
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request (self, request: httpx.Request) -> httpx.Response:
+        # corpo em stream, como o `multipart`, lido para compor o `sha256`
+        if self.cassete.combinar_corpo: request.read()
+        inicio = time.perf_counter()
+        response = self.transport.handle_request(request)
+        try: bruto = b"".join(response.iter_raw())
+        finally: response.close()
+
+        # corpo decodificado pelo `httpx.Response` conforme o `Content-Encoding`
+        gravada = httpx.Response(response.status_code, headers=response.headers, content=bruto, request=request)
+        self.cassete.gravar(request, gravada, time.perf_counter() - inicio)
+        return httpx.Response(
+            response.status_code,
+            headers = response.headers,
+            stream = httpx.ByteStream(bruto),
+            extensions = response.extensions,
+        )
+
+    def close (self) -> None:
+        self.transport.close()
+        self.cassete.salvar()
+
+class TransporteGravacaoAsync (httpx.AsyncBaseTransport):
+    """Versão assíncrona do `TransporteGravacao`"""
+
+    def __init__ (self, cassete: Cassete, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self.cassete = cassete
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request (self, request: httpx.Request) -> httpx.Response:
+        if self.cassete.combinar_corpo: await request.aread()
+        inicio = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try: bruto = b"".join([parte async for parte in response.aiter_raw()])
+        finally: await response.aclose()
+
+        gravada = httpx.Response(response.status_code, headers=response.headers, content=bruto, request=request)
+        self.cassete.gravar(request, gravada, time.perf_counter() - inicio)
+        return httpx.Response(
+            response.status_code,
+            headers = response.headers,
+            stream = httpx.ByteStream(bruto),
+            extensions = response.extensions,
+        )
+
+    async def aclose (self) -> None:
+        await self.transport.aclose()
+        self.cassete.salvar()
+
+class TransporteReproducao (httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transporte que responde com as interações do `cassete` sem acesso à rede
+    - Aceito pelo `ClienteHttp` e `ClienteHttpAsync`
+    - `latencia` segundos de espera antes da resposta. `None` para utilizar a latência gravada
+    - `banda` bytes por segundo na entrega do corpo da resposta. `None` para entrega imediata
+    - `InteracaoNaoGravada` caso o request não esteja no cassete
+
+    ### Exemplo
+    ```
+    transport = TransporteReproducao(Cassete.Carregar("./holmes.cassete"), latencia=0.05, banda=1_000_000)
+    client = ClienteHttp(base_url="https://app-api.holmesdoc.io", transport=transport)
+    ```"""
+
+    def __init__ (self, cassete: Cassete, latencia: float | None = 0.0, banda: float | None = None) -> None:
+        self.cassete = cassete
+        self.latencia = latencia
+        self.banda = banda
+
+    def _response (self, request: httpx.Request) -> tuple[httpx.Response, float]:
+        interacao = self.cassete.proxima(request)
+        response = httpx.Response(
+            interacao.status_code,
+            headers = interacao.headers,
+            stream = _StreamSimulado(interacao.conteudo, self.banda),
+        )
+        return response, interacao.segundos if self.latencia is None else self.latencia
+
+    def handle_request (self, request: httpx.Request) -> httpx.Response:
+        if self.cassete.combinar_corpo: request.read()
+        response, espera = self._response(request)
+        if espera: time.sleep(espera)
+        return response
+
+    async def handle_async_request (self, request: httpx.Request) -> httpx.Response:
+        if self.cassete.combinar_corpo: await request.aread()
+        response, espera = self._response(request)
+        if espera: await asyncio.sleep(espera)
+        return response
+
+def transporte_cassete (secao: str,
+                        assincrono: bool = False,
+                        **opcoes_transporte: typing.Any) -> httpx.BaseTransport | httpx.AsyncBaseTransport | None:
+    """Criar o transporte de gravação ou reprodução conforme a `secao` do .ini
+    - `None` caso a variável `cassete` não esteja presente
+    - `opcoes_transporte` repassadas ao `httpx.HTTPTransport` durante a gravação. Ex: `http2, limits, verify`
+    - Variáveis utilizadas `[secao] -> [cassete, cassete_modo: reproduzir, cassete_latencia: 0, cassete_banda: 0, cassete_redigir_campos, cassete_redigir_headers]`
+        - `cassete_latencia` negativa para utilizar a latência gravada
+        - `cassete_banda` em bytes por segundo. `0` para entrega imediata
+        - `cassete_redigir_campos` e `cassete_redigir_headers` separados por `,`, adicionados aos `CAMPOS_REDIGIDOS` e `HEADERS_REDIGIDOS`"""
+    config = getattr(bot.config, secao)
+    caminho = config.obter_ou("cassete", "")
+    if not caminho: return None
+
+    modo = config.obter_ou("cassete_modo", "reproduzir").strip().lower()
+    match modo:
+        case "gravar":
+            campos = config.obter_ou("cassete_redigir_campos", "")
+            headers = config.obter_ou("cassete_redigir_headers", "")
+            cassete = Cassete(
+                caminho,
+                campos_redigidos = CAMPOS_REDIGIDOS | { campo.strip() for campo in campos.split(",") if campo.strip() },
+                headers_redigidos = HEADERS_REDIGIDOS | { header.strip() for header in headers.split(",") if header.strip() },
+            )
+            if assincrono: return TransporteGravacaoAsync(cassete, httpx.AsyncHTTPTransport(**opcoes_transporte))
+            return TransporteGravacao(cassete, httpx.HTTPTransport(**opcoes_transporte))
+        case "reproduzir":
+            latencia = config.obter_ou("cassete_latencia", 0.0)
+            return TransporteReproducao(
+                Cassete.Carregar(caminho),
+                latencia = None if latencia < 0 else latencia,
+                banda = config.obter_ou("cassete_banda", 0.0) or None,
+            )
+        case _: raise ValueError(f"Modo de cassete '{modo}' inválido na seção [{secao}]. Esperado 'gravar' ou 'reproduzir'")
+
+__all__ = [
+    "Cassete",
+    "Interacao",
+    "InteracaoNaoGravada",
+    "TransporteGravacao",
+    "TransporteGravacaoAsync",
+    "TransporteReproducao",
+    "transporte_cassete",
+    "CAMPOS_REDIGIDOS",
+    "HEADERS_REDIGIDOS",
+    "REDIGIDO",
+]
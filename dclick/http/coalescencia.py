@@ -0,0 +1,127 @@
+# std
+from __future__ import annotations
+import typing, asyncio, threading
+# interno
+from dclick.http.cache import HEADERS_CHAVE, HEADERS_DESCARTADOS
+# externo
+import httpx
+
+def chave_padrao (requisicao: httpx.Request) -> str | None:
+    """Chave de coalescência padrão: método, URL e os `HEADERS_CHAVE` do request
+    - `None` para métodos diferentes de `GET` e `HEAD`"""
+    if requisicao.method not in ("GET", "HEAD"):
+        return None
+    headers = "\n".join(f"{nome}: {requisicao.headers.get(nome, '')}" for nome in HEADERS_CHAVE)
+    return f"{requisicao.method} {requisicao.url}\n{headers}"
+
+class _Voo:
+    """Request em andamento compartilhado pelos requests idênticos"""
+
+    def __init__ (self) -> None:
+        self.concluido = threading.Event()
+        self.response: httpx.Response | None = None
+        self.erro: Exception | None = None
+
+class Coalescencia:
+    """Agrupar requests idênticos em andamento em uma única chamada de rede (single-flight)
+    - O primeiro request da `chave` é enviado e os demais aguardam e recebem uma cópia da mesma resposta
+    - Erro do request enviado é repassado para todos os requests aguardando
+    - Requests `stream` não são agrupados
+    - `economizadas` contador de chamadas de rede evitadas
+    - Habilitado pelo atributo `ClienteHttp.coalescencia` ou pela variável `coalescer` da seção do .ini no `ClienteHttp.FromConfig()`
+
+    ### Exemplo
+    ```
+    client = ClienteHttp(base_url="https://httpbin.org")
+    client.coalescencia = Coalescencia()
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: client.get("/delay/1"), range(8)))
+    print(client.coalescencia.economizadas) # 7
+    ```"""
+
+    chave: typing.Callable[[httpx.Request], str | None]
+    """Função que obtém a chave de agrupamento do request
+    - `None` para o request não ser agrupado"""
+    economizadas: int
+    """Quantidade de requests atendidos pela resposta de outro request em andamento
+    - Não contabiliza os requests que receberam o erro ou que enviaram o próprio request após a interrupção do request em andamento"""
+
+    def __init__ (self, chave: typing.Callable[[httpx.Request], str | None] = chave_padrao) -> None:
+        self.chave = chave
+        self.economizadas = 0
+        self._lock = threading.Lock()
+        self._voos = dict[str, _Voo]()
+        self._voos_async = dict[str, asyncio.Future[httpx.Response | None]]()
+
+    def __repr__ (self) -> str:
+        return f"<Coalescencia economizadas={self.economizadas} em_andamento={len(self._voos) + len(self._voos_async)}>"
+
+    def executar (self, requisicao: httpx.Request, enviar: typing.Callable[[], httpx.Response]) -> httpx.Response:
+        """Executar o `enviar` ou aguardar o request idêntico em andamento
+        - Retornado a própria resposta do `enviar` ou uma cópia da resposta do request em andamento"""
+        chave = self.chave(requisicao)
+        if chave is None: return enviar()
+
+        with self._lock:
+            voo = self._voos.get(chave)
+            lider = voo is None
+            if voo is None: voo = self._voos[chave] = _Voo()
+
+        if not lider:
+            voo.concluido.wait()
+            if voo.erro is not None: raise voo.erro
+            # request em andamento interrompido sem resultado
+            if voo.response is None: return enviar()
+            with self._lock: self.economizadas += 1
+            return self._copiar(voo.response, requisicao)
+
+        try:
+            voo.response = enviar()
+            return voo.response
+        except Exception as erro:
+            voo.erro = erro
+            raise
+        finally:
+            with self._lock: del self._voos[chave]
+            voo.concluido.set()
+
+    async def aexecutar (self, requisicao: httpx.Request, enviar: typing.Callable[[], typing.Awaitable[httpx.Response]]) -> httpx.Response:
+        """Versão assíncrona do `executar()`"""
+        chave = self.chave(requisicao)
+        if chave is None: return await enviar()
+
+        voo = self._voos_async.get(chave)
+        if voo is not None:
+            response = await asyncio.shield(voo)
+            # request em andamento cancelado sem resultado
+            if response is None: return await enviar()
+            with self._lock: self.economizadas += 1
+            return self._copiar(response, requisicao)
+
+        voo = self._voos_async[chave] = asyncio.get_running_loop().create_future()
+        try:
+            response = await enviar()
+            voo.set_result(response)
+            return response
+        except Exception as erro:
+            voo.set_exception(erro)
+            raise
+        finally:
+            del self._voos_async[chave]
+            if not voo.done(): voo.set_result(None)
+            # marcar a exceção como recuperada caso nenhum request esteja aguardando
+            else: voo.exception()
+
+    @staticmethod
+    def _copiar (response: httpx.Response, requisicao: httpx.Request) -> httpx.Response:
+        """Criar uma cópia independente da `response` já lida para a `requisicao`"""
+        return httpx.Response(
+            response.status_code,
+            headers = [(nome, valor) for nome, valor in response.headers.items() if nome.lower() not in HEADERS_DESCARTADOS],
+            content = response.content,
+            request = requisicao,
+        )
+
+__all__ = [
+    "Coalescencia",
+]
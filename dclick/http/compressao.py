@@ -0,0 +1,151 @@
+# std
+from __future__ import annotations
+import time, zlib, typing, threading
+# externo
+import bot
+import httpx
+
+type ALGORITMOS_COMPRESSAO = typing.Literal["gzip", "deflate"]
+
+class CompressaoRequest:
+    """Compressão do corpo dos requests com `Content-Encoding: gzip` ou `deflate`
+    - Opt-in por serviço, pois o servidor deve aceitar o `Content-Encoding` no request
+    - Comprimido apenas os corpos com no mínimo `minimo` bytes e `Content-Type` presente nos `tipos`
+    - Corpos em stream, como o `holmes.Documento.Upload()`, são comprimidos em partes e enviados sem `Content-Length`
+    - `requests, bytes_originais, bytes_enviados, segundos` contadores para acompanhar a economia
+    - Habilitado pelo atributo `ClienteHttp.compressao` ou pela variável `compressao` da seção do .ini no `ClienteHttp.FromConfig()`
+
+    ### Exemplo
+    ```
+    client = ClienteHttp(base_url="https://httpbin.org")
+    client.compressao = CompressaoRequest("gzip", minimo=1024)
+    client.post("/post", json={ "content": "a" * 100_000 })
+    print(client.compressao)
+    ```"""
+
+    algoritmo: ALGORITMOS_COMPRESSAO
+    minimo: int
+    """Tamanho mínimo, em bytes, do corpo para ser comprimido"""
+    nivel: int
+    """Nível de compressão do `zlib` entre `1` e `9`"""
+    tipos: tuple[str, ...]
+    """Prefixos do `Content-Type` comprimidos"""
+    requests: int
+    """Quantidade de requests comprimidos"""
+    bytes_originais: int
+    bytes_enviados: int
+    segundos: float
+    """Tempo de CPU gasto na compressão"""
+
+    def __init__ (self, algoritmo: ALGORITMOS_COMPRESSAO = "gzip",
+                        minimo: int = 8 * 1024,
+                        nivel: int = 6,
+                        tipos: typing.Iterable[str] = ("application/json", "application/xml", "text/")) -> None:
+        assert algoritmo in ("gzip", "deflate"), f"Algoritmo de compressão '{algoritmo}' inválido"
+        self.algoritmo = algoritmo
+        self.minimo = minimo
+        self.nivel = nivel
+        self.tipos = tuple(tipos)
+        self.requests = self.bytes_originais = self.bytes_enviados = 0
+        self.segundos = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__ (self) -> str:
+        return (f"<CompressaoRequest {self.algoritmo} requests={self.requests} bytes_originais={self.bytes_originais} "
+                f"bytes_enviados={self.bytes_enviados} economia={self.economia:.1%} segundos={self.segundos:.3f}>")
+
+    @classmethod
+    def FromConfig (cls, secao: str) -> CompressaoRequest | None:
+        """Criar a compressão conforme a `secao` do .ini
+        - `None` caso a variável `compressao` não esteja presente
+        - Variáveis utilizadas `[secao] -> [compressao: gzip | deflate, compressao_minimo: 8192, compressao_nivel: 6]`"""
+        config = getattr(bot.config, secao)
+        algoritmo = config.obter_ou("compressao", "").strip().lower()
+        if not algoritmo: return None
+        if algoritmo not in ("gzip", "deflate"):
+            raise ValueError(f"Algoritmo de compressão '{algoritmo}' inválido na seção [{secao}]. Esperado 'gzip' ou 'deflate'")
+
+        return cls(
+            typing.cast(ALGORITMOS_COMPRESSAO, algoritmo),
+            minimo = config.obter_ou("compressao_minimo", 8 * 1024),
+            nivel = config.obter_ou("compressao_nivel", 6),
+        )
+
+    @property
+    def economia (self) -> float:
+        """Proporção de bytes economizados no envio"""
+        return 1 - self.bytes_enviados / self.bytes_originais if self.bytes_originais else 0.0
+
+    def aplicar (self, requisicao: httpx.Request) -> None:
+        """Comprimir o corpo da `requisicao`, caso elegível"""
+        headers = requisicao.headers
+        if "Content-Encoding" in headers or not headers.get("Content-Type", "").startswith(self.tipos):
+            return
+
+        try: conteudo = requisicao.content
+        except httpx.RequestNotRead:
+            tamanho = headers.get("Content-Length")
+            if tamanho is not None and int(tamanho) < self.minimo:
+                return
+            requisicao.stream = _StreamComprimido(self, requisicao.stream)
+            headers.pop("Content-Length", None)
+            headers["Transfer-Encoding"] = "chunked"
+            headers["Content-Encoding"] = self.algoritmo
+            with self._lock: self.requests += 1
+            return
+
+        if len(conteudo) < self.minimo:
+            return
+
+        inicio = time.perf_counter()
+        compressor = self._compressor()
+        comprimido = compressor.compress(conteudo) + compressor.flush()
+        self._contabilizar(len(conteudo), len(comprimido), time.perf_counter() - inicio, requests=1)
+
+        requisicao.stream = httpx.ByteStream(comprimido)
+        requisicao._content = comprimido
+        headers["Content-Length"] = str(len(comprimido))
+        headers["Content-Encoding"] = self.algoritmo
+
+    def _compressor (self) -> typing.Any:
+        # `wbits` 31 para o formato gzip e 15 para o zlib (deflate)
+        return zlib.compressobj(self.nivel, zlib.DEFLATED, 31 if self.algoritmo == "gzip" else 15)
+
+    def _contabilizar (self, originais: int, enviados: int, segundos: float, requests: int = 0) -> None:
+        with self._lock:
+            self.requests += requests
+            self.bytes_originais += originais
+            self.bytes_enviados += enviados
+            self.segundos += segundos
+
+class _StreamComprimido (httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Compressão em partes do corpo em stream do request"""
+
+    def __init__ (self, compressao: CompressaoRequest, stream: typing.Any) -> None:
+        self.compressao = compressao
+        self.stream = stream
+
+    def _comprimir (self, compressor: typing.Any, parte: bytes | None) -> bytes:
+        inicio = time.perf_counter()
+        comprimido = compressor.compress(parte) if parte is not None else compressor.flush()
+        self.compressao._contabilizar(len(parte or b""), len(comprimido), time.perf_counter() - inicio)
+        return comprimido
+
+    def __iter__ (self) -> typing.Iterator[bytes]:
+        compressor = self.compressao._compressor()
+        for parte in self.stream:
+            if comprimido := self._comprimir(compressor, parte):
+                yield comprimido
+        yield self._comprimir(compressor, None)
+
+    async def __aiter__ (self) -> typing.AsyncIterator[bytes]:
+        compressor = self.compressao._compressor()
+        async for parte in self.stream:
+            if comprimido := self._comprimir(compressor, parte):
+                yield comprimido
+        yield self._comprimir(compressor, None)
+
+__all__ = [
+    "CompressaoRequest",
+    "ALGORITMOS_COMPRESSAO",
+]
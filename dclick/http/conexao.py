@@ -0,0 +1,125 @@
+# std
+from __future__ import annotations
+import typing, importlib.util
+# interno
+import dclick
+# externo
+import bot
+import httpx
+
+def opcoes_conexao (secao: str, timeout: float = 60) -> dict[str, typing.Any]:
+    """Obter as opções de conexão do `httpx.Client` com os valores da `secao` do .ini
+    - `timeout` padrão, em segundos, caso não informado na seção
+    - `http2` necessário o pacote `h2` instalado (`httpx[http2]`). Utilizado `HTTP/1.1` caso não esteja
+    - Variáveis utilizadas `[secao] -> [timeout_http, timeout_conexao, timeout_leitura, timeout_escrita, timeout_pool,
+    max_conexoes: 100, max_conexoes_keepalive: 20, keepalive_expiracao: 5.0, http2: False]`
+        - `timeout_*` utilizam o `timeout_http` como padrão"""
+    config = getattr(bot.config, secao)
+    timeout = config.obter_ou("timeout_http", float(timeout))
+
+    http2 = config.obter_ou("http2", False)
+    if http2 and importlib.util.find_spec("h2") is None:
+        dclick.logger.alertar(f"HTTP/2 habilitado na seção [{secao}] porém o pacote 'h2' não está instalado. Utilizado HTTP/1.1")
+        http2 = False
+
+    return {
+        "http2": http2,
+        "timeout": httpx.Timeout(
+            timeout,
+            connect = config.obter_ou("timeout_conexao", timeout),
+            read    = config.obter_ou("timeout_leitura", timeout),
+            write   = config.obter_ou("timeout_escrita", timeout),
+            pool    = config.obter_ou("timeout_pool", timeout),
+        ),
+        "limits": httpx.Limits(
+            max_connections           = config.obter_ou("max_conexoes", 100),
+            max_keepalive_connections = config.obter_ou("max_conexoes_keepalive", 20),
+            keepalive_expiry          = config.obter_ou("keepalive_expiracao", 5.0),
+        ),
+    }
+
+class EstatisticasPool:
+    """Retrato do pool de conexões de um cliente http
+    - Obtido pelo `ClienteHttp.estatisticas_pool()`"""
+
+    conexoes: int
+    """Quantidade de conexões abertas no pool"""
+    ativas: int
+    """Conexões com algum request em andamento"""
+    ociosas: int
+    """Conexões em `keep-alive` aguardando reutilização"""
+    aguardando: int
+    """Requests na fila aguardando uma conexão livre"""
+    max_conexoes: int | None
+    """Limite de conexões do pool
+    - `None` caso ilimitado ou transporte sem pool"""
+    saturacoes: int
+    """Quantidade de requests que encontraram o pool saturado"""
+
+    def __init__ (self, conexoes: int = 0,
+                        ativas: int = 0,
+                        ociosas: int = 0,
+                        aguardando: int = 0,
+                        max_conexoes: int | None = None,
+                        saturacoes: int = 0) -> None:
+        self.conexoes = conexoes
+        self.ativas = ativas
+        self.ociosas = ociosas
+        self.aguardando = aguardando
+        self.max_conexoes = max_conexoes
+        self.saturacoes = saturacoes
+
+    def __repr__ (self) -> str:
+        return (f"<EstatisticasPool conexoes={self.conexoes}/{self.max_conexoes} ativas={self.ativas} "
+                f"ociosas={self.ociosas} aguardando={self.aguardando} saturacoes={self.saturacoes}>")
+
+    @classmethod
+    def Obter (cls, transport: httpx.BaseTransport | httpx.AsyncBaseTransport,
+                    saturacoes: int = 0,
+                    max_conexoes: int | None = None) -> EstatisticasPool:
+        """Obter as estatísticas do pool do `httpcore` presente no `transport`
+        - Conexões obtidas pelo `connections` público do pool, copiado sob o lock do `httpcore`
+        - `max_conexoes` limite configurado no cliente. Obtido do pool caso não informado
+        - `aguardando` sem API pública no `httpcore`, obtido da fila interna do pool apenas para diagnóstico
+        - Zerado caso o `transport` não possua um pool, como o `httpx.MockTransport`"""
+        pool = getattr(transport, "_pool", None)
+        if pool is None or not hasattr(pool, "connections"):
+            return cls(max_conexoes=max_conexoes, saturacoes=saturacoes)
+
+        conexoes = pool.connections
+        ociosas = sum(1 for conexao in conexoes if conexao.is_idle())
+        return cls(
+            conexoes     = len(conexoes),
+            ativas       = len(conexoes) - ociosas,
+            ociosas      = ociosas,
+            aguardando   = sum(1 for request in list(getattr(pool, "_requests", ())) if request.is_queued()),
+            max_conexoes = max_conexoes if max_conexoes is not None else getattr(pool, "_max_connections", None),
+            saturacoes   = saturacoes,
+        )
+
+    @staticmethod
+    def Saturado (transport: httpx.BaseTransport | httpx.AsyncBaseTransport, max_conexoes: int | None) -> bool:
+        """Checar, apenas pelo `connections` público do pool, se um novo request precisará aguardar por uma conexão livre
+        - Limite de `max_conexoes` atingido e nenhuma conexão ociosa
+        - `False` caso o `transport` não possua um pool ou o limite seja desconhecido"""
+        pool = getattr(transport, "_pool", None)
+        if max_conexoes is None or pool is None or not hasattr(pool, "connections"):
+            return False
+        conexoes = pool.connections
+        return len(conexoes) >= max_conexoes and not any(conexao.is_idle() for conexao in conexoes)
+
+    @property
+    def saturado (self) -> bool:
+        """Checar se um novo request precisará aguardar por uma conexão livre
+        - Apenas com o limite de conexões atingido, pois abaixo do limite uma nova conexão é aberta.
+        Requests recém adicionados ao pool aparecem brevemente na fila antes de receberem a conexão"""
+        return (
+            self.max_conexoes is not None
+            and self.conexoes >= self.max_conexoes
+            and (self.aguardando > 0 or self.ociosas == 0)
+        )
+
+__all__ = [
+    "opcoes_conexao",
+    "EstatisticasPool",
+]
@@ -0,0 +1,310 @@
+# std
+from __future__ import annotations
+import re, json, typing, importlib
+from xml.etree import ElementTree
+
+type BACKENDS = typing.Literal["orjson", "msgspec", "json"]
+
+def _carregar_backend () -> tuple[BACKENDS, typing.Callable[[bytes], typing.Any]]:
+    """Obter o decodificador `json` mais rápido disponível
+    - Ordem `orjson`, `msgspec` e fallback para o `json` da biblioteca padrão"""
+    for nome, funcao in (("orjson", "loads"), ("msgspec.json", "decode")):
+        try: modulo = importlib.import_module(nome)
+        except ImportError: continue
+        return typing.cast(BACKENDS, nome.split(".")[0]), getattr(modulo, funcao)
+    return "json", json.loads
+
+BACKEND, _decodificar = _carregar_backend()
+"""Nome do backend utilizado para decodificar o `json` das respostas
+- `orjson` ou `msgspec` caso instalados, senão o `json` da biblioteca padrão"""
+
+_ESPACOS = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*("?)', re.DOTALL)
+_ESCALAR = re.compile(rb"[^ \t\n\r,:\[\]{}\"]+")
+_CONTEUDO = re.compile(rb'(?:[^"\[\]{}]++|"(?:[^"\\]++|\\.)*+")*+', re.DOTALL)
+"""Conteúdo até o próximo delimitador de objeto ou array, incluindo as strings completas, ou até uma string incompleta"""
+
+def _padrao_container (profundidade: int) -> re.Pattern[bytes]:
+    """Objeto ou array completo com até `profundidade` níveis de aninhamento
+    - Permite avançar sobre um item em uma única chamada do `re`, sem acompanhar cada delimitador"""
+    conteudo = rb'(?:[^"\[\]{}]++|"(?:[^"\\]++|\\.)*+")*+'
+    container = rb"[\[{]" + conteudo + rb"[\]}]"
+    for _ in range(profundidade - 1):
+        conteudo = rb'(?:[^"\[\]{}]++|"(?:[^"\\]++|\\.)*+"|' + container + rb")*+"
+        container = rb"[\[{]" + conteudo + rb"[\]}]"
+    return re.compile(container, re.DOTALL)
+
+_CONTAINER = _padrao_container(8)
+
+def decodificar_json (conteudo: bytes, encoding: str | None = None) -> typing.Any:
+    """Decodificar o `conteudo` json utilizando o `BACKEND`
+    - `encoding` diferente de `utf-8` é decodificado pelo `json` da biblioteca padrão
+    - Realizado fallback para o `json` da biblioteca padrão caso o `BACKEND` não aceite o conteúdo, como inteiros maiores que 64 bits
+    - `ValueError` caso o conteúdo seja inválido"""
+    if encoding and encoding.lower().replace("_", "-") not in ("utf-8", "utf8", "ascii", "us-ascii"):
+        return json.loads(conteudo.decode(encoding))
+
+    try: return _decodificar(conteudo)
+    except Exception: return json.loads(conteudo)
+
+class _LeitorJSON:
+    """Leitura sob demanda das `partes` de um json com os métodos para avançar sobre os valores sem decodificá-los
+    - Buffer mantém apenas o conteúdo a partir do `marcador`, ou da posição atual, descartando o que já foi lido"""
+
+    def __init__ (self, partes: typing.Iterable[bytes]) -> None:
+        self._partes = iter(partes)
+        self.buffer = b""
+        self.posicao = 0
+        self.marcador: int | None = None
+        self.fim = False
+
+    def carregar (self) -> bool:
+        """Adicionar a próxima parte ao buffer
+        - `False` caso não existam mais partes"""
+        for parte in self._partes:
+            if not parte: continue
+            descartar = self.posicao if self.marcador is None else self.marcador
+            self.buffer = self.buffer[descartar:] + bytes(parte)
+            self.posicao -= descartar
+            if self.marcador is not None: self.marcador -= descartar
+            return True
+        self.fim = True
+        return False
+
+    def espiar (self) -> int | None:
+        """Pular os espaços e obter o próximo byte sem consumi-lo
+        - `None` ao final do conteúdo"""
+        while True:
+            self.posicao = typing.cast(re.Match[bytes], _ESPACOS.match(self.buffer, self.posicao)).end()
+            if self.posicao < len(self.buffer): return self.buffer[self.posicao]
+            if not self.carregar(): return None
+
+    def esperar (self, caracteres: bytes) -> int:
+        """Consumir o próximo byte, que deve estar entre os `caracteres`"""
+        atual = self.espiar()
+        if atual is None or atual not in caracteres:
+            encontrado = "fim do conteúdo" if atual is None else repr(chr(atual))
+            raise ValueError(f"Esperado um dos caracteres {caracteres.decode()!r} no json, encontrado {encontrado}")
+        self.posicao += 1
+        return atual
+
+    def string (self) -> bytes:
+        """Consumir a string json da posição atual, com as aspas"""
+        while True:
+            encontrado = _STRING.match(self.buffer, self.posicao)
+            if encontrado and encontrado.group(1):
+                self.posicao = encontrado.end()
+                return encontrado.group()
+            if not self.carregar(): raise ValueError("String json incompleta")
+
+    def pular (self) -> None:
+        """Avançar sobre o valor json da posição atual sem decodificá-lo"""
+        atual = self.espiar()
+        if atual is None: raise ValueError("Esperado um valor json, encontrado fim do conteúdo")
+        if atual == 0x22: # "
+            self.string()
+            return
+        if atual in b"[{":
+            self._pular_container()
+            return
+        while True:
+            encontrado = _ESCALAR.match(self.buffer, self.posicao)
+            if encontrado is None: raise ValueError(f"Valor json inválido {chr(atual)!r}")
+            if encontrado.end() < len(self.buffer) or not self.carregar():
+                self.posicao = encontrado.end()
+                return
+
+    def _pular_container (self) -> None:
+        if encontrado := _CONTAINER.match(self.buffer, self.posicao):
+            self.posicao = encontrado.end()
+            return
+
+        # Aninhamento maior que o `_CONTAINER` ou container incompleto no buffer
+        profundidade = 0
+        while True:
+            fim = typing.cast(re.Match[bytes], _CONTEUDO.match(self.buffer, self.posicao)).end()
+            if fim == len(self.buffer) or self.buffer[fim] == 0x22: # "
+                # Final do buffer ou string incompleta
+                self.posicao = fim
+                if not self.carregar(): raise ValueError("Objeto ou array json incompleto")
+                continue
+
+            profundidade += 1 if self.buffer[fim] in b"[{" else -1
+            self.posicao = fim + 1
+            if profundidade == 0: return
+
+def iterar_array_json (partes: typing.Iterable[bytes] | bytes | str,
+                       caminho_json: str = "",
+                       encoding: str | None = None) -> typing.Iterator[typing.Any]:
+    """Iterar sobre os itens de um array json presente no `caminho_json` do conteúdo fornecido em `partes`
+    - `partes` lidas sob demanda, memória proporcional ao maior item e não ao tamanho do conteúdo. Ex: `response.iter_bytes(TAMANHO_CHUNK)`
+    - Os limites de cada item são encontrados sem decodificá-lo. O item é decodificado pelo `BACKEND` apenas quando solicitado
+    - `caminho_json` chaves separadas por `.` até o array. Ex: `"items"`, `"instance.property_values"`
+    - `caminho_json=""` o próprio conteúdo deve ser um array
+    - Chave não encontrada ou com valor `null` resulta em nenhum item, mesmo comportamento do `.get(chave, [])`
+    - `encoding` deve ser compatível com `ascii`, como `utf-8` e `latin-1`
+    - `ValueError` caso o conteúdo seja inválido ou o valor do caminho não seja um array"""
+    if isinstance(partes, str): partes = (partes.encode(),)
+    elif isinstance(partes, (bytes, bytearray, memoryview)): partes = (bytes(partes),)
+    leitor = _LeitorJSON(partes)
+
+    for chave in filter(None, caminho_json.split(".")):
+        if leitor.espiar() != 0x7B: # {
+            raise ValueError(f"Esperado um objeto json ao procurar a chave '{chave}'")
+        leitor.esperar(b"{")
+        if leitor.espiar() == 0x7D: return # }
+
+        while True:
+            if leitor.espiar() != 0x22: raise ValueError(f"Esperado uma chave json ao procurar a chave '{chave}'")
+            nome = json.loads(leitor.string())
+            leitor.esperar(b":")
+            if nome == chave: break
+            leitor.pular()
+            if leitor.esperar(b",}") == 0x7D: return # }
+
+    atual = leitor.espiar()
+    if atual == 0x6E: # n
+        leitor.pular()
+        return
+    if atual != 0x5B: # [
+        raise ValueError(f"Esperado um array json no caminho '{caminho_json}'")
+
+    leitor.esperar(b"[")
+    if leitor.espiar() == 0x5D: return # ]
+    while True:
+        leitor.marcador = leitor.posicao
+        leitor.pular()
+        item = leitor.buffer[leitor.marcador : leitor.posicao]
+        leitor.marcador = None
+        yield decodificar_json(item, encoding)
+        if leitor.esperar(b",]") == 0x5D: return # ]
+
+_NAMESPACE = re.compile(r"\{[^}]*\}")
+_CARACTERES_XPATH = re.compile(r"[\[\]@()=|]")
+
+class CaminhoXML:
+    """Subconjunto de `xpath` aceito pelo `ExtratorXML`
+    - `tag` elemento em qualquer profundidade. Mesmo que `//tag`
+    - `pai/tag` elemento `tag` filho direto de um `pai`, em qualquer profundidade
+    - `/raiz/pai/tag` caminho absoluto a partir da raiz
+    - `*` corresponde a qualquer elemento no segmento
+    - Namespaces e prefixos ignorados na comparação. Ex: `{http://www.portalfiscal.inf.br/nfe}det` e `nfe:det` equivalem a `det`
+    - `ValueError` caso o caminho utilize predicados, atributos ou eixos fora do subconjunto"""
+
+    absoluto: bool
+    segmentos: tuple[str, ...]
+
+    def __init__ (self, caminho: str) -> None:
+        normalizado = _NAMESPACE.sub("", caminho.strip())
+        self.absoluto = normalizado.startswith("/") and not normalizado.startswith("//")
+        self.segmentos = tuple(
+            segmento.rpartition(":")[2]
+            for segmento in normalizado.removeprefix("//").removeprefix("/").split("/")
+        )
+        if not all(self.segmentos) or any(_CARACTERES_XPATH.search(segmento) for segmento in self.segmentos):
+            raise ValueError(f"Caminho xml '{caminho}' fora do subconjunto suportado: 'tag', 'pai/tag', '/raiz/tag' e '*'")
+
+    def __repr__ (self) -> str:
+        return f"<CaminhoXML {'/' if self.absoluto else ''}{'/'.join(self.segmentos)}>"
+
+    def corresponde (self, nomes: list[str]) -> bool:
+        """Checar se a pilha de `nomes` locais, da raiz até o elemento, corresponde ao caminho"""
+        quantidade = len(self.segmentos)
+        if len(nomes) < quantidade or (self.absoluto and len(nomes) != quantidade):
+            return False
+        return all(
+            segmento == "*" or segmento == nome
+            for segmento, nome in zip(self.segmentos, nomes[-quantidade:])
+        )
+
+class ExtratorXML:
+    """Parse incremental de um documento xml, alimentado em partes, extraindo apenas os elementos dos `caminhos`
+    - Elementos extraídos e os já processados fora de uma extração são desanexados da árvore conforme o parse avança
+    - Memória proporcional aos elementos extraídos e não ao tamanho do documento
+    - Elementos aninhados a um elemento extraído são retornados apenas dentro dele
+    - `ValueError` para os caminhos inválidos, veja `CaminhoXML`
+
+    ### Exemplo
+    ```
+    extrator = ExtratorXML("infNFe/det")
+    for parte in partes:
+        for elemento in extrator.alimentar(parte):
+            print(elemento.findtext("{*}prod/{*}xProd"))
+    for elemento in extrator.finalizar(): ...
+    ```"""
+
+    caminhos: tuple[CaminhoXML, ...]
+
+    def __init__ (self, *caminhos: str) -> None:
+        if not caminhos: raise ValueError("Necessário informar ao menos um caminho xml")
+        self.caminhos = tuple(CaminhoXML(caminho) for caminho in caminhos)
+        self._parser = ElementTree.XMLPullParser(("start", "end"))
+        self._nomes = list[str]()
+        self._elementos = list[ElementTree.Element]()
+        self._extraindo = False
+        self._internos = 0
+        """Quantidade de elementos abertos dentro do elemento em extração"""
+        # Nomes finais dos caminhos para descartar rapidamente os elementos que não correspondem
+        finais = { caminho.segmentos[-1] for caminho in self.caminhos }
+        self._finais = None if "*" in finais else finais
+
+    def alimentar (self, parte: bytes | str) -> typing.Iterator[ElementTree.Element]:
+        """Alimentar o parser com a `parte` do documento e obter os elementos concluídos
+        - `xml.etree.ElementTree.ParseError` caso o conteúdo seja inválido"""
+        self._parser.feed(parte)
+        return self._processar()
+
+    def finalizar (self) -> typing.Iterator[ElementTree.Element]:
+        """Finalizar o parse e obter os elementos restantes
+        - `xml.etree.ElementTree.ParseError` caso o documento esteja incompleto"""
+        self._parser.close()
+        return self._processar()
+
+    def _processar (self) -> typing.Iterator[ElementTree.Element]:
+        nomes, elementos, caminhos, finais = self._nomes, self._elementos, self.caminhos, self._finais
+        for evento, elemento in self._parser.read_events():
+            elemento = typing.cast(ElementTree.Element, elemento)
+
+            # Dentro da extração apenas a profundidade é acompanhada
+            if self._extraindo:
+                if evento == "start": self._internos += 1
+                elif self._internos: self._internos -= 1
+                else:
+                    self._extraindo = False
+                    if elementos: del elementos[-1][:]
+                    yield elemento
+                continue
+
+            if evento == "start":
+                tag = elemento.tag
+                nome = tag[tag.find("}") + 1:]
+                if (finais is None or nome in finais) and any(caminho.corresponde([*nomes, nome]) for caminho in caminhos):
+                    self._extraindo = True
+                    continue
+                nomes.append(nome)
+                elementos.append(elemento)
+                continue
+
+            nomes.pop()
+            elementos.pop()
+            # Os irmãos anteriores já foram concluídos e não são mais necessários
+            if elementos: del elementos[-1][:]
+            else: elemento.clear()
+
+def iterar_xml (partes: typing.Iterable[bytes | str], *caminhos: str) -> typing.Iterator[ElementTree.Element]:
+    """Iterar sobre os elementos dos `caminhos` de um documento xml fornecido em `partes`
+    - Os eventos de cada parte são acumulados pelo parser, manter as `partes` limitadas. Ex: `response.iter_bytes(TAMANHO_CHUNK)`
+    - Veja `ExtratorXML` e `CaminhoXML`"""
+    extrator = ExtratorXML(*caminhos)
+    for parte in partes:
+        yield from extrator.alimentar(parte)
+    yield from extrator.finalizar()
+
+__all__ = [
+    "BACKEND",
+    "CaminhoXML",
+    "ExtratorXML",
+    "iterar_xml",
+    "decodificar_json",
+    "iterar_array_json",
+]
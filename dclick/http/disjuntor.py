@@ -0,0 +1,172 @@
+# std
+from __future__ import annotations
+import time, typing, threading
+from collections import deque
+# interno
+import dclick
+# externo
+import bot
+import httpx
+
+type ESTADOS_DISJUNTOR = typing.Literal["FECHADO", "ABERTO", "SEMI_ABERTO"]
+
+class DisjuntorAberto (httpx.TransportError):
+    """Request recusado sem envio pois o `Disjuntor` do serviço está aberto
+    - Extensão do `httpx.TransportError` para ser tratado como as demais falhas de conexão"""
+
+    def __init__ (self, nome: str, segundos_restantes: float, requisicao: httpx.Request | None = None) -> None:
+        super().__init__(
+            f"Disjuntor '{nome}' aberto. Requests recusados por mais {segundos_restantes:.1f} segundos",
+            request = requisicao
+        )
+        self.nome = nome
+        self.segundos_restantes = segundos_restantes
+
+class Disjuntor:
+    """Circuit breaker para falhar rapidamente enquanto um serviço está indisponível
+    - `FECHADO` requests enviados normalmente e os resultados registrados na `janela` de segundos
+    - `ABERTO` ao atingir a `taxa_falhas` com no mínimo `minimo_chamadas` na janela. Requests recusados com `DisjuntorAberto` durante o `tempo_aberto`
+    - `SEMI_ABERTO` após o `tempo_aberto`, um request de teste é enviado por vez. Sucesso fecha o disjuntor e falha o abre novamente
+    - Resultados registrados com o token obtido no `permitir()`. Resultados de requests permitidos antes da última mudança de estado
+    são desconsiderados e, no `SEMI_ABERTO`, apenas o resultado do request de teste é considerado
+    - Falhas são os erros de transporte e as respostas `5xx`
+    - Mudanças de estado registradas no `dclick.logger`
+    - Aplicado antes de cada tentativa, incluindo as retentativas
+    - Opt-in pelo atributo `ClienteHttp.disjuntor` ou pela variável `disjuntor = True` da seção do .ini no `ClienteHttp.FromConfig()`
+
+    ### Exemplo
+    ```
+    client = ClienteHttp(base_url="https://httpbin.org")
+    client.disjuntor = Disjuntor("httpbin", taxa_falhas=0.5, tempo_aberto=30)
+    try: client.get("/status/503")
+    except DisjuntorAberto: ...
+    ```"""
+
+    nome: str
+    taxa_falhas: float
+    """Proporção de falhas, entre `0` e `1`, na janela para abrir o disjuntor"""
+    minimo_chamadas: int
+    """Quantidade mínima de chamadas na janela para avaliar a `taxa_falhas`"""
+    janela: float
+    """Segundos de histórico considerados no cálculo da `taxa_falhas`"""
+    tempo_aberto: float
+    """Segundos em que o disjuntor permanece aberto antes do request de teste"""
+    estado: ESTADOS_DISJUNTOR
+    recusados: int
+    """Quantidade de requests recusados com o disjuntor aberto"""
+
+    def __init__ (self, nome: str,
+                        taxa_falhas: float = 0.5,
+                        minimo_chamadas: int = 10,
+                        janela: float = 60.0,
+                        tempo_aberto: float = 30.0) -> None:
+        assert 0 < taxa_falhas <= 1, "Taxa de falhas deve estar entre 0 e 1"
+        self.nome = nome
+        self.taxa_falhas = taxa_falhas
+        self.minimo_chamadas = minimo_chamadas
+        self.janela = janela
+        self.tempo_aberto = tempo_aberto
+        self.estado = "FECHADO"
+        self.recusados = 0
+        self._lock = threading.Lock()
+        self._resultados = deque[tuple[float, bool]]()
+        self._aberto_em = 0.0
+        self._tokens = 0
+        """Último token emitido pelo `permitir()`"""
+        self._inicio_estado = 0
+        """Último token emitido antes da mudança para o estado atual"""
+        self._teste: int | None = None
+        """Token do request de teste em andamento no `SEMI_ABERTO`"""
+        self._teste_em: float | None = None
+
+    def __repr__ (self) -> str:
+        return f"<Disjuntor {self.nome!r} estado={self.estado} recusados={self.recusados}>"
+
+    @classmethod
+    def FromConfig (cls, secao: str) -> Disjuntor | None:
+        """Criar o disjuntor conforme a `secao` do .ini
+        - `None` caso a variável `disjuntor` não esteja presente ou seja `False`
+        - Variáveis utilizadas `[secao] -> [disjuntor: False, disjuntor_taxa_falhas: 0.5, disjuntor_minimo_chamadas: 10, disjuntor_janela: 60, disjuntor_tempo_aberto: 30]`"""
+        config = getattr(bot.config, secao)
+        if not config.obter_ou("disjuntor", False):
+            return None
+        return cls(
+            secao,
+            taxa_falhas     = config.obter_ou("disjuntor_taxa_falhas", 0.5),
+            minimo_chamadas = config.obter_ou("disjuntor_minimo_chamadas", 10),
+            janela          = config.obter_ou("disjuntor_janela", 60.0),
+            tempo_aberto    = config.obter_ou("disjuntor_tempo_aberto", 30.0),
+        )
+
+    def permitir (self, requisicao: httpx.Request) -> int:
+        """Checar se a `requisicao` pode ser enviada
+        - Retornado o token para o `registrar()` do resultado
+        - `DisjuntorAberto` caso o disjuntor esteja aberto ou com o request de teste em andamento"""
+        with self._lock:
+            agora = time.monotonic()
+            if self.estado == "ABERTO":
+                restante = self._aberto_em + self.tempo_aberto - agora
+                if restante > 0:
+                    self.recusados += 1
+                    raise DisjuntorAberto(self.nome, restante, requisicao)
+                self._alterar_estado("SEMI_ABERTO")
+
+            if self.estado == "SEMI_ABERTO":
+                # request de teste sem resultado após o `tempo_aberto` é desconsiderado
+                if self._teste_em is not None and agora - self._teste_em < self.tempo_aberto:
+                    self.recusados += 1
+                    raise DisjuntorAberto(self.nome, self._teste_em + self.tempo_aberto - agora, requisicao)
+                self._teste_em = agora
+
+            self._tokens += 1
+            if self.estado == "SEMI_ABERTO": self._teste = self._tokens
+            return self._tokens
+
+    def registrar (self, token: int, sucesso: bool) -> None:
+        """Registrar o resultado do request permitido com o `token` do `permitir()`"""
+        with self._lock:
+            agora = time.monotonic()
+            # resultado de um request permitido antes da mudança de estado, como um request lento enviado antes da abertura
+            if token <= self._inicio_estado: return
+
+            if self.estado == "SEMI_ABERTO":
+                if token != self._teste: return
+                self._teste = self._teste_em = None
+                if sucesso:
+                    self._resultados.clear()
+                    self._alterar_estado("FECHADO")
+                else: self._abrir(agora)
+                return
+
+            self._resultados.append((agora, sucesso))
+            while self._resultados and agora - self._resultados[0][0] > self.janela:
+                self._resultados.popleft()
+            if len(self._resultados) < self.minimo_chamadas:
+                return
+
+            falhas = sum(1 for _, resultado in self._resultados if not resultado)
+            if falhas / len(self._resultados) >= self.taxa_falhas:
+                self._abrir(agora)
+
+    def registrar_response (self, token: int, response: httpx.Response) -> None:
+        """Registrar o resultado conforme o status code da `response`"""
+        self.registrar(token, not response.is_server_error)
+
+    def _abrir (self, agora: float) -> None:
+        self._aberto_em = agora
+        self._resultados.clear()
+        self._alterar_estado("ABERTO")
+
+    def _alterar_estado (self, estado: ESTADOS_DISJUNTOR) -> None:
+        anterior, self.estado = self.estado, estado
+        self._inicio_estado = self._tokens
+        mensagem = f"Disjuntor '{self.nome}' alterado de {anterior} para {estado}"
+        if estado == "ABERTO":
+            dclick.logger.alertar(f"{mensagem}. Requests recusados pelos próximos {self.tempo_aberto} segundos")
+        else: dclick.logger.informar(mensagem)
+
+__all__ = [
+    "Disjuntor",
+    "DisjuntorAberto",
+    "ESTADOS_DISJUNTOR",
+]
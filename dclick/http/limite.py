@@ -0,0 +1,117 @@
+# std
+from __future__ import annotations
+import math, time, typing, asyncio, threading
+# externo
+import bot
+import httpx
+
+class _Balde:
+    """Token bucket com reserva antecipada dos tokens
+    - Tokens negativos representam os requests já reservados aguardando"""
+
+    def __init__ (self, taxa: float, rajada: int) -> None:
+        self.taxa = taxa
+        self.rajada = rajada
+        self.tokens = float(rajada)
+        self.atualizado = time.monotonic()
+
+    def reservar (self) -> float:
+        """Reservar um token e obter a espera, em segundos, até ele estar disponível"""
+        agora = time.monotonic()
+        self.tokens = min(float(self.rajada), self.tokens + (agora - self.atualizado) * self.taxa)
+        self.atualizado = agora
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.taxa
+
+class LimiteTaxa:
+    """Limitador de requests por segundo no lado do cliente (token bucket) por host e, opcionalmente, por prefixo de rota
+    - `taxa` requests por segundo sustentados
+    - `rajada` requests permitidos de imediato antes de aplicar a `taxa`
+    - `rotas` limites específicos por prefixo do path `{ "/v1/documents": (taxa, rajada) }`. Utilizado o prefixo mais longo
+    - Seguro entre threads e entre tasks do `asyncio`, a espera é reservada na ordem de chegada
+    - Aplicado antes de cada tentativa, incluindo as retentativas
+    - Habilitado pelo atributo `ClienteHttp.limite` ou pela variável `limite_requisicoes` da seção do .ini no `ClienteHttp.FromConfig()`
+
+    ### Exemplo
+    ```
+    client = ClienteHttp(base_url="https://httpbin.org")
+    client.limite = LimiteTaxa(5, rajada=10, rotas={ "/anything": (1, 1) })
+    ```"""
+
+    taxa: float
+    rajada: int
+    rotas: dict[str, tuple[float, int]]
+    esperas: int
+    """Quantidade de requests que precisaram aguardar"""
+    segundos_espera: float
+    """Soma das esperas aplicadas"""
+
+    def __init__ (self, taxa: float,
+                        rajada: int | None = None,
+                        rotas: typing.Mapping[str, tuple[float, int]] | None = None) -> None:
+        assert taxa > 0, "Taxa de requests por segundo deve ser maior que 0"
+        self.taxa = taxa
+        self.rajada = rajada or max(1, math.ceil(taxa))
+        self.rotas = dict(sorted((rotas or {}).items(), key=lambda rota: len(rota[0]), reverse=True))
+        self.esperas = 0
+        self.segundos_espera = 0.0
+        self._lock = threading.Lock()
+        self._baldes = dict[str, _Balde]()
+
+    def __repr__ (self) -> str:
+        return f"<LimiteTaxa taxa={self.taxa}/s rajada={self.rajada} esperas={self.esperas} segundos_espera={self.segundos_espera:.2f}>"
+
+    @classmethod
+    def FromConfig (cls, secao: str) -> LimiteTaxa | None:
+        """Criar o limitador conforme a `secao` do .ini
+        - `None` caso a variável `limite_requisicoes` não esteja presente
+        - Variáveis utilizadas `[secao] -> [limite_requisicoes, limite_rajada, limite_rotas]`
+            - `limite_rotas` no formato `prefixo=taxa:rajada` separados por `,`. Ex: `/v1/documents=2:4, /v1/tasks=5`"""
+        config = getattr(bot.config, secao)
+        taxa = config.obter_ou("limite_requisicoes", 0.0)
+        if not taxa: return None
+
+        rotas = dict[str, tuple[float, int]]()
+        for item in filter(None, (item.strip() for item in config.obter_ou("limite_rotas", "").split(","))):
+            try:
+                prefixo, valor = (parte.strip() for parte in item.split("="))
+                taxa_texto, _, rajada_texto = valor.partition(":")
+                taxa_rota = float(taxa_texto)
+                rotas[prefixo] = (taxa_rota, int(rajada_texto) if rajada_texto else max(1, math.ceil(taxa_rota)))
+            except ValueError as erro:
+                raise ValueError(f"Rota '{item}' inválida na variável 'limite_rotas' da seção [{secao}]") from erro
+
+        return cls(taxa, config.obter_ou("limite_rajada", 0) or None, rotas)
+
+    def reservar (self, requisicao: httpx.Request) -> float:
+        """Reservar a vez da `requisicao` e obter a espera, em segundos, antes do envio"""
+        url = requisicao.url
+        host = f"{url.host}:{url.port}" if url.port else url.host
+        prefixo = next((prefixo for prefixo in self.rotas if url.path.startswith(prefixo)), None)
+
+        with self._lock:
+            chave = f"{host}{prefixo or ''}"
+            balde = self._baldes.get(chave)
+            if balde is None:
+                taxa, rajada = self.rotas[prefixo] if prefixo else (self.taxa, self.rajada)
+                balde = self._baldes[chave] = _Balde(taxa, rajada)
+
+            espera = balde.reservar()
+            if espera > 0:
+                self.esperas += 1
+                self.segundos_espera += espera
+            return espera
+
+    def aguardar (self, requisicao: httpx.Request) -> None:
+        """Aguardar a vez da `requisicao` bloqueando a thread"""
+        if (espera := self.reservar(requisicao)) > 0:
+            time.sleep(espera)
+
+    async def aaguardar (self, requisicao: httpx.Request) -> None:
+        """Aguardar a vez da `requisicao` sem bloquear o event loop"""
+        if (espera := self.reservar(requisicao)) > 0:
+            await asyncio.sleep(espera)
+
+__all__ = [
+    "LimiteTaxa",
+]
@@ -0,0 +1,52 @@
+# std
+from __future__ import annotations
+import typing
+# externo
+import httpx
+
+if typing.TYPE_CHECKING:
+    from dclick.http.setup import ResponseHttp
+
+type ItemLote = httpx.Request | tuple[str, str]
+"""Request do lote: `httpx.Request` criado pelo `client.build_request()` ou `(metodo, url)`"""
+
+class ResultadoLote:
+    """Resultado de um item do `ClienteHttp.executar_lote()`"""
+
+    indice: int
+    """Posição do item no lote"""
+    requisicao: httpx.Request
+    response: ResponseHttp | None
+    """Resposta do item
+    - `None` caso tenha ocorrido erro"""
+    erro: Exception | None
+    """Erro capturado ao executar o item"""
+
+    def __init__ (self, indice: int,
+                        requisicao: httpx.Request,
+                        response: ResponseHttp | None = None,
+                        erro: Exception | None = None) -> None:
+        self.indice = indice
+        self.requisicao = requisicao
+        self.response = response
+        self.erro = erro
+
+    def __repr__ (self) -> str:
+        resultado = self.response.status_code if self.response is not None else type(self.erro).__name__
+        return f"<ResultadoLote {self.indice} {self.requisicao.method} {str(self.requisicao.url)!r} resultado={resultado!r}>"
+
+    @property
+    def sucesso (self) -> bool:
+        """Checar se o item obteve uma resposta de sucesso"""
+        return self.response is not None and self.response.is_success
+
+    def esperar_response (self) -> ResponseHttp:
+        """Obter a `response` ou lançar o `erro` capturado"""
+        if self.erro is not None: raise self.erro
+        assert self.response is not None
+        return self.response
+
+__all__ = [
+    "ItemLote",
+    "ResultadoLote",
+]
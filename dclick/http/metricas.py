@@ -0,0 +1,221 @@
+# std
+from __future__ import annotations
+import re, time, bisect, typing, threading
+from collections import Counter
+# interno
+import dclick
+# externo
+import httpx
+
+type FASES = typing.Literal["conexao", "tls", "espera", "download", "total"]
+FASES_MEDIDAS: tuple[FASES, ...] = ("conexao", "tls", "espera", "download", "total")
+"""Fases medidas em cada tentativa de request
+- `conexao` resolução DNS e conexão TCP, apenas quando uma nova conexão é aberta
+- `tls` handshake TLS, apenas quando uma nova conexão é aberta
+- `espera` envio do request até o recebimento dos headers da resposta (time-to-first-byte)
+- `download` leitura do corpo da resposta
+- `total` envio completo da tentativa, incluindo a espera por uma conexão livre no pool"""
+
+_SEGMENTO_ID = re.compile(
+    r"^(?:\d+"                                                                   # numérico
+    r"|[0-9a-fA-F]{24}"                                                          # ObjectId
+    r"|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}" # UUID
+    r"|(?=[^/]*\d)[0-9A-Za-z_\-]{16,})$"                                         # token longo com dígitos
+)
+
+def template_rota (path: str) -> str:
+    """Obter o template da rota substituindo os segmentos identificadores por `{id}`
+    - Ex: `/v1/tasks/657c52624464f9074c5f19cc/documents` -> `/v1/tasks/{id}/documents`"""
+    return "/".join("{id}" if _SEGMENTO_ID.match(segmento) else segmento for segmento in path.split("/"))
+
+class Histograma:
+    """Histograma de latências em buckets fixos de milissegundos"""
+
+    LIMITES_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+    """Limite superior, em milissegundos, de cada bucket. O último bucket é ilimitado"""
+
+    def __init__ (self) -> None:
+        self.contagens = [0] * (len(self.LIMITES_MS) + 1)
+        self.total = 0
+        self.soma_ms = 0.0
+        self.maximo_ms = 0.0
+
+    def __repr__ (self) -> str:
+        return f"<Histograma total={self.total} p50={self.percentil(50):.0f}ms p95={self.percentil(95):.0f}ms maximo={self.maximo_ms:.0f}ms>"
+
+    def adicionar (self, segundos: float) -> None:
+        ms = segundos * 1000
+        self.contagens[bisect.bisect_left(self.LIMITES_MS, ms)] += 1
+        self.total += 1
+        self.soma_ms += ms
+        self.maximo_ms = max(self.maximo_ms, ms)
+
+    def percentil (self, percentil: float) -> float:
+        """Estimativa, pelo limite superior do bucket, do `percentil` em milissegundos
+        - Limitado ao `maximo_ms` observado"""
+        if not self.total: return 0.0
+        alvo, acumulado = self.total * percentil / 100, 0
+        for indice, contagem in enumerate(self.contagens):
+            acumulado += contagem
+            if acumulado >= alvo:
+                limite = self.LIMITES_MS[indice] if indice < len(self.LIMITES_MS) else self.maximo_ms
+                return min(float(limite), self.maximo_ms)
+        return self.maximo_ms
+
+    def as_dict (self) -> dict[str, typing.Any]:
+        return {
+            "total": self.total,
+            "media_ms": round(self.soma_ms / self.total, 2) if self.total else 0.0,
+            "p50_ms": self.percentil(50),
+            "p95_ms": self.percentil(95),
+            "p99_ms": self.percentil(99),
+            "maximo_ms": round(self.maximo_ms, 2),
+            "buckets_ms": dict(zip([*map(str, self.LIMITES_MS), "inf"], self.contagens)),
+        }
+
+class EstatisticasRota:
+    """Estatísticas agregadas de um `servico`, método e template de rota"""
+
+    def __init__ (self) -> None:
+        self.requests = 0
+        self.erros = Counter[str]()
+        self.status = Counter[int]()
+        self.bytes_enviados = 0
+        self.bytes_recebidos = 0
+        self.fases = { fase: Histograma() for fase in FASES_MEDIDAS }
+
+    def as_dict (self) -> dict[str, typing.Any]:
+        return {
+            "requests": self.requests,
+            "erros": dict(self.erros),
+            "status": { str(status): quantidade for status, quantidade in sorted(self.status.items()) },
+            "bytes_enviados": self.bytes_enviados,
+            "bytes_recebidos": self.bytes_recebidos,
+            "fases": { fase: histograma.as_dict() for fase, histograma in self.fases.items() if histograma.total },
+        }
+
+class Medicao:
+    """Medição das fases de uma tentativa de request pela extensão `trace` do `httpcore`"""
+
+    FASES_TRACE: typing.ClassVar[dict[str, FASES]] = {
+        "connect_tcp": "conexao",
+        "start_tls": "tls",
+        "receive_response_body": "download",
+    }
+    """Etapas do `httpcore` medidas diretamente como uma fase"""
+
+    def __init__ (self) -> None:
+        self.inicio = time.perf_counter()
+        self.fases = dict[FASES, float]()
+        self._inicios = dict[str, float]()
+
+    def trace (self, nome: str, info: dict[str, typing.Any]) -> None:
+        """Callback da extensão `trace` do `httpcore`. Ex: `http11.receive_response_headers.complete`"""
+        _, _, evento = nome.partition(".")
+        etapa, _, momento = evento.rpartition(".")
+        agora = time.perf_counter()
+
+        if momento == "started":
+            self._inicios[etapa] = agora
+        elif momento == "complete" and etapa in self._inicios:
+            if etapa in self.FASES_TRACE:
+                self.fases[self.FASES_TRACE[etapa]] = agora - self._inicios[etapa]
+            elif etapa == "receive_response_headers" and "send_request_headers" in self._inicios:
+                self.fases["espera"] = agora - self._inicios["send_request_headers"]
+
+    async def atrace (self, nome: str, info: dict[str, typing.Any]) -> None:
+        """Callback assíncrono da extensão `trace` do `httpcore`"""
+        self.trace(nome, info)
+
+class HistoricoHttp:
+    """Histórico agregado das medições de requests por `servico`, método e template de rota
+    - Alimentado pelos clientes com o atributo `metricas` definido ou com a variável `metricas = True` da seção do .ini no `ClienteHttp.FromConfig()`
+    - `estatisticas()` para gerar o log do resumo ao final da execução, junto do `HistoricoTracers.estatisticas()`
+    - Seguro entre threads
+
+    ### Exemplo
+    ```
+    from dclick.http import historico_http
+    historico_http.estatisticas()
+    ```"""
+
+    dados: dict[tuple[str, str, str], EstatisticasRota]
+
+    def __init__ (self) -> None:
+        self.dados = {}
+        self._lock = threading.Lock()
+
+    def __repr__ (self) -> str:
+        return f"<HistoricoHttp rotas={len(self.dados)} requests={sum(rota.requests for rota in self.dados.values())}>"
+
+    def iniciar (self, requisicao: httpx.Request, assincrono: bool = False) -> Medicao:
+        """Iniciar a medição da tentativa da `requisicao` pela extensão `trace`"""
+        medicao = Medicao()
+        requisicao.extensions["trace"] = medicao.atrace if assincrono else medicao.trace
+        return medicao
+
+    def registrar (self, servico: str,
+                         requisicao: httpx.Request,
+                         medicao: Medicao,
+                         response: httpx.Response | None = None,
+                         erro: Exception | None = None) -> None:
+        """Registrar o resultado da tentativa medida pela `medicao`
+        - `response` deve estar com o corpo lido ou fechado para o `download` e os `bytes_recebidos`"""
+        medicao.fases["total"] = time.perf_counter() - medicao.inicio
+        chave = (servico, requisicao.method, template_rota(requisicao.url.path))
+        enviados = int(requisicao.headers.get("Content-Length", 0) or 0)
+
+        with self._lock:
+            rota = self.dados.get(chave)
+            if rota is None: rota = self.dados[chave] = EstatisticasRota()
+            rota.requests += 1
+            rota.bytes_enviados += enviados
+            if response is not None:
+                rota.status[response.status_code] += 1
+                rota.bytes_recebidos += response.num_bytes_downloaded
+            if erro is not None:
+                rota.erros[type(erro).__name__] += 1
+            for fase, segundos in medicao.fases.items():
+                rota.fases[fase].adicionar(segundos)
+
+    def as_dict (self) -> list[dict[str, typing.Any]]:
+        """Estatísticas em formato serializável para `json`"""
+        with self._lock:
+            return [
+                { "servico": servico, "metodo": metodo, "rota": rota } | estatisticas.as_dict()
+                for (servico, metodo, rota), estatisticas in sorted(self.dados.items())
+            ]
+
+    def estatisticas (self) -> list[dict[str, typing.Any]]:
+        """Gerar um log por rota com as estatísticas dos requests e as latências `p50/p95` por fase
+        - Retornado o `as_dict()`"""
+        dados = self.as_dict()
+        for item in dados:
+            partes = [
+                f"Estatísticas HTTP | {item['servico']} {item['metodo']} {item['rota']}",
+                f"Requests({item['requests']})",
+                f"Status({', '.join(f'{status}: {quantidade}' for status, quantidade in item['status'].items())})",
+            ]
+            if item["erros"]:
+                partes.append(f"Erros({', '.join(f'{nome}: {quantidade}' for nome, quantidade in item['erros'].items())})")
+            partes.extend(
+                f"{fase}(p50 {histograma['p50_ms']:.0f}ms, p95 {histograma['p95_ms']:.0f}ms)"
+                for fase, histograma in item["fases"].items()
+            )
+            partes.append(f"Bytes(enviados {item['bytes_enviados']}, recebidos {item['bytes_recebidos']})")
+            dclick.logger.informar(" | ".join(partes))
+        return dados
+
+    def limpar (self) -> None:
+        with self._lock: self.dados.clear()
+
+historico_http = HistoricoHttp()
+"""Histórico das medições de requests compartilhado pelos clientes dos pacotes"""
+
+__all__ = [
+    "Medicao",
+    "Histograma",
+    "HistoricoHttp",
+    "template_rota",
+    "historico_http",
+]
@@ -0,0 +1,461 @@
+# std
+from __future__ import annotations
+import os, time, atexit, typing, asyncio, weakref, functools, threading
+# interno
+import dclick
+# externo
+import bot
+import httpx
+
+if typing.TYPE_CHECKING:
+    from dclick.http.setup import ClienteHttp, ClienteHttpAsync
+
+type FabricaCliente = typing.Callable[[], ClienteHttp]
+"""Função sem argumentos que cria o cliente, normalmente pelo `ClienteHttp.FromConfig()`"""
+type FabricaClienteAsync = typing.Callable[[], ClienteHttpAsync]
+"""Função sem argumentos que cria o cliente assíncrono, normalmente pelo `ClienteHttpAsync.FromConfig()`"""
+
+def impressao_configuracao (secao: str) -> str:
+    """Obter a representação das variáveis da `secao` do .ini para detectar alterações
+    - Vazio caso a seção não esteja presente"""
+    try: valores = getattr(bot.config, secao).as_dict()
+    except Exception: return ""
+    itens = valores.items() if isinstance(valores, typing.Mapping) else valores
+    return repr(sorted((str(chave), str(valor)) for chave, valor in itens))
+
+class _PoolCompartilhado:
+    """Transporte com o pool de conexões e a quantidade de clientes que o utilizam
+    - Fechado ao liberar a última referência e não pode ser adquirido novamente"""
+
+    def __init__ (self, transporte: httpx.HTTPTransport) -> None:
+        self.transporte = transporte
+        self.referencias = 0
+        self.fechado = False
+        self._lock = threading.Lock()
+
+    def adquirir (self) -> bool:
+        """Registrar mais um cliente utilizando o pool
+        - `False` caso o pool já tenha sido fechado"""
+        with self._lock:
+            if self.fechado: return False
+            self.referencias += 1
+            return True
+
+    def liberar (self) -> None:
+        """Liberar a referência de um cliente e fechar o transporte na última"""
+        with self._lock:
+            self.referencias -= 1
+            if self.referencias > 0 or self.fechado: return
+            self.fechado = True
+        self.transporte.close()
+
+class TransporteCompartilhado (httpx.BaseTransport):
+    """Transporte de um cliente com o pool de conexões compartilhado entre os clientes de mesmo host e opções de conexão
+    - Obtido pelo `RegistroClientes.transporte()`, um por cliente
+    - `close()` libera a referência do cliente apenas uma vez, mesmo que chamado novamente pelo `close()` explícito e pela coleta do cliente
+    - Pool fechado apenas quando o último cliente que o utiliza for fechado"""
+
+    def __init__ (self, pool: _PoolCompartilhado) -> None:
+        self._compartilhado = pool
+        self._liberado = False
+        self._lock = threading.Lock()
+
+    def __repr__ (self) -> str:
+        return f"<TransporteCompartilhado referencias={self.referencias}{' liberado' if self._liberado else ''}>"
+
+    @property
+    def transporte (self) -> httpx.HTTPTransport:
+        return self._compartilhado.transporte
+
+    @property
+    def referencias (self) -> int:
+        """Quantidade de clientes abertos utilizando o pool"""
+        return self._compartilhado.referencias
+
+    @property
+    def _pool (self) -> typing.Any:
+        # Utilizado pelo `EstatisticasPool.Obter()`
+        return getattr(self.transporte, "_pool", None)
+
+    @property
+    def fechado (self) -> bool:
+        return self._compartilhado.fechado
+
+    def handle_request (self, request: httpx.Request) -> httpx.Response:
+        return self.transporte.handle_request(request)
+
+    def close (self) -> None:
+        with self._lock:
+            if self._liberado: return
+            self._liberado = True
+        self._compartilhado.liberar()
+
+def _fechar_transportes (transportes: list[httpx.BaseTransport]) -> None:
+    for transporte in transportes:
+        try: transporte.close()
+        except Exception: pass
+
+def _fechar_ao_liberar (cliente: ClienteHttp) -> None:
+    """Fechar os transportes do `cliente` substituído apenas quando a última referência for liberada
+    - Threads ainda utilizando o cliente anterior concluem os seus requests normalmente"""
+    transportes = [getattr(cliente, "_transport"), *getattr(cliente, "_mounts").values()]
+    weakref.finalize(cliente, _fechar_transportes, [transporte for transporte in transportes if transporte is not None])
+
+class _Registro:
+    """Cliente registrado e o seu estado no processo atual"""
+
+    def __init__ (self, nome: str, fabrica: FabricaCliente, secao: str) -> None:
+        self.nome = nome
+        self.fabrica = fabrica
+        self.secao = secao
+        self.cliente: ClienteHttp | None = None
+        self.impressao = ""
+        self.verificado_em = 0.0
+        """`time.monotonic()` da última comparação da `impressao`"""
+        self.criado_em = 0.0
+        self.criacoes = 0
+
+class _ClienteLoop:
+    """Cliente assíncrono criado para um event loop"""
+
+    def __init__ (self, cliente: ClienteHttpAsync, impressao: str) -> None:
+        self.cliente = cliente
+        self.impressao = impressao
+        self.verificado_em = time.monotonic()
+
+class _RegistroAsync:
+    """Cliente assíncrono registrado e os clientes criados por event loop no processo atual
+    - As conexões de um cliente assíncrono pertencem ao event loop que as criou"""
+
+    def __init__ (self, nome: str, fabrica: FabricaClienteAsync, secao: str) -> None:
+        self.nome = nome
+        self.fabrica = fabrica
+        self.secao = secao
+        self.clientes = weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ClienteLoop]()
+        self.criacoes = 0
+
+class RegistroClientes:
+    """Registro central dos clientes http dos pacotes, responsável pelo ciclo de vida dos clientes
+    - Cliente criado pela fábrica registrada apenas no primeiro `obter()`
+    - Clientes fechados ao final da execução pelo `atexit`
+    - Cliente recriado ao alterar as variáveis da seção do .ini, verificadas no máximo a cada `intervalo_verificacao` segundos
+    ou imediatamente após o `recarregar()`. O cliente anterior é fechado quando a sua última referência for liberada
+    - Cliente recriado no processo filho após um `fork`, sem fechar as conexões que pertencem ao processo pai.
+    Permite utilizar os clientes a partir de workers do `multiprocessing`
+    - `transporte()` compartilha o pool de conexões entre os clientes de mesmo host e opções de conexão
+    - `cliente_async()` e `obter_async()` para os clientes assíncronos, criados por event loop com o mesmo ciclo de vida.
+    Fechados ao encerrar o event loop pelo `asyncio.run()` ou pelo `fechar_async()`. Fora do `asyncio.run()`, como no `loop.run_until_complete()`,
+    o `fechar_async()` é obrigatório antes do `loop.close()`: os clientes de loops fechados são descartados com um alerta e as conexões não são encerradas
+    - `estatisticas()` para gerar o log do resumo de cada cliente ao final da execução
+    - Seguro entre threads
+
+    ### Exemplo
+    ```
+    from dclick.http import registro_clientes, ClienteHttp
+
+    @registro_clientes.cliente("httpbin")
+    def client_httpbin () -> ClienteHttp:
+        return ClienteHttp.FromConfig("httpbin", base_url="https://httpbin.org", compartilhar_transporte=True)
+
+    client_httpbin().get("/get")
+    registro_clientes.estatisticas()
+    ```"""
+
+    intervalo_verificacao: float = 1.0
+    """Segundos entre as comparações das variáveis da seção do .ini no `obter()`"""
+
+    def __init__ (self) -> None:
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._registros = dict[str, _Registro]()
+        self._registros_async = dict[str, _RegistroAsync]()
+        self._encerramentos = weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task[None]]()
+        self._substituidos: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list[ClienteHttpAsync]] = weakref.WeakKeyDictionary()
+        """Clientes assíncronos substituídos por event loop, fechados no seu encerramento"""
+        self._transportes = dict[tuple[typing.Any, ...], _PoolCompartilhado]()
+        atexit.register(self.fechar)
+        # `register_at_fork` indisponível no Windows, onde o `multiprocessing` utiliza `spawn`
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._descartar)
+
+    def __repr__ (self) -> str:
+        abertos = sum(1 for registro in self._registros.values() if registro.cliente is not None)
+        return f"<RegistroClientes registrados={len(self._registros)} abertos={abertos} transportes={len(self._transportes)}>"
+
+    def __contains__ (self, nome: str) -> bool:
+        return nome in self._registros or nome in self._registros_async
+
+    def registrar (self, nome: str, fabrica: FabricaCliente, secao: str | None = None) -> None:
+        """Registrar a `fabrica` do cliente `nome`
+        - `secao` do .ini monitorada para recriar o cliente. Padrão o próprio `nome`
+        - Cliente já criado com o mesmo `nome` é fechado quando a sua última referência for liberada"""
+        with self._lock:
+            anterior = self._registros.get(nome)
+            self._registros[nome] = _Registro(nome, fabrica, secao or nome)
+        if anterior is not None and anterior.cliente is not None:
+            _fechar_ao_liberar(anterior.cliente)
+
+    def cliente (self, nome: str, secao: str | None = None) -> typing.Callable[[FabricaCliente], FabricaCliente]:
+        """Decorator para registrar a fábrica do cliente `nome`
+        - A função decorada passa a retornar o cliente gerenciado pelo `obter()`"""
+        def decorator (fabrica: FabricaCliente) -> FabricaCliente:
+            self.registrar(nome, fabrica, secao)
+            @functools.wraps(fabrica)
+            def obter () -> ClienteHttp:
+                return self.obter(nome)
+            return obter
+        return decorator
+
+    def obter (self, nome: str) -> ClienteHttp:
+        """Obter o cliente `nome`, criando caso necessário
+        - `KeyError` caso o `nome` não esteja registrado"""
+        if self._pid != os.getpid(): self._descartar()
+        registro = self._registros.get(nome)
+        if registro is None:
+            raise KeyError(f"Cliente http '{nome}' não registrado")
+
+        cliente = registro.cliente
+        agora = time.monotonic()
+        if cliente is not None and not cliente.is_closed and agora - registro.verificado_em < self.intervalo_verificacao:
+            return cliente
+
+        impressao = impressao_configuracao(registro.secao)
+        with self._lock:
+            registro.verificado_em = agora
+            if registro.cliente is not None and not registro.cliente.is_closed and registro.impressao == impressao:
+                return registro.cliente
+            anterior = registro.cliente
+            if anterior is not None and not anterior.is_closed:
+                dclick.logger.informar(f"Configuração da seção [{registro.secao}] alterada. Recriando o cliente http '{nome}'")
+            cliente = registro.cliente = registro.fabrica()
+            registro.impressao = impressao
+            registro.criado_em = time.time()
+            registro.criacoes += 1
+
+        if anterior is not None and not anterior.is_closed: _fechar_ao_liberar(anterior)
+        return cliente
+
+    def recarregar (self) -> None:
+        """Comparar as variáveis da seção do .ini de todos os clientes no próximo `obter()`
+        - Utilizar após recarregar o .ini para recriar os clientes sem aguardar o `intervalo_verificacao`"""
+        with self._lock:
+            for registro in self._registros.values(): registro.verificado_em = 0.0
+
+    def registrar_async (self, nome: str, fabrica: FabricaClienteAsync, secao: str | None = None) -> None:
+        """Registrar a `fabrica` do cliente assíncrono `nome`
+        - `secao` do .ini monitorada para recriar o cliente. Padrão o próprio `nome`
+        - Clientes já criados com o mesmo `nome` continuam abertos até o encerramento dos seus event loops"""
+        with self._lock:
+            anterior = self._registros_async.get(nome)
+            registro = self._registros_async[nome] = _RegistroAsync(nome, fabrica, secao or nome)
+            if anterior is not None: registro.clientes.update(anterior.clientes)
+
+    def cliente_async (self, nome: str, secao: str | None = None) -> typing.Callable[[FabricaClienteAsync], FabricaClienteAsync]:
+        """Decorator para registrar a fábrica do cliente assíncrono `nome`
+        - A função decorada passa a retornar o cliente do event loop atual gerenciado pelo `obter_async()`"""
+        def decorator (fabrica: FabricaClienteAsync) -> FabricaClienteAsync:
+            self.registrar_async(nome, fabrica, secao)
+            @functools.wraps(fabrica)
+            def obter () -> ClienteHttpAsync:
+                return self.obter_async(nome)
+            return obter
+        return decorator
+
+    def obter_async (self, nome: str) -> ClienteHttpAsync:
+        """Obter o cliente assíncrono `nome` do event loop atual, criando caso necessário
+        - Necessário um event loop em execução
+        - Cliente fechado automaticamente apenas ao encerrar o `asyncio.run()`. Nos demais casos utilizar o `fechar_async()` antes de fechar o event loop
+        - Cliente anterior à alteração da seção do .ini mantido aberto até o encerramento do event loop,
+        pois pode estar em uso por outras tasks
+        - `KeyError` caso o `nome` não esteja registrado"""
+        loop = asyncio.get_running_loop()
+        if self._pid != os.getpid(): self._descartar()
+        registro = self._registros_async.get(nome)
+        if registro is None:
+            raise KeyError(f"Cliente http assíncrono '{nome}' não registrado")
+
+        atual = registro.clientes.get(loop)
+        agora = time.monotonic()
+        if atual is not None and not atual.cliente.is_closed and agora - atual.verificado_em < self.intervalo_verificacao:
+            return atual.cliente
+        self._descartar_loops_fechados()
+
+        impressao = impressao_configuracao(registro.secao)
+        if atual is not None and not atual.cliente.is_closed:
+            atual.verificado_em = agora
+            if atual.impressao == impressao: return atual.cliente
+            dclick.logger.informar(f"Configuração da seção [{registro.secao}] alterada. Recriando o cliente http assíncrono '{nome}'")
+            self._substituidos.setdefault(loop, []).append(atual.cliente)
+
+        atual = registro.clientes[loop] = _ClienteLoop(registro.fabrica(), impressao)
+        registro.criacoes += 1
+        self._encerramento(loop)
+        return atual.cliente
+
+    async def fechar_async (self, nome: str | None = None) -> None:
+        """Fechar o cliente assíncrono `nome`, ou todos caso `None`, do event loop atual
+        - Os clientes são recriados no próximo `obter_async()`"""
+        loop = asyncio.get_running_loop()
+        if self._pid != os.getpid(): return self._descartar()
+        with self._lock:
+            registros = [self._registros_async[nome]] if nome is not None else list(self._registros_async.values())
+            clientes = [atual.cliente for registro in registros if (atual := registro.clientes.pop(loop, None)) is not None]
+            if nome is None: clientes.extend(self._substituidos.pop(loop, []))
+        for cliente in clientes:
+            try: await cliente.aclose()
+            except Exception: pass
+
+    def _encerramento (self, loop: asyncio.AbstractEventLoop) -> asyncio.Task[None]:
+        """Task que aguarda o cancelamento realizado pelo `asyncio.run()` ao encerrar o `loop` para fechar os clientes assíncronos
+        - O `loop.close()` sem o cancelamento mantém a task pendente, e o `loop` referenciado por ela, até o `_descartar_loops_fechados()`"""
+        task = self._encerramentos.get(loop)
+        if task is not None and not task.done(): return task
+
+        async def aguardar_encerramento () -> None:
+            try: await loop.create_future()
+            # Apenas o cancelamento, a task descartada do loop fechado recebe o `GeneratorExit` sem loop para o `fechar_async()`
+            except asyncio.CancelledError:
+                self._encerramentos.pop(loop, None)
+                await self.fechar_async()
+                raise
+
+        task = self._encerramentos[loop] = loop.create_task(aguardar_encerramento(), name="registro_clientes_encerramento")
+        return task
+
+    def _descartar_loops_fechados (self) -> None:
+        """Descartar as tasks de encerramento e os clientes assíncronos dos event loops fechados sem o `fechar_async()`
+        - Gerado um alerta com os nomes dos clientes não fechados, pois as suas conexões não podem mais ser encerradas"""
+        nomes = list[str]()
+        with self._lock:
+            for loop in [loop for loop in list(self._encerramentos.keys()) if loop.is_closed()]:
+                task = self._encerramentos.pop(loop)
+                # Evitar o log "Task was destroyed but it is pending" da task que nunca será executada
+                task._log_destroy_pending = False # type: ignore
+                for registro in self._registros_async.values():
+                    atual = registro.clientes.pop(loop, None)
+                    if atual is not None and not atual.cliente.is_closed: nomes.append(registro.nome)
+                nomes.extend("cliente substituído" for cliente in self._substituidos.pop(loop, []) if not cliente.is_closed)
+        if nomes:
+            dclick.logger.alertar(f"Clientes http assíncronos não fechados antes do encerramento do event loop: {', '.join(nomes)}. "
+                                  "Utilizar o 'fechar_async()' quando o event loop não for gerenciado pelo 'asyncio.run()'")
+
+    def transporte (self, base_url: httpx.URL | str,
+                          http2: bool = False,
+                          limits: httpx.Limits = httpx.Limits(),
+                          verify: typing.Any = True,
+                          proxy: str | None = None) -> TransporteCompartilhado | None:
+        """Obter o transporte compartilhado para o host da `base_url` e opções de conexão
+        - `proxy` url do proxy utilizado pelo transporte. Pools com e sem proxy não são compartilhados
+        - `None` caso a `base_url` não possua host
+        - Retornado um transporte por cliente com uma referência adquirida do pool, liberada pelo `close()` do cliente"""
+        url = httpx.URL(base_url)
+        if not url.host: return None
+
+        chave = (
+            url.scheme, url.host, url.port, http2,
+            limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry,
+            verify if isinstance(verify, (str, bool)) else id(verify), proxy,
+        )
+        if self._pid != os.getpid(): self._descartar()
+        with self._lock:
+            pool = self._transportes.get(chave)
+            if pool is None or not pool.adquirir():
+                pool = self._transportes[chave] = _PoolCompartilhado(
+                    httpx.HTTPTransport(http2=http2, limits=limits, verify=verify, proxy=proxy)
+                )
+                pool.adquirir()
+            return TransporteCompartilhado(pool)
+
+    def fechar (self, nome: str | None = None) -> None:
+        """Fechar o cliente `nome` ou todos os clientes caso `None`
+        - Os clientes são recriados no próximo `obter()`
+        - Com `None`, realizado pelo `atexit`, também descarta os clientes assíncronos dos event loops fechados sem o `fechar_async()`"""
+        if self._pid != os.getpid(): return self._descartar()
+        if nome is None: self._descartar_loops_fechados()
+        with self._lock:
+            registros = [self._registros[nome]] if nome is not None else list(self._registros.values())
+            clientes = [registro.cliente for registro in registros if registro.cliente is not None]
+            for registro in registros: registro.cliente = None
+        for cliente in clientes:
+            try: cliente.close()
+            except Exception: pass
+
+    def as_dict (self) -> list[dict[str, typing.Any]]:
+        """Estatísticas dos clientes abertos em formato serializável para `json`"""
+        with self._lock: registros = list(self._registros.values())
+        dados = list[dict[str, typing.Any]]()
+        for registro in registros:
+            cliente = registro.cliente
+            if cliente is None or cliente.is_closed: continue
+
+            pool = cliente.estatisticas_pool()
+            item: dict[str, typing.Any] = {
+                "nome": registro.nome,
+                "secao": registro.secao,
+                "criacoes": registro.criacoes,
+                "segundos_aberto": round(time.time() - registro.criado_em, 2),
+                "transporte_compartilhado": isinstance(getattr(cliente, "_transport"), TransporteCompartilhado),
+                "pool": { campo: getattr(pool, campo) for campo in ("conexoes", "ativas", "ociosas", "aguardando", "max_conexoes", "saturacoes") },
+            }
+            if cliente.cache is not None:
+                item["cache"] = { "acertos": cliente.cache.acertos, "revalidacoes": cliente.cache.revalidacoes,
+                                  "falhas": cliente.cache.falhas, "taxa_acerto": round(cliente.cache.taxa_acerto, 4) }
+            if cliente.coalescencia is not None:
+                item["coalescencia"] = { "economizadas": cliente.coalescencia.economizadas }
+            if cliente.limite is not None:
+                item["limite"] = { "esperas": cliente.limite.esperas, "segundos_espera": round(cliente.limite.segundos_espera, 3) }
+            if cliente.disjuntor is not None:
+                item["disjuntor"] = { "estado": cliente.disjuntor.estado, "recusados": cliente.disjuntor.recusados }
+            if cliente.compressao is not None:
+                item["compressao"] = { "requests": cliente.compressao.requests, "economia": round(cliente.compressao.economia, 4) }
+            dados.append(item)
+        return dados
+
+    def estatisticas (self) -> list[dict[str, typing.Any]]:
+        """Gerar um log por cliente aberto com as estatísticas do pool e dos componentes habilitados
+        - Retornado o `as_dict()`"""
+        dados = self.as_dict()
+        for item in dados:
+            pool = item["pool"]
+            partes = [
+                f"Estatísticas cliente http | {item['nome']}",
+                f"Criações({item['criacoes']})",
+                f"Pool(conexoes {pool['conexoes']}/{pool['max_conexoes']}, saturacoes {pool['saturacoes']}"
+                f"{', compartilhado' if item['transporte_compartilhado'] else ''})",
+            ]
+            if "cache" in item: partes.append(f"Cache(taxa_acerto {item['cache']['taxa_acerto']:.1%})")
+            if "coalescencia" in item: partes.append(f"Coalescência(economizadas {item['coalescencia']['economizadas']})")
+            if "limite" in item: partes.append(f"Limite(esperas {item['limite']['esperas']}, segundos {item['limite']['segundos_espera']})")
+            if "disjuntor" in item: partes.append(f"Disjuntor({item['disjuntor']['estado']}, recusados {item['disjuntor']['recusados']})")
+            if "compressao" in item: partes.append(f"Compressão(economia {item['compressao']['economia']:.1%})")
+            dclick.logger.informar(" | ".join(partes))
+        return dados
+
+    def _descartar (self) -> None:
+        """Descartar os clientes e transportes herdados do processo pai sem fechá-los
+        - As conexões pertencem ao processo pai e fechá-las no filho afetaria os requests do pai"""
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._transportes = {}
+        self._encerramentos = weakref.WeakKeyDictionary()
+        self._substituidos = weakref.WeakKeyDictionary()
+        for registro in self._registros_async.values():
+            registro.clientes = weakref.WeakKeyDictionary()
+            registro.criacoes = 0
+        for registro in self._registros.values():
+            registro.cliente = None
+            registro.impressao = ""
+            registro.verificado_em = 0.0
+            registro.criacoes = 0
+
+registro_clientes = RegistroClientes()
+"""Registro dos clientes http compartilhado pelos pacotes"""
+
+__all__ = [
+    "FabricaCliente",
+    "FabricaClienteAsync",
+    "RegistroClientes",
+    "registro_clientes",
+    "TransporteCompartilhado",
+    "impressao_configuracao",
+]
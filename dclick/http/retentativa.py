@@ -0,0 +1,183 @@
+# std
+from __future__ import annotations
+import time, random, typing
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+# externo
+import bot
+import httpx
+
+class Tentativa:
+    """Registro de uma tentativa de request realizada pelo `ClienteHttp`"""
+
+    numero: int
+    """Número da tentativa começando em `1`"""
+    metodo: str
+    url: str
+    segundos: float
+    """Latência da tentativa em segundos"""
+    status_code: int | None
+    """Status code da resposta
+    - `None` caso a tentativa tenha terminado em erro"""
+    erro: str | None
+    """Nome do erro de transporte, caso ocorrido"""
+
+    def __init__ (self, numero: int, metodo: str, url: str, segundos: float,
+                        status_code: int | None = None,
+                        erro: str | None = None) -> None:
+        self.numero = numero
+        self.metodo = metodo
+        self.url = url
+        self.segundos = segundos
+        self.status_code = status_code
+        self.erro = erro
+
+    @classmethod
+    def Registrar (cls, requisicao: httpx.Request,
+                        numero: int,
+                        inicio: float,
+                        response: httpx.Response | None = None,
+                        erro: Exception | None = None) -> Tentativa:
+        """Criar o registro da tentativa `numero` iniciada em `inicio` pelo `time.perf_counter()`"""
+        return cls(
+            numero, requisicao.method, str(requisicao.url), time.perf_counter() - inicio,
+            status_code = response.status_code if response is not None else None,
+            erro = type(erro).__name__ if erro is not None else None
+        )
+
+    def __repr__ (self) -> str:
+        resultado = self.status_code if self.erro is None else self.erro
+        return f"<Tentativa {self.numero} {self.metodo} {self.url!r} resultado={resultado!r} segundos={self.segundos:.3f}>"
+
+class PoliticaRetentativa:
+    """Política declarativa de retentativa para o `ClienteHttp` e `ClienteHttpAsync`
+    - Backoff exponencial `backoff * 2^(tentativa - 1)` limitado ao `backoff_maximo`
+    - `jitter` aplica uma espera aleatória entre `0` e o backoff calculado
+    - Header `Retry-After` da resposta é respeitado, caso não ultrapasse o `backoff_maximo`
+    - Apenas os `metodos` idempotentes são repetidos, exceto se o request possuir o header `header_idempotencia`
+    - Requests com o corpo em stream, como uploads de arquivos, não são repetidos pois o corpo já foi consumido
+    - Utilizar `PoliticaRetentativa.FromConfig()` para sobrescrever os valores pela seção do .ini
+
+    ### Exemplo
+    ```
+    client = ClienteHttp(base_url="https://httpbin.org")
+    client.retentativa = PoliticaRetentativa(tentativas=5, backoff=1)
+    response = client.get("/status/503")
+    print(response.tentativas)
+    ```"""
+
+    tentativas: int
+    """Quantidade máxima de tentativas, incluindo a primeira"""
+    backoff: float
+    """Base em segundos do backoff exponencial"""
+    backoff_maximo: float
+    """Espera máxima em segundos entre as tentativas"""
+    jitter: bool
+    """Aplicar o `full jitter` na espera calculada"""
+    status: frozenset[int]
+    """Status code de resposta que são passíveis de retentativa"""
+    metodos: frozenset[str]
+    """Métodos http considerados idempotentes"""
+    header_idempotencia: str
+    """Header que torna qualquer método passível de retentativa"""
+    erros: tuple[type[Exception], ...]
+    """Erros de transporte passíveis de retentativa"""
+
+    def __init__ (self, tentativas: int = 3,
+                        backoff: float = 0.5,
+                        backoff_maximo: float = 30.0,
+                        *,
+                        jitter: bool = True,
+                        status: typing.Iterable[int] = (429, 502, 503, 504),
+                        metodos: typing.Iterable[str] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+                        header_idempotencia: str = "Idempotency-Key",
+                        erros: tuple[type[Exception], ...] = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)) -> None:
+        assert tentativas >= 1, "Quantidade de tentativas deve ser no mínimo 1"
+        self.tentativas = tentativas
+        self.backoff = backoff
+        self.backoff_maximo = backoff_maximo
+        self.jitter = jitter
+        self.status = frozenset(status)
+        self.metodos = frozenset(metodo.upper() for metodo in metodos)
+        self.header_idempotencia = header_idempotencia
+        self.erros = erros
+
+    def __repr__ (self) -> str:
+        return f"<PoliticaRetentativa tentativas={self.tentativas} backoff={self.backoff} backoff_maximo={self.backoff_maximo}>"
+
+    @classmethod
+    def FromConfig (cls, secao: str, **padrao: typing.Any) -> PoliticaRetentativa:
+        """Criar a política com os valores da `secao` do .ini
+        - `padrao` valores utilizados caso não estejam presentes na seção
+        - Variáveis utilizadas `[secao] -> [retentativas: 3, retentativa_backoff: 0.5, retentativa_backoff_maximo: 30.0]`"""
+        politica = cls(**padrao)
+        config = getattr(bot.config, secao)
+        politica.tentativas = config.obter_ou("retentativas", politica.tentativas)
+        politica.backoff = config.obter_ou("retentativa_backoff", politica.backoff)
+        politica.backoff_maximo = config.obter_ou("retentativa_backoff_maximo", politica.backoff_maximo)
+        return politica
+
+    def idempotente (self, metodo: str, headers: httpx.Headers) -> bool:
+        """Checar se o request pode ser repetido com segurança"""
+        return metodo.upper() in self.metodos or self.header_idempotencia in headers
+
+    def calcular_espera (self, numero: int, response: httpx.Response | None = None) -> float | None:
+        """Calcular a espera em segundos antes da próxima tentativa após a tentativa `numero`
+        - `None` caso o `Retry-After` ultrapasse o `backoff_maximo`"""
+        if response is not None and (retry_after := self.retry_after(response)) is not None:
+            return retry_after if retry_after <= self.backoff_maximo else None
+
+        espera = min(self.backoff * 2 ** (numero - 1), self.backoff_maximo)
+        return random.uniform(0, espera) if self.jitter else espera
+
+    @staticmethod
+    def reproduzivel (requisicao: httpx.Request) -> bool:
+        """Checar se o corpo da `requisicao` pode ser enviado novamente
+        - Corpos em `bytes`, `str`, `json` e formulário são mantidos em memória pelo `httpx`
+        - Corpos em stream, como geradores e arquivos, são consumidos no envio e não podem ser repetidos"""
+        try: requisicao.content
+        except httpx.RequestNotRead: return False
+        return True
+
+    def deve_retentar (self, requisicao: httpx.Request,
+                             numero: int,
+                             response: httpx.Response | None = None,
+                             erro: Exception | None = None) -> bool:
+        """Checar se deve ser feito uma nova tentativa da `requisicao` após a tentativa `numero`
+        - Necessário restar tentativas, o request ser `idempotente()` e `reproduzivel()`
+        - Necessário o `erro` estar nos `erros` ou o status code da `response` estar nos `status`"""
+        if numero >= self.tentativas or not self.idempotente(requisicao.method, requisicao.headers):
+            return False
+        if erro is not None and not isinstance(erro, self.erros):
+            return False
+        if response is not None and response.status_code not in self.status:
+            return False
+        return self.reproduzivel(requisicao)
+
+    def proxima_espera (self, requisicao: httpx.Request,
+                              numero: int,
+                              response: httpx.Response | None = None,
+                              erro: Exception | None = None) -> float | None:
+        """Obter a espera em segundos para realizar uma nova tentativa
+        - `None` caso não deva ser feito uma nova tentativa. Veja `deve_retentar()`"""
+        if not self.deve_retentar(requisicao, numero, response, erro):
+            return None
+        return self.calcular_espera(numero, response)
+
+    @staticmethod
+    def retry_after (response: httpx.Response) -> float | None:
+        """Obter a espera, em segundos, informada no header `Retry-After`
+        - Aceito os formatos em segundos e data http"""
+        valor = response.headers.get("Retry-After", "").strip()
+        if not valor: return None
+        if valor.isdigit(): return float(valor)
+
+        try: data = parsedate_to_datetime(valor)
+        except Exception: return None
+        if data.tzinfo is None: data = data.replace(tzinfo=timezone.utc)
+        return max(0.0, (data - datetime.now(timezone.utc)).total_seconds())
+
+__all__ = [
+    "Tentativa",
+    "PoliticaRetentativa",
+]
@@ -1,21 +1,58 @@
 # std
-import typing
+import time, typing, asyncio, hashlib, functools, contextlib
+from xml.etree import ElementTree
+from concurrent.futures import ThreadPoolExecutor, as_completed
+# interno
+import dclick
+from dclick.http.retentativa import Tentativa, PoliticaRetentativa
+from dclick.http.conexao import opcoes_conexao, EstatisticasPool
+from dclick.http.decodificador import ExtratorXML, decodificar_json, iterar_array_json
+from dclick.http.cache import CacheHttp, EntradaCache
+from dclick.http.coalescencia import Coalescencia
+from dclick.http.limite import LimiteTaxa
+from dclick.http.disjuntor import Disjuntor
+from dclick.http.metricas import Medicao, HistoricoHttp, historico_http
+from dclick.http.cassete import transporte_cassete
+from dclick.http.lote import ItemLote, ResultadoLote
+from dclick.http.compressao import CompressaoRequest
+from dclick.http.registro import registro_clientes
 # externo
+import bot
 import httpx
 import httpx._types as types
 from httpx._client import USE_CLIENT_DEFAULT, UseClientDefault
-from bot.estruturas import DictNormalizado
+from bot.estruturas import DictNormalizado, Caminho
 from bot.formatos import ElementoXML, Unmarshaller, validar
 
 type METODOS_HTTP = typing.Literal["HEAD", "OPTIONS", "GET", "POST", "PUT", "PATCH", "DELETE"]
 
+TAMANHO_CHUNK = 64 * 1024
+"""Tamanho padrão, em bytes, dos chunks lidos de uma resposta em `stream`"""
+
+class _HeadersResponse (DictNormalizado[str]):
+    """`DictNormalizado` dos headers da resposta com o `get_list()` do `httpx.Headers`
+    - Utilizado pelo `httpx` para decodificar o corpo conforme o `Content-Encoding`"""
+
+    def __init__ (self, itens: dict[str, str], originais: httpx.Headers | None) -> None:
+        super().__init__(itens)
+        self.originais = originais if originais is not None else httpx.Headers()
+
+    def get_list (self, key: str, split_commas: bool = False) -> list[str]:
+        return self.originais.get_list(key, split_commas)
+
 class ResponseHttp (httpx.Response):
-    """Response extensão do `httpx.Response` com métodos para facilitar validação de uma resposta http"""
+    """Response extensão do `httpx.Response` com métodos para facilitar validação de uma resposta http
+    - Retornado tanto pelo `ClienteHttp` quanto pelo `ClienteHttpAsync`"""
+
+    tentativas: list[Tentativa]
+    """Tentativas realizadas pelo cliente até a obtenção desta resposta
+    - Possui a latência de cada tentativa"""
 
     @classmethod
-    def New (cls, response: httpx.Response) -> typing.Self:
+    def New (cls, response: httpx.Response, tentativas: list[Tentativa] | None = None) -> typing.Self:
         obj = super().__new__(cls)
         obj.__dict__ = response.__dict__
+        obj.tentativas = tentativas or []
 
         try: setattr(obj, "_headers", response.headers)
         except Exception: pass
@@ -27,17 +64,26 @@ class ResponseHttp (httpx.Response):
         """Headers com chaves normalizadas
         - `Chaves` dos headers em `lower` e feito `strip()`
         - `Valores` dos headers transformados em `str`
-        - Caso existam múltiplos headers de mesmo nome, os valores serão concatenados por `,`"""
-        return {
-            str(key).lower().strip(): str(value)
-            for key, value in dict(getattr(self, "_headers", {})).items()
-        }
+        - Caso existam múltiplos headers de mesmo nome, os valores serão concatenados por `,`
+        - Normalizado uma única vez por resposta. Retornado uma cópia que pode ser alterada"""
+        return dict(self._itens_headers())
 
     @property
     def headers (self) -> DictNormalizado[str]:
         """Headers com chaves normalizadas
-        - Caso existam múltiplos headers de mesmo nome, os valores serão concatenados por `,`"""
-        return DictNormalizado(self.headers_dict)
+        - Caso existam múltiplos headers de mesmo nome, os valores serão concatenados por `,`
+        - Normalizado uma única vez por resposta. Retornado uma cópia que pode ser alterada"""
+        return _HeadersResponse(self._itens_headers(), self.__dict__.get("_headers"))
+
+    def _itens_headers (self) -> dict[str, str]:
+        """Itens normalizados dos headers, calculados no primeiro acesso e nunca expostos para alteração"""
+        try: return self.__dict__["_headers_itens"]
+        except KeyError:
+            headers: httpx.Headers | None = self.__dict__.get("_headers")
+            itens = self.__dict__["_headers_itens"] = {
+                key.strip(): value for key, value in (headers.items() if headers is not None else ())
+            }
+            return itens
 
     def esperar_sucesso (self, mensagem: str | None = None) -> typing.Self:
         """Fazer o `assert` se o `response.status_code` de retorno é `2xx`
@@ -95,6 +141,33 @@ class ResponseHttp (httpx.Response):
         """Ler todo o conteúdo do corpo e decodificar para `str`"""
         return self.text
 
+    def salvar_em (self, caminho: Caminho | str, *,
+                         tamanho_chunk: int = TAMANHO_CHUNK,
+                         algoritmo_hash: str | None = None) -> str | None:
+        """Salvar o corpo da resposta no `caminho` em partes de `tamanho_chunk` bytes
+        - Memória limitada ao `tamanho_chunk` caso o request tenha sido feito via `stream()`
+        - `algoritmo_hash` para calcular o hash do conteúdo durante a escrita. Ex: `sha256`, `md5`
+        - Retornado o `hexdigest` caso `algoritmo_hash` seja informado"""
+        digest = hashlib.new(algoritmo_hash) if algoritmo_hash else None
+        destino = caminho.path if isinstance(caminho, Caminho) else caminho
+        with open(destino, "wb") as writer:
+            for chunk in self.iter_bytes(tamanho_chunk):
+                writer.write(chunk)
+                if digest: digest.update(chunk)
+        return digest.hexdigest() if digest else None
+
+    async def asalvar_em (self, caminho: Caminho | str, *,
+                                tamanho_chunk: int = TAMANHO_CHUNK,
+                                algoritmo_hash: str | None = None) -> str | None:
+        """Versão assíncrona do `salvar_em()` para respostas do `ClienteHttpAsync.stream()`"""
+        digest = hashlib.new(algoritmo_hash) if algoritmo_hash else None
+        destino = caminho.path if isinstance(caminho, Caminho) else caminho
+        with open(destino, "wb") as writer:
+            async for chunk in self.aiter_bytes(tamanho_chunk):
+                writer.write(chunk)
+                if digest: digest.update(chunk)
+        return digest.hexdigest() if digest else None
+
     def xml (self) -> ElementoXML:
         """Realizar o parse do conteúdo de resposta como um `ElementoXML`
         - `ValueError` caso ocorra erro de parse"""
@@ -103,6 +176,45 @@ class ResponseHttp (httpx.Response):
             # Erros.RetornoInesperado.erro(erro) TODO
             raise ValueError("Erro ao realizar o parse para XML da Resposta HTTP") from erro
 
+    def iter_xml (self, *caminhos: str, tamanho_chunk: int = TAMANHO_CHUNK) -> typing.Iterator[ElementoXML]:
+        """Realizar o parse incremental do conteúdo xml retornando apenas os elementos dos `caminhos`
+        - Memória e latência proporcionais aos elementos extraídos, não ao tamanho do documento
+        - Corpo lido em partes de `tamanho_chunk` bytes caso o request tenha sido feito via `stream()`.
+        Interromper a iteração evita o download e o parse do restante do documento
+        - Cada elemento extraído é convertido para `ElementoXML`. Utilizar o `iterar_xml()` para os `xml.etree.ElementTree.Element` sem conversão
+        - `caminhos` subconjunto de `xpath`: `tag`, `pai/tag`, `/raiz/pai/tag` e `*`, ignorando namespaces. Veja `CaminhoXML`
+        - `ValueError` caso ocorra erro de parse ou caminho inválido
+
+        ### Exemplo
+        ```
+        with client.stream("GET", "/nfe/123/xml") as response:
+            for det in response.iter_xml("infNFe/det"):
+                print(det)
+        ```"""
+        try:
+            extrator = ExtratorXML(*caminhos)
+            for chunk in self.iter_bytes(tamanho_chunk):
+                for elemento in extrator.alimentar(chunk):
+                    yield _elemento_xml(elemento)
+            for elemento in extrator.finalizar():
+                yield _elemento_xml(elemento)
+        except (ValueError, ElementTree.ParseError) as erro:
+            # Erros.RetornoInesperado.erro(erro) TODO
+            raise ValueError("Erro ao realizar o parse incremental para XML da Resposta HTTP") from erro
+
+    async def aiter_xml (self, *caminhos: str, tamanho_chunk: int = TAMANHO_CHUNK) -> typing.AsyncIterator[ElementoXML]:
+        """Versão assíncrona do `iter_xml()` para respostas do `ClienteHttpAsync.stream()`"""
+        try:
+            extrator = ExtratorXML(*caminhos)
+            async for chunk in self.aiter_bytes(tamanho_chunk):
+                for elemento in extrator.alimentar(chunk):
+                    yield _elemento_xml(elemento)
+            for elemento in extrator.finalizar():
+                yield _elemento_xml(elemento)
+        except (ValueError, ElementTree.ParseError) as erro:
+            # Erros.RetornoInesperado.erro(erro) TODO
+            raise ValueError("Erro ao realizar o parse incremental para XML da Resposta HTTP") from erro
+
     @typing.overload
     def json (self) -> typing.Any: ... # type: ignore
     @typing.overload
@@ -111,8 +223,9 @@ class ResponseHttp (httpx.Response):
     def json[T] (self, esperar: type[T] = typing.Any) -> T | typing.Any: # type: ignore
         """Realizar o parse do conteúdo de resposta como o tipo `esperar`
         - `esperar`: `dict[str, str | int]`, `list[dict[str, str]]`
+        - Decodificado pelo `decodificador.BACKEND` mais rápido disponível
         - `ValueError` caso ocorra erro de parse"""
-        try: json = super().json()
+        try: json = decodificar_json(self.content, self.charset_encoding)
         except Exception as erro:
             # Erros.RetornoInesperado.erro(erro) TODO
             raise ValueError("Erro ao realizar o parse para JSON da Resposta HTTP") from erro
@@ -166,11 +279,242 @@ class ResponseHttp (httpx.Response):
             # Erros.RespostaJson.erro(erro) TODO
             raise ValueError(f"Erro ao realizar o Unmarshal da Resposta HTTP para '{cls}'") from erro
 
-class ClienteHttp (httpx.Client):
+    def iter_unmarshal[T: Unmarshaller] (self, cls: type[T], caminho_json: str = "", *, tamanho_chunk: int = TAMANHO_CHUNK) -> typing.Iterator[T]:
+        """Realizar o Unmarshal, item a item, do array `json` no `caminho_json` conforme a classe anotada `cls`
+        - Os itens são decodificados pelo `decodificador.BACKEND` conforme iterados, sem criar a lista intermediária de `dict`
+        - Corpo lido em partes de `tamanho_chunk` bytes caso o request tenha sido feito via `stream()`.
+        Memória proporcional ao maior item e não ao tamanho da resposta
+        - `caminho_json` chaves separadas por `.` até o array. Ex: `"items"`, `"instance.property_values"`
+        - `caminho_json=""` a resposta deve ser um json `list[dict]`
+        - Chave não encontrada resulta em nenhum item
+        - `ValueError`
+
+        ### Exemplo
+        ```
+        for item in response.iter_unmarshal(modelos.TableItem, "items"):
+            print(item.id)
+        ```"""
+        try:
+            for item in iterar_array_json(self.iter_bytes(tamanho_chunk), caminho_json, self.charset_encoding):
+                yield cls.Unmarshal(item)
+        except Exception as erro:
+            # Erros.RespostaJson.erro(erro) TODO
+            raise ValueError(f"Erro ao realizar o Unmarshal da Resposta HTTP para '{cls}' no caminho '{caminho_json}'") from erro
+
+def _elemento_xml (elemento: ElementTree.Element) -> ElementoXML:
+    """Converter o elemento extraído pelo `ExtratorXML` para `ElementoXML`"""
+    return ElementoXML.Parse(ElementTree.tostring(elemento, encoding="unicode"))
+
+def _tratar_erro_transporte (erro: httpx.TransportError, tentativas: list[Tentativa]) -> None:
+    """Adicionar as tentativas realizadas como nota do `erro`"""
+    if len(tentativas) > 1:
+        erro.add_note(f"Tentativas realizadas: {tentativas}")
+
+    if isinstance(erro, httpx.TimeoutException):
+        # Erros.Timeout.erro() TODO
+        pass
+    elif isinstance(erro, httpx.ConnectError):
+        # Erros.Conexao.erro() TODO
+        pass
+
+class _ClienteHttpBase:
+    """Funcionalidades compartilhadas entre o `ClienteHttp` e o `ClienteHttpAsync` que não dependem de I/O"""
+
+    retentativa: PoliticaRetentativa | None = None
+    """Política de retentativa aplicada nos requests
+    - `None` para não realizar retentativas"""
+
+    cache: CacheHttp | None = None
+    """Cache de respostas `GET` com revalidação condicional
+    - `None` para não utilizar cache"""
+    coalescencia: Coalescencia | None = None
+    """Agrupamento dos requests idênticos em andamento
+    - `None` para não agrupar"""
+    limite: LimiteTaxa | None = None
+    """Limite de requests por segundo aplicado antes de cada tentativa
+    - `None` para não limitar"""
+    disjuntor: Disjuntor | None = None
+    """Circuit breaker para falhar rapidamente enquanto o serviço está indisponível
+    - `None` para não utilizar"""
+    metricas: HistoricoHttp | None = None
+    """Histórico que recebe as medições das fases de cada tentativa de request
+    - `None` para não medir"""
+    servico: str | None = None
+    """Nome do serviço nas `metricas`
+    - `None` para utilizar o host da URL"""
+    compressao: CompressaoRequest | None = None
+    """Compressão do corpo dos requests
+    - `None` para não comprimir"""
+
+    alertar_saturacao: bool = False
+    """Contabilizar e alertar os requests que encontram o pool de conexões saturado
+    - Consulta o pool antes de cada tentativa. Necessário o `max_conexoes`"""
+    max_conexoes: int | None = None
+    """Limite de conexões do pool, definido pelo `FromConfig()`"""
+
+    _saturacoes: int = 0
+    _ultimo_alerta_saturacao: float = 0.0
+
+    INTERVALO_ALERTA_SATURACAO: float = 60.0
+    """Intervalo mínimo, em segundos, entre os alertas de pool saturado"""
+
+    @classmethod
+    def FromConfig (cls, secao: str, *,
+                          timeout: float = 60,
+                          compartilhar_transporte: bool = False,
+                          **kwargs: typing.Any) -> typing.Self:
+        """Criar o cliente com as opções de conexão e retentativa da `secao` do .ini
+        - `timeout` padrão caso não informado na seção
+        - `compartilhar_transporte` para utilizar o pool de conexões do `registro_clientes.transporte()` compartilhado com os clientes de mesmo host e opções de conexão. Apenas para o `ClienteHttp`. Proxies das variáveis de ambiente `HTTP(S)_PROXY, NO_PROXY` mantidos
+        - `kwargs` demais argumentos do cliente `httpx`, como o `base_url, headers, verify`
+        - Veja `opcoes_conexao()`, `PoliticaRetentativa.FromConfig()`, `CacheHttp.FromConfig()`, `LimiteTaxa.FromConfig()`, `Disjuntor.FromConfig()`, `CompressaoRequest.FromConfig()` e `transporte_cassete()` para as variáveis utilizadas
+        - Variáveis utilizadas `[secao] -> [coalescer: False, metricas: False, alertar_saturacao: False]`"""
+        opcoes = opcoes_conexao(secao, timeout) | kwargs
+        transporte = transporte_cassete(
+            secao, issubclass(cls, httpx.AsyncClient),
+            http2=opcoes["http2"], limits=opcoes["limits"], verify=opcoes.get("verify", True)
+        )
+        if transporte is None and compartilhar_transporte and "base_url" in opcoes and not issubclass(cls, httpx.AsyncClient) \
+           and opcoes.keys().isdisjoint(("transport", "proxy", "cert", "mounts", "trust_env")):
+            compartilhado = functools.partial(
+                registro_clientes.transporte,
+                opcoes["base_url"], http2=opcoes["http2"], limits=opcoes["limits"], verify=opcoes.get("verify", True)
+            )
+            transporte = compartilhado()
+            # O `transport` informado desabilita os proxies das variáveis de ambiente, montados também como transportes compartilhados
+            if transporte is not None:
+                opcoes["mounts"] = {
+                    padrao: None if url is None else compartilhado(proxy=url)
+                    for padrao, url in httpx._utils.get_environment_proxies().items()
+                }
+        if transporte is not None and "transport" not in opcoes:
+            opcoes["transport"] = transporte
+        client = cls(**opcoes)
+        client.retentativa = PoliticaRetentativa.FromConfig(secao)
+        client.cache = CacheHttp.FromConfig(secao)
+        client.limite = LimiteTaxa.FromConfig(secao)
+        client.disjuntor = Disjuntor.FromConfig(secao)
+        client.compressao = CompressaoRequest.FromConfig(secao)
+        client.servico = secao
+        client.max_conexoes = opcoes["limits"].max_connections
+        client.alertar_saturacao = bool(getattr(bot.config, secao).obter_ou("alertar_saturacao", False))
+        if getattr(bot.config, secao).obter_ou("metricas", False):
+            client.metricas = historico_http
+        if getattr(bot.config, secao).obter_ou("coalescer", False):
+            client.coalescencia = Coalescencia()
+        return client
+
+    def estatisticas_pool (self) -> EstatisticasPool:
+        """Obter as estatísticas atuais do pool de conexões
+        - `saturacoes` contabiliza os requests que encontraram o pool sem conexão livre. Apenas com o `alertar_saturacao`"""
+        return EstatisticasPool.Obter(getattr(self, "_transport"), self._saturacoes, self.max_conexoes)
+
+    def _consultar_cache (self, requisicao: httpx.Request, stream: bool) -> tuple[str | None, EntradaCache | None, bool]:
+        """Consultar a `requisicao` no `cache` e adicionar os headers condicionais caso a entrada precise ser revalidada
+        - Retornado `(chave, entrada, utilizavel)`. Veja `CacheHttp.utilizavel()`
+        - Requests `stream` não utilizam o cache"""
+        if self.cache is None or stream or (chave := self.cache.chave(requisicao)) is None:
+            return None, None, False
+
+        entrada = self.cache.consultar(requisicao, chave)
+        utilizavel = entrada is not None and self.cache.utilizavel(requisicao, entrada)
+        if entrada is not None and not utilizavel:
+            entrada.condicionar(requisicao)
+        return chave, entrada, utilizavel
+
+    def _armazenar_cache (self, requisicao: httpx.Request,
+                                response: httpx.Response,
+                                chave: str | None,
+                                entrada: EntradaCache | None) -> httpx.Response:
+        """Armazenar ou revalidar a `response` no `cache`
+        - Retornado o `httpx.Response` com o conteúdo armazenado em caso de `304`"""
+        if self.cache is None: return response
+        self.cache.invalidar(requisicao, response)
+        if chave is None: return response
+        return self.cache.armazenar(requisicao, chave, response, entrada)
+
+    def _concluir_tentativa (self, requisicao: httpx.Request,
+                                   tentativas: list[Tentativa],
+                                   inicio: float,
+                                   medicao: Medicao | None,
+                                   token: int | None,
+                                   response: httpx.Response | None = None,
+                                   erro: httpx.TransportError | None = None) -> float | None:
+        """Registrar a tentativa concluída com a `response` ou o `erro` no `disjuntor` e nas `tentativas`
+        - `token` retornado pelo `disjuntor.permitir()` da tentativa
+        - Retornado a espera para uma nova tentativa conforme a `retentativa`
+        - `None` caso não deva ser feito uma nova tentativa. Em caso de `erro`, as tentativas são adicionadas como nota
+        - Compartilhado pelo `ClienteHttp` e `ClienteHttpAsync` para que a decisão seja a mesma em ambos"""
+        if erro is not None:
+            self._registrar_medicao(requisicao, medicao, erro=erro)
+        if self.disjuntor is not None and token is not None:
+            if erro is not None: self.disjuntor.registrar(token, False)
+            elif response is not None: self.disjuntor.registrar_response(token, response)
+
+        tentativas.append(Tentativa.Registrar(requisicao, len(tentativas) + 1, inicio, response=response, erro=erro))
+        espera = (
+            self.retentativa.proxima_espera(requisicao, tentativas[-1].numero, response, erro)
+            if self.retentativa is not None else None
+        )
+        if espera is not None:
+            dclick.logger.debug(
+                f"Realizando nova tentativa do request em {espera:.2f} segundos",
+                tentativa = repr(tentativas[-1])
+            )
+        elif erro is not None:
+            _tratar_erro_transporte(erro, tentativas)
+        return espera
+
+    def _requisicao_lote (self, item: ItemLote) -> httpx.Request:
+        """Obter o `httpx.Request` do item do lote"""
+        if isinstance(item, httpx.Request): return item
+        metodo, url = item
+        return typing.cast(httpx.Client, self).build_request(metodo, url)
+
+    def _iniciar_medicao (self, requisicao: httpx.Request, assincrono: bool = False) -> Medicao | None:
+        """Iniciar a medição da tentativa caso as `metricas` estejam habilitadas"""
+        if self.metricas is None: return None
+        return self.metricas.iniciar(requisicao, assincrono)
+
+    def _registrar_medicao (self, requisicao: httpx.Request,
+                                  medicao: Medicao | None,
+                                  response: httpx.Response | None = None,
+                                  erro: Exception | None = None) -> None:
+        """Registrar o resultado da tentativa nas `metricas`"""
+        if self.metricas is None or medicao is None: return
+        self.metricas.registrar(self.servico or requisicao.url.host, requisicao, medicao, response, erro)
+
+    def _checar_saturacao (self, requisicao: httpx.Request) -> None:
+        """Contabilizar e alertar, com intervalo mínimo, caso a `requisicao` precise aguardar uma conexão livre
+        - Realizado apenas com o `alertar_saturacao` habilitado"""
+        if not self.alertar_saturacao: return
+        if not EstatisticasPool.Saturado(getattr(self, "_transport"), self.max_conexoes):
+            return
+
+        self._saturacoes += 1
+        agora = time.monotonic()
+        if agora - self._ultimo_alerta_saturacao >= self.INTERVALO_ALERTA_SATURACAO:
+            self._ultimo_alerta_saturacao = agora
+            dclick.logger.alertar(
+                f"Pool de conexões saturado. Request aguardando conexão livre: {requisicao.method} {requisicao.url}",
+                estatisticas = repr(self.estatisticas_pool())
+            )
+
+class ClienteHttp (_ClienteHttpBase, httpx.Client):
     """Criar um cliente `HTTP` para realizar requests. Extensão do `httpx.Client`
     - Realizado logs automáticos de erros de api para requests e responses com os métodos modificados
     - Veja a documentação do `request()` para informação sobre todos os parâmetros aceitos
-    - Retorno dos métodos `request, get, post, put, ...` é um `ResponseHttp` com métodos adicionais ao `httpx.Response`"""
+    - Retorno dos métodos `request, get, post, put, ...` é um `ResponseHttp` com métodos adicionais ao `httpx.Response`
+    - `retentativa` para aplicar uma `PoliticaRetentativa` nos requests
+    - `cache` para aplicar um `CacheMemoria` ou `CacheDisco` nos requests `GET`
+    - `coalescencia` para agrupar requests idênticos em andamento entre threads
+    - `limite` para aplicar um `LimiteTaxa` de requests por segundo
+    - `disjuntor` para recusar os requests com `DisjuntorAberto` enquanto o serviço está indisponível
+    - `metricas` para medir as fases de cada request no `historico_http`
+    - `compressao` para comprimir o corpo dos requests grandes com `CompressaoRequest`
+    - `executar_lote()` para realizar vários requests independentes com concorrência limitada
+    - `ClienteHttp.FromConfig()` para criar com as opções de conexão de uma seção do .ini
+    - `estatisticas_pool()` para acompanhar a saturação do pool de conexões"""
 
     @typing.override
     def request (self, metodo: METODOS_HTTP, # type: ignore
@@ -233,26 +577,130 @@ class ClienteHttp (httpx.Client):
         - `follow_redirects` Indica se a requisição deve seguir redirecionamentos automaticamente
         - `timeout` Tempo máximo de espera pela resposta (em segundos).
         - `verify` Define se o certificado SSL deve ser verificado `True/False` ou caminho para o certificado"""
-        try:
-            response = super().request(
-                metodo, url, params=query, headers=headers,
-                json=json, content=conteudo, data=dados, files=arquivos,
-                follow_redirects=follow_redirects, timeout=timeout
-            )
+        requisicao = self.build_request(
+            metodo, url, params=query, headers=headers,
+            json=json, content=conteudo, data=dados, files=arquivos,
+            timeout=timeout
+        )
+        return self._enviar(requisicao, follow_redirects)
 
-            #  TODO
-            # if response.is_success: pass
-            # elif response.is_server_error: Erros.Conexao.alertar()
-            # elif response.status_code in (401, 403): Erros.Autenticacao.alertar()
+    @contextlib.contextmanager
+    def stream (self, metodo: METODOS_HTTP, # type: ignore
+                      url: str,
+                      query: types.QueryParamTypes | None = None,
+                      headers: types.HeaderTypes | None = None,
+                      *,
+                      json: object | None = None,
+                      conteudo: types.RequestContent | None = None,
+                      dados: types.RequestData | None = None,
+                      arquivos: types.RequestFiles | None = None,
+                      follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                      timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> typing.Iterator[ResponseHttp]:
+        """Realizar um request sem carregar o corpo da resposta em memória
+        - Mesmos parâmetros do `request()`
+        - Utilizar o `ResponseHttp.iter_bytes()` ou `ResponseHttp.salvar_em()` para consumir o corpo em partes
+        - Response fechado ao sair do `with`
 
-            return ResponseHttp.New(response)
+        ### Exemplo
+        ```
+        with client.stream("GET", "/v1/documents/123/download") as response:
+            sha256 = response.esperar_sucesso().salvar_em("./documento.pdf", algoritmo_hash="sha256")
+        ```"""
+        requisicao = self.build_request(
+            metodo, url, params=query, headers=headers,
+            json=json, content=conteudo, data=dados, files=arquivos,
+            timeout=timeout
+        )
+        response = self._enviar(requisicao, follow_redirects, stream=True)
+        try: yield response
+        finally:
+            response.close()
+            self._registrar_medicao(requisicao, response.extensions.get("dclick.medicao"), response)
 
-        except httpx.TimeoutException:
-            # Erros.Timeout.erro() TODO
-            raise
-        except httpx.ConnectError:
-            # Erros.Conexao.erro() TODO
-            raise
+    def _enviar (self, requisicao: httpx.Request,
+                       follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                       stream: bool = False) -> ResponseHttp:
+        """Enviar a `requisicao` aplicando a `coalescencia`, o `cache`, a `compressao`, o `disjuntor`, o `limite`, as `metricas` e a `retentativa`
+        - `stream` para não realizar a leitura do corpo da resposta"""
+        if self.coalescencia is None or stream:
+            return self._enviar_rede(requisicao, follow_redirects, stream)
+        response = self.coalescencia.executar(requisicao, lambda: self._enviar_rede(requisicao, follow_redirects))
+        return response if isinstance(response, ResponseHttp) else ResponseHttp.New(response)
+
+    def _enviar_rede (self, requisicao: httpx.Request,
+                            follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                            stream: bool = False) -> ResponseHttp:
+        """Enviar a `requisicao` aplicando o `cache`, a `compressao`, o `disjuntor`, o `limite`, as `metricas` e a `retentativa`"""
+        chave, entrada, utilizavel = self._consultar_cache(requisicao, stream)
+        if entrada is not None and utilizavel:
+            return ResponseHttp.New(entrada.response(requisicao))
+        if self.compressao is not None:
+            self.compressao.aplicar(requisicao)
+
+        tentativas = list[Tentativa]()
+        while True:
+            token = self.disjuntor.permitir(requisicao) if self.disjuntor is not None else None
+            if self.limite is not None: self.limite.aguardar(requisicao)
+            self._checar_saturacao(requisicao)
+            inicio = time.perf_counter()
+            medicao = self._iniciar_medicao(requisicao)
+            try: response = self.send(requisicao, stream=stream, follow_redirects=follow_redirects)
+            except httpx.TransportError as erro:
+                espera = self._concluir_tentativa(requisicao, tentativas, inicio, medicao, token, erro=erro)
+                if espera is None: raise
+                time.sleep(espera)
+                continue
+
+            espera = self._concluir_tentativa(requisicao, tentativas, inicio, medicao, token, response=response)
+            if espera is None: break
+            response.close()
+            self._registrar_medicao(requisicao, medicao, response)
+            time.sleep(espera)
+
+        #  TODO
+        # if response.is_success: pass
+        # elif response.is_server_error: Erros.Conexao.alertar()
+        # elif response.status_code in (401, 403): Erros.Autenticacao.alertar()
+
+        # stream registrado ao fechar o response, após a leitura do corpo
+        if stream: response.extensions["dclick.medicao"] = medicao
+        else: self._registrar_medicao(requisicao, medicao, response)
+
+        response = self._armazenar_cache(requisicao, response, chave, entrada)
+        return ResponseHttp.New(response, tentativas)
+
+    def executar_lote (self, requisicoes: typing.Iterable[ItemLote],
+                             concorrencia: int = 8,
+                             *,
+                             ordenado: bool = True) -> typing.Iterator[ResultadoLote]:
+        """Realizar os `requisicoes` independentes em um pool de até `concorrencia` threads
+        - `requisicoes` criadas pelo `client.build_request()` ou `(metodo, url)`
+        - Cada item passa pelo mesmo fluxo do `request()`, respeitando o `limite`, a `retentativa`, o `cache` e o `disjuntor`
+        - `ordenado=True` resultados na ordem das `requisicoes`, senão na ordem de conclusão
+        - Erros capturados por item no `ResultadoLote.erro`, sem interromper o lote
+        - Executado conforme o retorno é iterado. Interromper a iteração cancela os itens pendentes e aguarda os itens em andamento
+
+        ### Exemplo
+        ```
+        resultados = client.executar_lote(
+            (("GET", f"/v1/tasks/{id}") for id in ids),
+            concorrencia = 10
+        )
+        for resultado in resultados:
+            if resultado.erro: print(resultado.indice, resultado.erro)
+            else: print(resultado.response.json())
+        ```"""
+        itens = [self._requisicao_lote(item) for item in requisicoes]
+        executor = ThreadPoolExecutor(max(1, concorrencia), thread_name_prefix="executar_lote")
+        try:
+            futures = [executor.submit(self._executar_item_lote, indice, requisicao) for indice, requisicao in enumerate(itens)]
+            for future in (futures if ordenado else as_completed(futures)):
+                yield future.result()
+        finally: executor.shutdown(wait=True, cancel_futures=True)
+
+    def _executar_item_lote (self, indice: int, requisicao: httpx.Request) -> ResultadoLote:
+        try: return ResultadoLote(indice, requisicao, self._enviar(requisicao))
+        except Exception as erro: return ResultadoLote(indice, requisicao, erro=erro)
 
     @typing.override
     def get (self, url: str, # type: ignore
@@ -344,6 +792,243 @@ class ClienteHttp (httpx.Client):
             follow_redirects=follow_redirects, timeout=timeout
         )
 
+class ClienteHttpAsync (_ClienteHttpBase, httpx.AsyncClient):
+    """Criar um cliente `HTTP` assíncrono para realizar requests. Extensão do `httpx.AsyncClient`
+    - Mesma interface do `ClienteHttp`, porém os métodos `request, get, post, put, ...` devem ser aguardados com `await`
+    - Veja a documentação do `ClienteHttp.request()` para informação sobre todos os parâmetros aceitos
+    - Retorno é o mesmo `ResponseHttp` do `ClienteHttp`, com o corpo já lido, então os métodos `esperar_*` e `unmarshal*` não precisam de `await`
+
+    ### Exemplo
+    ```
+    import asyncio
+    from dclick.http import ClienteHttpAsync
+
+    async def main () -> None:
+        async with ClienteHttpAsync(base_url="https://httpbin.org") as client:
+            responses = await asyncio.gather(
+                client.get("/get", query={ "n": 1 }),
+                client.get("/get", query={ "n": 2 }),
+            )
+            for response in responses:
+                print(response.esperar_sucesso().json())
+
+    asyncio.run(main())
+    ```"""
+
+    @typing.override
+    async def request (self, metodo: METODOS_HTTP, # type: ignore
+                             url: str,
+                             query: types.QueryParamTypes | None = None,
+                             headers: types.HeaderTypes | None = None,
+                             *,
+                             json: object | None = None,
+                             conteudo: types.RequestContent | None = None,
+                             dados: types.RequestData | None = None,
+                             arquivos: types.RequestFiles | None = None,
+                             follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                             timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> ResponseHttp:
+        """Realizar um request informando o `método` desejado
+        - Veja a documentação do `ClienteHttp.request()` para informação sobre todos os parâmetros aceitos"""
+        requisicao = self.build_request(
+            metodo, url, params=query, headers=headers,
+            json=json, content=conteudo, data=dados, files=arquivos,
+            timeout=timeout
+        )
+        return await self._enviar(requisicao, follow_redirects)
+
+    @contextlib.asynccontextmanager
+    async def stream (self, metodo: METODOS_HTTP, # type: ignore
+                            url: str,
+                            query: types.QueryParamTypes | None = None,
+                            headers: types.HeaderTypes | None = None,
+                            *,
+                            json: object | None = None,
+                            conteudo: types.RequestContent | None = None,
+                            dados: types.RequestData | None = None,
+                            arquivos: types.RequestFiles | None = None,
+                            follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                            timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> typing.AsyncIterator[ResponseHttp]:
+        """Realizar um request sem carregar o corpo da resposta em memória
+        - Mesmos parâmetros do `request()`
+        - Utilizar o `ResponseHttp.aiter_bytes()` ou `ResponseHttp.asalvar_em()` para consumir o corpo em partes
+        - Response fechado ao sair do `async with`"""
+        requisicao = self.build_request(
+            metodo, url, params=query, headers=headers,
+            json=json, content=conteudo, data=dados, files=arquivos,
+            timeout=timeout
+        )
+        response = await self._enviar(requisicao, follow_redirects, stream=True)
+        try: yield response
+        finally:
+            await response.aclose()
+            self._registrar_medicao(requisicao, response.extensions.get("dclick.medicao"), response)
+
+    async def _enviar (self, requisicao: httpx.Request,
+                             follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                             stream: bool = False) -> ResponseHttp:
+        """Enviar a `requisicao` aplicando a `coalescencia`, o `cache`, a `compressao`, o `disjuntor`, o `limite`, as `metricas` e a `retentativa`
+        - `stream` para não realizar a leitura do corpo da resposta"""
+        if self.coalescencia is None or stream:
+            return await self._enviar_rede(requisicao, follow_redirects, stream)
+        response = await self.coalescencia.aexecutar(requisicao, lambda: self._enviar_rede(requisicao, follow_redirects))
+        return response if isinstance(response, ResponseHttp) else ResponseHttp.New(response)
+
+    async def _enviar_rede (self, requisicao: httpx.Request,
+                                  follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                                  stream: bool = False) -> ResponseHttp:
+        """Enviar a `requisicao` aplicando o `cache`, a `compressao`, o `disjuntor`, o `limite`, as `metricas` e a `retentativa`"""
+        chave, entrada, utilizavel = self._consultar_cache(requisicao, stream)
+        if entrada is not None and utilizavel:
+            return ResponseHttp.New(entrada.response(requisicao))
+        if self.compressao is not None:
+            self.compressao.aplicar(requisicao)
+
+        tentativas = list[Tentativa]()
+        while True:
+            token = self.disjuntor.permitir(requisicao) if self.disjuntor is not None else None
+            if self.limite is not None: await self.limite.aaguardar(requisicao)
+            self._checar_saturacao(requisicao)
+            inicio = time.perf_counter()
+            medicao = self._iniciar_medicao(requisicao, assincrono=True)
+            try: response = await self.send(requisicao, stream=stream, follow_redirects=follow_redirects)
+            except httpx.TransportError as erro:
+                espera = self._concluir_tentativa(requisicao, tentativas, inicio, medicao, token, erro=erro)
+                if espera is None: raise
+                await asyncio.sleep(espera)
+                continue
+
+            espera = self._concluir_tentativa(requisicao, tentativas, inicio, medicao, token, response=response)
+            if espera is None: break
+            await response.aclose()
+            self._registrar_medicao(requisicao, medicao, response)
+            await asyncio.sleep(espera)
+
+        # stream registrado ao fechar o response, após a leitura do corpo
+        if stream: response.extensions["dclick.medicao"] = medicao
+        else: self._registrar_medicao(requisicao, medicao, response)
+
+        response = self._armazenar_cache(requisicao, response, chave, entrada)
+        return ResponseHttp.New(response, tentativas)
+
+    async def executar_lote (self, requisicoes: typing.Iterable[ItemLote],
+                                   concorrencia: int = 8,
+                                   *,
+                                   ordenado: bool = True) -> typing.AsyncIterator[ResultadoLote]:
+        """Realizar os `requisicoes` independentes com até `concorrencia` requests simultâneos no event loop
+        - Veja a documentação do `ClienteHttp.executar_lote()`
+
+        ### Exemplo
+        ```
+        async for resultado in client.executar_lote((("GET", f"/v1/tasks/{id}") for id in ids), concorrencia=10):
+            print(resultado)
+        ```"""
+        itens = [self._requisicao_lote(item) for item in requisicoes]
+        semaforo = asyncio.Semaphore(max(1, concorrencia))
+
+        async def executar (indice: int, requisicao: httpx.Request) -> ResultadoLote:
+            async with semaforo:
+                try: return ResultadoLote(indice, requisicao, await self._enviar(requisicao))
+                except Exception as erro: return ResultadoLote(indice, requisicao, erro=erro)
+
+        tasks = [asyncio.ensure_future(executar(indice, requisicao)) for indice, requisicao in enumerate(itens)]
+        try:
+            for task in (tasks if ordenado else asyncio.as_completed(tasks)):
+                yield await task
+        finally:
+            # requests pendentes cancelados e aguardados antes de retornar, sem continuar em segundo plano
+            for task in tasks: task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @typing.override
+    async def get (self, url: str, # type: ignore
+                         query: types.QueryParamTypes | None = None,
+                         headers: types.HeaderTypes | None = None,
+                         *,
+                         follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                         timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> ResponseHttp:
+        return await self.request("GET", url, query, headers, follow_redirects=follow_redirects, timeout=timeout)
+
+    @typing.override
+    async def head (self, url: str, # type: ignore
+                          query: types.QueryParamTypes | None = None,
+                          headers: types.HeaderTypes | None = None,
+                          *,
+                          follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                          timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> ResponseHttp:
+        return await self.request("HEAD", url, query, headers, follow_redirects=follow_redirects, timeout=timeout)
+
+    @typing.override
+    async def options (self, url: str, # type: ignore
+                             query: types.QueryParamTypes | None = None,
+                             headers: types.HeaderTypes | None = None,
+                             *,
+                             follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                             timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> ResponseHttp:
+        return await self.request("OPTIONS", url, query, headers, follow_redirects=follow_redirects, timeout=timeout)
+
+    @typing.override
+    async def delete (self, url: str, # type: ignore
+                            query: types.QueryParamTypes | None = None,
+                            headers: types.HeaderTypes | None = None,
+                            *,
+                            follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                            timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> ResponseHttp:
+        return await self.request(
+            "DELETE", url, query, headers,
+            follow_redirects=follow_redirects, timeout=timeout
+        )
+
+    @typing.override
+    async def post (self, url: str, # type: ignore
+                          query: types.QueryParamTypes | None = None,
+                          headers: types.HeaderTypes | None = None,
+                          *,
+                          json: object | None = None,
+                          conteudo: types.RequestContent | None = None,
+                          dados: types.RequestData | None = None,
+                          arquivos: types.RequestFiles | None = None,
+                          follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                          timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> ResponseHttp:
+        return await self.request(
+            "POST", url, query, headers,
+            json=json, conteudo=conteudo, dados=dados, arquivos=arquivos,
+            follow_redirects=follow_redirects, timeout=timeout
+        )
+
+    @typing.override
+    async def put (self, url: str, # type: ignore
+                         query: types.QueryParamTypes | None = None,
+                         headers: types.HeaderTypes | None = None,
+                         *,
+                         json: object | None = None,
+                         conteudo: types.RequestContent | None = None,
+                         dados: types.RequestData | None = None,
+                         arquivos: types.RequestFiles | None = None,
+                         follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                         timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> ResponseHttp:
+        return await self.request(
+            "PUT", url, query, headers,
+            json=json, conteudo=conteudo, dados=dados, arquivos=arquivos,
+            follow_redirects=follow_redirects, timeout=timeout
+        )
+
+    @typing.override
+    async def patch (self, url: str, # type: ignore
+                           query: types.QueryParamTypes | None = None,
+                           headers: types.HeaderTypes | None = None,
+                           *,
+                           json: object | None = None,
+                           conteudo: types.RequestContent | None = None,
+                           dados: types.RequestData | None = None,
+                           arquivos: types.RequestFiles | None = None,
+                           follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+                           timeout: types.TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT) -> ResponseHttp:
+        return await self.request(
+            "PATCH", url, query, headers,
+            json=json, conteudo=conteudo, dados=dados, arquivos=arquivos,
+            follow_redirects=follow_redirects, timeout=timeout
+        )
+
 def request (metodo: METODOS_HTTP,
              url: str,
              query: types.QueryParamTypes | None = None,
@@ -416,4 +1101,7 @@ def request (metodo: METODOS_HTTP,
 __all__ = [
     "request",
     "ClienteHttp",
+    "ResponseHttp",
+    "ClienteHttpAsync",
+    "TAMANHO_CHUNK",
 ]
\ No newline at end of file
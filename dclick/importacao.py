@@ -0,0 +1,29 @@
+# std
+import sys, typing, importlib
+
+def sob_demanda (pacote: str, *submodulos: str) -> tuple[typing.Callable[[str], typing.Any], typing.Callable[[], list[str]]]:
+    """Criar o `__getattr__` e o `__dir__` (PEP 562) do `pacote` para importar os `submodulos` apenas no primeiro acesso
+    - Após importado, o submódulo fica como atributo do pacote e o `__getattr__` não é mais chamado
+    - Utilizar junto de um bloco `typing.TYPE_CHECKING` com os imports para manter o autocomplete
+
+    ### Exemplo
+    ```
+    if typing.TYPE_CHECKING:
+        from dclick.nbs import nbs_fiscal, pecas_compras
+    __getattr__, __dir__ = sob_demanda(__name__, "nbs_fiscal", "pecas_compras")
+    ```"""
+    nomes = frozenset(submodulos)
+
+    def __getattr__ (nome: str) -> typing.Any:
+        if nome in nomes:
+            return importlib.import_module(f"{pacote}.{nome}")
+        raise AttributeError(f"module {pacote!r} has no attribute {nome!r}")
+
+    def __dir__ () -> list[str]:
+        return sorted(nomes.union(vars(sys.modules[pacote])))
+
+    return __getattr__, __dir__
+
+__all__ = [
+    "sob_demanda"
+]
@@ -1,7 +1,16 @@
 """Pacote destinado ao sistema `NBSi`
 - `DEFAULT_TIMEOUT` utilizado nas esperas do sistema
+- `TemplateImagem` para as imagens embutidas, decodificadas apenas no primeiro uso
 ## Dependência `dclick[nbs]` necessária para utilizar `dclick.nbs`
 ## Dependência `dclick[ocr]` caso seja usado o `LeitorOCR` da biblioteca `bot`"""
 
+import typing
+from dclick.importacao import sob_demanda
 from dclick.nbs.programa import *
-from dclick.nbs import nbs_fiscal, pecas_compras
\ No newline at end of file
+from dclick.nbs.template import *
+
+# Módulos do sistema importados apenas no primeiro acesso
+if typing.TYPE_CHECKING:
+    from dclick.nbs import nbs_fiscal, pecas_compras
+
+__getattr__, __dir__ = sob_demanda(__name__, "nbs_fiscal", "pecas_compras")
\ No newline at end of file
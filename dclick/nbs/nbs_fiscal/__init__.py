@@ -1,4 +1,10 @@
 """Pacote para tratar o módulo `ADM / Nbs Fiscal` na janela `NBS ShortCut`"""
 
+import typing
+from dclick.importacao import sob_demanda
 from dclick.nbs.nbs_fiscal.setup import *
-from dclick.nbs.nbs_fiscal import nf_entradas, impostos_a_recolher
\ No newline at end of file
+
+if typing.TYPE_CHECKING:
+    from dclick.nbs.nbs_fiscal import nf_entradas, impostos_a_recolher
+
+__getattr__, __dir__ = sob_demanda(__name__, "nf_entradas", "impostos_a_recolher")
\ No newline at end of file
@@ -3,19 +3,19 @@ from datetime import date
 from typing import Self, Literal, Callable
 # interno
 import dclick
-from dclick.nbs import DEFAULT_TIMEOUT
+from dclick.nbs import DEFAULT_TIMEOUT, TemplateImagem
 # externo
 import bot
 from bot.imagem import Imagem
 from bot.sistema.janela import ElementoW32, ElementoUIA, Dialogo, JanelaW32
 
-IMAGEM_BOTAO_INCLUIR_ENTRADA = Imagem.FromBase64("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABcAAAAcCAYAAACK7SRjAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAABuSURBVEhL7ZFBCsAwCAT9/6cthVpiWbcG482BPelOhIg2MnLIyCEluYi8QaTkQfecPHqA4Som+YtbJrjpKmBxywQ+fUh4IGl5RPlDGfvyezko7FCW5y836TeEVjkDN5NSuzp3udEqP8TIISMHqF5RR2cYX0l7YAAAAABJRU5ErkJggg==")
+IMAGEM_BOTAO_INCLUIR_ENTRADA = TemplateImagem.FromBase64("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAABcAAAAcCAYAAACK7SRjAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAABuSURBVEhL7ZFBCsAwCAT9/6cthVpiWbcG482BPelOhIg2MnLIyCEluYi8QaTkQfecPHqA4Som+YtbJrjpKmBxywQ+fUh4IGl5RPlDGfvyezko7FCW5y836TeEVjkDN5NSuzp3udEqP8TIISMHqF5RR2cYX0l7YAAAAABJRU5ErkJggg==")
 """Imagem do botão `Incluir Entrada` na resolução `1920x1080`"""
 
 @bot.erro.adicionar_prefixo("Falha ao abrir o menu 'Incluir Entrada'")
 @bot.erro.retry()
 def abrir_menu_incluir_entrada (janela_entrada: JanelaW32,
-                                imagem: Imagem | None = IMAGEM_BOTAO_INCLUIR_ENTRADA) -> JanelaW32:
+                                imagem: Imagem | TemplateImagem | None = IMAGEM_BOTAO_INCLUIR_ENTRADA) -> JanelaW32:
     """Clicar no botão para abrir o menu `Incluir Entrada`
     - `imagem` para procurar via imagem
     - `imagem=None` é feito o click em posição esperada
@@ -593,9 +593,9 @@ class Confirmar:
     full_hd: bool
     janela: JanelaW32
 
-    IMAGEM_CONFIRMAR = Imagem.FromBase64("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEsAAAAdCAYAAADimZEAAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAGmSURBVGhD7ZaBlYMgDEDZiW1Yho7CAg7BKE7CEQQMGNR4tvfORt9vAWOMX6RV0zQF4RjY1DzPQdhHZDEQWQxEFgORxeBWWSru1PhTuE0WiFKvBer4E7hFFhal1IuMeQK/ltWIEllj+KJ8sBriFoyjYs6y5jLWBq1t8GTcfVyWFcu8JEpbn/suGKWD9X3cSfxnBGEuyeKLihA3572L5LbVdcZVoXCOMVHqMq6My+eC6DymTHAld/qO8WnGlfHSh7yuzsZyDXzdmr/Pk665IyuGNX08zhYFOINutgOKq0WhGbcZXwtv5Jd2ikezFff7dpVbHiDK3+fJkLKqkLiT41xRwJ6s7pgzeT1rbgZe404EJavGD2KodplZvcySJ0PLwkKysNTC4xxRwKCAxF/JguuOZjTOk6FlRRGNmF4UwJVFLvC5D8UdFv0mWeUhJXEXZAEbYRi2qMIiqCyoq7h2oa1/KZqi3/EaonryD8l2Rq8MZQGksMui/j+7soBG2BeLAg5lAUnYl4sCTskSFkQWA5HFQGQxEFkMRBaDKgsawjFJVvqU7cQWwg8Fw9KgLVft2wAAAABJRU5ErkJggg==")
+    IMAGEM_CONFIRMAR = TemplateImagem.FromBase64("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEsAAAAdCAYAAADimZEAAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAGmSURBVGhD7ZaBlYMgDEDZiW1Yho7CAg7BKE7CEQQMGNR4tvfORt9vAWOMX6RV0zQF4RjY1DzPQdhHZDEQWQxEFgORxeBWWSru1PhTuE0WiFKvBer4E7hFFhal1IuMeQK/ltWIEllj+KJ8sBriFoyjYs6y5jLWBq1t8GTcfVyWFcu8JEpbn/suGKWD9X3cSfxnBGEuyeKLihA3572L5LbVdcZVoXCOMVHqMq6My+eC6DymTHAld/qO8WnGlfHSh7yuzsZyDXzdmr/Pk665IyuGNX08zhYFOINutgOKq0WhGbcZXwtv5Jd2ikezFff7dpVbHiDK3+fJkLKqkLiT41xRwJ6s7pgzeT1rbgZe404EJavGD2KodplZvcySJ0PLwkKysNTC4xxRwKCAxF/JguuOZjTOk6FlRRGNmF4UwJVFLvC5D8UdFv0mWeUhJXEXZAEbYRi2qMIiqCyoq7h2oa1/KZqi3/EaonryD8l2Rq8MZQGksMui/j+7soBG2BeLAg5lAUnYl4sCTskSFkQWA5HFQGQxEFkMRBaDKgsawjFJVvqU7cQWwg8Fw9KgLVft2wAAAABJRU5ErkJggg==")
     """Imagem do botão `Confirmar` na resolução `1920x1080`"""
-    IMAGEM_CANCELAR = Imagem.FromBase64("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEQAAAAXCAYAAACyCenrAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAGmSURBVFhH7ZQ9ksIwDIV9J2Yyw10oUuQg6ag4BS1dzkCdkhNwgK1TeC1HCpYsO94MFGRdfAPRj+X3Ysc8fyZbeVENEVRDBJsMscbY3gG/Wv6bUQ0hwbkcodV8M5EhTHDfp3NKfg/kDQlEbzPjYfvGuNaZ002r+QDjxR6ai71ruRWyVyYUL5+1Ps5sxuH8wOfBnszR9qOs+wDvNgSITCFKr4myqfs4OPD/+bicHNMOr562c8aJOOUobjp7pfit09fB2ck5jZvjT2+wliNpCOCqtxsCGw0FhTCz4OTgprxo2mAQF6fLi4S12TqTvbZ4LSmenaOf1qwhkRnvMgTwm8I3R5tjAuDKafGA8HQg/oqG9atzOH+/MkCJKZmhsxDl7bOeQkM006m+aA6n7KOqsWqK9lHF51CI3/SKIeLK+B6og/olPs9jV6ZoDicyRDXDiY9iGJf9nNkEdpxlHD+iTIivCQ3BHPUsb93hhdJaKH5Zp2QOhxniOpOic7k9kTdECGb5HZoBpA1JCPY1OzUDiL4hIHbPgteIDPnvVEME1RBBNURQDWFM9hfM9zt0FZHS5AAAAABJRU5ErkJggg==")
+    IMAGEM_CANCELAR = TemplateImagem.FromBase64("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAEQAAAAXCAYAAACyCenrAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAGmSURBVFhH7ZQ9ksIwDIV9J2Yyw10oUuQg6ag4BS1dzkCdkhNwgK1TeC1HCpYsO94MFGRdfAPRj+X3Ysc8fyZbeVENEVRDBJsMscbY3gG/Wv6bUQ0hwbkcodV8M5EhTHDfp3NKfg/kDQlEbzPjYfvGuNaZ002r+QDjxR6ai71ruRWyVyYUL5+1Ps5sxuH8wOfBnszR9qOs+wDvNgSITCFKr4myqfs4OPD/+bicHNMOr562c8aJOOUobjp7pfit09fB2ck5jZvjT2+wliNpCOCqtxsCGw0FhTCz4OTgprxo2mAQF6fLi4S12TqTvbZ4LSmenaOf1qwhkRnvMgTwm8I3R5tjAuDKafGA8HQg/oqG9atzOH+/MkCJKZmhsxDl7bOeQkM006m+aA6n7KOqsWqK9lHF51CI3/SKIeLK+B6og/olPs9jV6ZoDicyRDXDiY9iGJf9nNkEdpxlHD+iTIivCQ3BHPUsb93hhdJaKH5Zp2QOhxniOpOic7k9kTdECGb5HZoBpA1JCPY1OzUDiL4hIHbPgteIDPnvVEME1RBBNURQDWFM9hfM9zt0FZHS5AAAAABJRU5ErkJggg==")
     """Imagem do botão `Cancelar` na resolução `1920x1080`"""
 
     def __init__ (self, janela: JanelaW32) -> None:
@@ -1,4 +1,10 @@
 """Pacote para tratar o módulo `Peças / Compras` na janela `NBS ShortCut`"""
 
-from dclick.nbs.pecas_compras import lista
-from dclick.nbs.pecas_compras.setup import *
\ No newline at end of file
+import typing
+from dclick.importacao import sob_demanda
+from dclick.nbs.pecas_compras.setup import *
+
+if typing.TYPE_CHECKING:
+    from dclick.nbs.pecas_compras import lista
+
+__getattr__, __dir__ = sob_demanda(__name__, "lista")
\ No newline at end of file
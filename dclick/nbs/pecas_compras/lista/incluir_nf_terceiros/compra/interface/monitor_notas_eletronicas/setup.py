@@ -2,12 +2,12 @@
 from typing import Self
 # interno
 import dclick
-from dclick.nbs import DEFAULT_TIMEOUT
+from dclick.nbs import DEFAULT_TIMEOUT, TemplateImagem
 # externo
 import bot
 from bot.estruturas import String
 from bot.sistema.janela import ElementoW32
-from bot.imagem import Imagem, capturar_tela
+from bot.imagem import capturar_tela
 
 @bot.erro.adicionar_prefixo_classe("Falha na aba 'Pesquisar' da janela 'Monitor Notas Eletrônicas'")
 class AbaPesquisar:
@@ -16,7 +16,7 @@ class AbaPesquisar:
     janela: bot.sistema.JanelaW32
 
     NOME_ABA = "Pesquisar"
-    IMAGEM_COLUNA_EMISSAO = Imagem.FromBase64("iVBORw0KGgoAAAANSUhEUgAAADAAAAATCAIAAABZWBlIAAACWElEQVRIDc3BIZLdOBQF0Pv2Igf8ygqsFcghRk3FLCiTYR82C7GgzEQbmcRagbyC1AeRNtEruOOuzDToTFWGTI3PEZK4EiGJKxGSuBIhiSsRkvjvZCfD96Um2K+fSjT4PSGJU3YyrPhLv9TiFf5ZC9oiFa/we9npH38k2G7+vDMa/AtCEqfsZBsZDf5vQhKn7GQbGQ3etaDt4zPW9UC/7E8vw3ygX2r58k1bpPLlm+7mA6d+qcUroAXdzQdO/VKLVwBa0N184DTtjAZAC7qbDwD9UotX+IWQxCk7GVb81C+1eNWC7l6eavEIunt5qsUjaIuUYC3S/dFtI6MBspNtZDTZyTYyGiA72UZG04K2SMUrZCfbyGha0N3jzmiQnTzfavEKHwhJnLKTbWQ0eNeCtkjFqxa0RSpetaAtUoK1SAm2mw8A085ocGpBd/MBYNoZDX5qQXfzgVO/1OKrk21kNACyk21kNPhASOKUnWwjo8G7FrRFKl61oC1S8aoFbZESrEUqXgFoQXfzAUw7o8GbFnQ3H8C0M8LJgJ3RIDt5vtXiq5NtZDQAspNtZDT4QEjilJ1sI6PBuxa0RSpetaAtUvGqBW2REqzF/elleNwZDYDs5PlWE2z3uDMaANnJ862WT19lGxkNspPh+1KLR9Dd485okJ0832rxCh8ISZyyk2HF36adsQvaIhWvWtAWqXjVgrZICdYiFV+dDCve9EstXgHZybDiTb/U4hWyk2EFME3TumJnNGhBd/MBYNoZDX4lJHElQhJXIiRxJUISVyIkcSVC8vX1FZfxJ0EIY73AjKTzAAAAAElFTkSuQmCC")
+    IMAGEM_COLUNA_EMISSAO = TemplateImagem.FromBase64("iVBORw0KGgoAAAANSUhEUgAAADAAAAATCAIAAABZWBlIAAACWElEQVRIDc3BIZLdOBQF0Pv2Igf8ygqsFcghRk3FLCiTYR82C7GgzEQbmcRagbyC1AeRNtEruOOuzDToTFWGTI3PEZK4EiGJKxGSuBIhiSsRkvjvZCfD96Um2K+fSjT4PSGJU3YyrPhLv9TiFf5ZC9oiFa/we9npH38k2G7+vDMa/AtCEqfsZBsZDf5vQhKn7GQbGQ3etaDt4zPW9UC/7E8vw3ygX2r58k1bpPLlm+7mA6d+qcUroAXdzQdO/VKLVwBa0N184DTtjAZAC7qbDwD9UotX+IWQxCk7GVb81C+1eNWC7l6eavEIunt5qsUjaIuUYC3S/dFtI6MBspNtZDTZyTYyGiA72UZG04K2SMUrZCfbyGha0N3jzmiQnTzfavEKHwhJnLKTbWQ0eNeCtkjFqxa0RSpetaAtUoK1SAm2mw8A085ocGpBd/MBYNoZDX5qQXfzgVO/1OKrk21kNACyk21kNPhASOKUnWwjo8G7FrRFKl61oC1S8aoFbZESrEUqXgFoQXfzAUw7o8GbFnQ3H8C0M8LJgJ3RIDt5vtXiq5NtZDQAspNtZDT4QEjilJ1sI6PBuxa0RSpetaAtUvGqBW2REqzF/elleNwZDYDs5PlWE2z3uDMaANnJ862WT19lGxkNspPh+1KLR9Dd485okJ0832rxCh8ISZyyk2HF36adsQvaIhWvWtAWqXjVgrZICdYiFV+dDCve9EstXgHZybDiTb/U4hWyk2EFME3TumJnNGhBd/MBYNoZDX4lJHElQhJXIiRxJUISVyIkcSVC8vX1FZfxJ0EIY73AjKTzAAAAAElFTkSuQmCC")
     """Imagem da coluna `Emissão` na resolução `1920x1080`"""
 
     def __init__ (self, janela: bot.sistema.JanelaW32) -> None:
@@ -2,10 +2,9 @@
 from typing import Self
 # interno
 import dclick
-from dclick.nbs import DEFAULT_TIMEOUT
+from dclick.nbs import DEFAULT_TIMEOUT, TemplateImagem
 # externo
 import bot
-from bot.imagem import Imagem
 from bot.sistema.janela import ElementoW32
 
 def abrir_interface (janela: bot.sistema.JanelaW32) -> bot.sistema.JanelaW32:
@@ -30,7 +29,7 @@ class AbaFila:
     janela: bot.sistema.JanelaW32
 
     NOME_ABA = "Fila"
-    IMAGEM_BOTAO_CARREGAR = Imagem.FromBase64("iVBORw0KGgoAAAANSUhEUgAAAEUAAAAYCAIAAAAj/6dXAAAB9ElEQVRYCd3B0ancBhQA0bkdTEna0lyBS1qVNB3cgECgh/1CfpKYPWcqPshUfJCp+CBT8UGm4nsqv6j4U03F99Td5WFmgIo/0lR8T91dHmZmd2em4hcqt4r/3FR8T93dmQF2F5gZbhUPasVNrfhvTcXDz58/f/z4wcPu8jszU/GgVvyvpuJB3V0YWJgZdndm+Gp3Z6biQa34hcqlAlSgUoEKULlUXFRuFaByqQAVqHiYipu6uzCwMLAzs7v8zsxUPKgV31MrtQLUClArLmqlVlzUige1Uiu+moqbugssDCzMDLs7M3y1uzNT8aBW/ELlVqkVoFaAykOlVlzUClC5VWrFV1NxU3cXBhYGdmZ2l9+ZmYoHteIrteKiVmoFqBWgVjyoFRe1UisuaqVWfDUVN3UXWJgZ/sbuzkzFg1pxUyu14qJWagWoFaBWXNRKrbiolVpxUSu14qupuKm7CzPDLuf5Po7Xeb6P43We7+N4nef7OF4z7O7MVHylcqu4qNwqtQLUiovKpeKicqsAlVulVnw1FTd1lxl2Oc/3cbzO830cr/N8H8frPN/H8Zphd4GZqfj3qRX/zFTcVGCX83wfx+s838fxOs/3cbzO830crxmeKv4dKreKf2wqHlS+V/Fnm4oPMhUfZCo+yFR8kKn4IFPxQf4CgFekqOafKngAAAAASUVORK5CYII=")
+    IMAGEM_BOTAO_CARREGAR = TemplateImagem.FromBase64("iVBORw0KGgoAAAANSUhEUgAAAEUAAAAYCAIAAAAj/6dXAAAB9ElEQVRYCd3B0ancBhQA0bkdTEna0lyBS1qVNB3cgECgh/1CfpKYPWcqPshUfJCp+CBT8UGm4nsqv6j4U03F99Td5WFmgIo/0lR8T91dHmZmd2em4hcqt4r/3FR8T93dmQF2F5gZbhUPasVNrfhvTcXDz58/f/z4wcPu8jszU/GgVvyvpuJB3V0YWJgZdndm+Gp3Z6biQa34hcqlAlSgUoEKULlUXFRuFaByqQAVqHiYipu6uzCwMLAzs7v8zsxUPKgV31MrtQLUClArLmqlVlzUige1Uiu+moqbugssDCzMDLs7M3y1uzNT8aBW/ELlVqkVoFaAykOlVlzUClC5VWrFV1NxU3cXBhYGdmZ2l9+ZmYoHteIrteKiVmoFqBWgVjyoFRe1UisuaqVWfDUVN3UXWJgZ/sbuzkzFg1pxUyu14qJWagWoFaBWXNRKrbiolVpxUSu14qupuKm7CzPDLuf5Po7Xeb6P43We7+N4nef7OF4z7O7MVHylcqu4qNwqtQLUiovKpeKicqsAlVulVnw1FTd1lxl2Oc/3cbzO830cr/N8H8frPN/H8Zphd4GZqfj3qRX/zFTcVGCX83wfx+s838fxOs/3cbzO830crxmeKv4dKreKf2wqHlS+V/Fnm4oPMhUfZCo+yFR8kKn4IFPxQf4CgFekqOafKngAAAAASUVORK5CYII=")
     """Imagem do botão `Carregar` na resolução `1920x1080`"""
 
     def __init__ (self, janela: bot.sistema.JanelaW32) -> None:
@@ -182,7 +181,7 @@ class Confirmar:
 
     janela: bot.sistema.JanelaW32
 
-    IMAGEM_BOTAO_ACEITAR = Imagem.FromBase64("iVBORw0KGgoAAAANSUhEUgAAAGkAAAAeCAIAAACgx6cUAAABrElEQVRoBe3B0WkkWRAAwSwP0n8r04M69sFA6+5n1cwITnTEVDxumYrHLVPxuGUqHrdMxeOWqXjcMhWPW6bik1Sg4teZio9Rd4GdmYrfZSo+Rt1dmBkqfpep+Bh1F9iZqfhdpuJj1N2FmaHiL6gV36FW/Lip+CR1d2Fm+JeK/1Arvk+t+EFT8W4qF7vAwszALjMcFV+plVrxTWrFD5qKd1N3FwYWBhYGdmbYZYaj4iu1UiteVI6KQ+WoALVSgQpQOSpABSreaireTeXYBRYGFmYGdpnhqLhQKw61AtSKQ63UikOt1Eqt+Eqt1Ip3m4p3U3cXBhYGFgZ2ZthlhqPiQq041ApQKy5ULiq1UisOlZdKrXi3qfgAFdgFFgYWZgZ2meGouFC5qAC14kKtuFArtQLUikOt1Ip3m4oPUHeBhYGFmeGPXWY4Kl7Uigu1UisOtVIrDrVSK7UC1IpDrdSKd5uKz1C5qFSOXWaoeFErLtQKUDkqDpWjAtQKUCtA5aVSK95tKn6WylHxfzYVj1um4nHLVDxumYrHLVPxuGUqHrdMxeOWqXjcMhWPW/4BBHZtjv1KCgIAAAAASUVORK5CYII=")
+    IMAGEM_BOTAO_ACEITAR = TemplateImagem.FromBase64("iVBORw0KGgoAAAANSUhEUgAAAGkAAAAeCAIAAACgx6cUAAABrElEQVRoBe3B0WkkWRAAwSwP0n8r04M69sFA6+5n1cwITnTEVDxumYrHLVPxuGUqHrdMxeOWqXjcMhWPW6bik1Sg4teZio9Rd4GdmYrfZSo+Rt1dmBkqfpep+Bh1F9iZqfhdpuJj1N2FmaHiL6gV36FW/Lip+CR1d2Fm+JeK/1Arvk+t+EFT8W4qF7vAwszALjMcFV+plVrxTWrFD5qKd1N3FwYWBhYGdmbYZYaj4iu1UiteVI6KQ+WoALVSgQpQOSpABSreaireTeXYBRYGFmYGdpnhqLhQKw61AtSKQ63UikOt1Eqt+Eqt1Ip3m4p3U3cXBhYGFgZ2ZthlhqPiQq041ApQKy5ULiq1UisOlZdKrXi3qfgAFdgFFgYWZgZ2meGouFC5qAC14kKtuFArtQLUikOt1Ip3m4oPUHeBhYGFmeGPXWY4Kl7Uigu1UisOtVIrDrVSK7UC1IpDrdSKd5uKz1C5qFSOXWaoeFErLtQKUDkqDpWjAtQKUCtA5aVSK95tKn6WylHxfzYVj1um4nHLVDxumYrHLVPxuGUqHrdMxeOWqXjcMhWPW/4BBHZtjv1KCgIAAAAASUVORK5CYII=")
     """Imagem do botão `Aceitar` na resolução `1920x1080`"""
 
     def __init__ (self, janela: bot.sistema.JanelaW32) -> None:
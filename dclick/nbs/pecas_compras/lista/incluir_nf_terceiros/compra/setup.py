@@ -2,12 +2,12 @@
 from typing import Self
 # interno
 import dclick
-from dclick.nbs import DEFAULT_TIMEOUT
+from dclick.nbs import DEFAULT_TIMEOUT, TemplateImagem
 # externo
 import bot
 from bot.estruturas import String
 from bot.sistema.janela import ElementoW32
-from bot.imagem import Imagem, capturar_tela
+from bot.imagem import capturar_tela
 
 def clicar_botao_recalculo (janela_entrada_nf: bot.sistema.JanelaW32,
                             xy_offset: tuple[float, float] = (0.3, 0.5)) -> None:
@@ -58,7 +58,7 @@ class AbaFinanceiro:
     janela: bot.sistema.JanelaW32
 
     NOME_ABA = "Financeiro"
-    IMAGEM_BOTAO_GERAR = Imagem.FromBase64("iVBORw0KGgoAAAANSUhEUgAAAEQAAAAdCAIAAACc8F3aAAABxUlEQVRYCd3BAW4cNxBFwfdPpr5ZkzcjT/YiEVhg5WQmARzDxlRF5Smi8hRReYqoPEVUniIqTxGVp4jKT5tzjtEwtfl9ovIT5pxjNF/mGHQ3v09Ubu29uVD1wZc5Bt0NzDk5upvvkvCi8gtE5dbeu+pjjFlVvKn6gDkGn7p7zsmb7uZNEpWXJCr/t6jc2ntXLegxZlVxVH3AHIOqWmvxprv5myQqv1hUbu2911pj9BiTY4yGOQZVBay1OLqbC0lU/kkSDhVIAqhAEg4VSAKoXIjKrb03UPUBjDHHaJhjUFXAWouju7mWRAWScKhAEpUjiZpE5bskahKVa1G5tfcGqhY0X+YYVBWw1uLobm4lUXlJogJJeKMmUTmS8KImUbkWlVt7b2CtNQafxuBTVa21eOlubiVReUmiAklU3iRRgSQqRxI1icq1qNzae3NUrTH4QVWttbqbW0lUjiSACiRROZKoSVQgicqRRE2ici0qt/bevFlr8VJVwFqru/k3STjUJCpHEg4VSKJyJOFFTaJyLSq39t58t9YCqopjrdXd/AGicm3OyX/Q3fwBovIUUXmKqDxFVJ4iKk8RlaeIylNE5Smi8hR/AZr8U9as1DM4AAAAAElFTkSuQmCC")
+    IMAGEM_BOTAO_GERAR = TemplateImagem.FromBase64("iVBORw0KGgoAAAANSUhEUgAAAEQAAAAdCAIAAACc8F3aAAABxUlEQVRYCd3BAW4cNxBFwfdPpr5ZkzcjT/YiEVhg5WQmARzDxlRF5Smi8hRReYqoPEVUniIqTxGVp4jKT5tzjtEwtfl9ovIT5pxjNF/mGHQ3v09Ubu29uVD1wZc5Bt0NzDk5upvvkvCi8gtE5dbeu+pjjFlVvKn6gDkGn7p7zsmb7uZNEpWXJCr/t6jc2ntXLegxZlVxVH3AHIOqWmvxprv5myQqv1hUbu2911pj9BiTY4yGOQZVBay1OLqbC0lU/kkSDhVIAqhAEg4VSAKoXIjKrb03UPUBjDHHaJhjUFXAWouju7mWRAWScKhAEpUjiZpE5bskahKVa1G5tfcGqhY0X+YYVBWw1uLobm4lUXlJogJJeKMmUTmS8KImUbkWlVt7b2CtNQafxuBTVa21eOlubiVReUmiAklU3iRRgSQqRxI1icq1qNzae3NUrTH4QVWttbqbW0lUjiSACiRROZKoSVQgicqRRE2ici0qt/bevFlr8VJVwFqru/k3STjUJCpHEg4VSKJyJOFFTaJyLSq39t58t9YCqopjrdXd/AGicm3OyX/Q3fwBovIUUXmKqDxFVJ4iKk8RlaeIylNE5Smi8hR/AZr8U9as1DM4AAAAAElFTkSuQmCC")
     """Imagem do botão `Gerar` na resolução `1920x1080`"""
 
     def __init__ (self, janela: bot.sistema.JanelaW32) -> None:
@@ -1,10 +1,9 @@
 # interno
 import dclick
-from dclick.nbs import DEFAULT_TIMEOUT
+from dclick.nbs import DEFAULT_TIMEOUT, TemplateImagem
 from .incluir_nf_terceiros import OpcoesInclusaoNfTerceiros
 # externo
 import bot
-from bot.imagem import Imagem
 from bot.sistema.janela import ElementoW32
 
 @bot.erro.adicionar_prefixo_classe("Falha na aba 'Lista' da janela 'Compras'")
@@ -14,7 +13,7 @@ class AbaLista:
     janela: bot.sistema.JanelaW32
 
     NOME_ABA = "Lista"
-    IMAGEM_INCLUIR_NF_TERCEIROS = Imagem.FromBase64("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAADkAAAAcCAIAAABUG4BXAAABMklEQVRYCdXBQXIaUQBEsX73P7RC/dVgHGI2To0UdhNhNxF2E2E3EXYTYTcR9qFqB/aLwt6qsatqB/aLwt6qPbD/Luyi9gZb7YG9qLCfqbAXFfadsIvaG2y1B/aiwn6mwj4R9lbtgf1Thf1MhX0i7K0a+6Lahl1U2Fah2oYd1Q5sq1BhR4UK1TbsIuxz1TbsosK2ahu2Vaiwo0KFCjsqVKiwZ2Gvag/sExW2VdhRocIuKlTYUaFChT0Le1V7YH9RbcMuKmyrsKNChV1UqLCjQoUKexZ2VfuCvai2YRcVtlXYUaHCjgoVKmyrtqFChT0Lu6p9wX6mwrYKOypsq3ZgW4Vt1TZUqFBhz8Je1R7Yd6od2C8Ke1V7YN+pdmC/KOwmwm4i7CbCbiLsJsJuIuwmwm7iD3atRNj/aR7WAAAAAElFTkSuQmCC")
+    IMAGEM_INCLUIR_NF_TERCEIROS = TemplateImagem.FromBase64("data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAADkAAAAcCAIAAABUG4BXAAABMklEQVRYCdXBQXIaUQBEsX73P7RC/dVgHGI2To0UdhNhNxF2E2E3EXYTYTcR9qFqB/aLwt6qsatqB/aLwt6qPbD/Luyi9gZb7YG9qLCfqbAXFfadsIvaG2y1B/aiwn6mwj4R9lbtgf1Thf1MhX0i7K0a+6Lahl1U2Fah2oYd1Q5sq1BhR4UK1TbsIuxz1TbsosK2ahu2Vaiwo0KFCjsqVKiwZ2Gvag/sExW2VdhRocIuKlTYUaFChT0Le1V7YH9RbcMuKmyrsKNChV1UqLCjQoUKexZ2VfuCvai2YRcVtlXYUaHCjgoVKmyrtqFChT0Lu6p9wX6mwrYKOypsq3ZgW4Vt1TZUqFBhz8Je1R7Yd6od2C8Ke1V7YN+pdmC/KOwmwm4i7CbCbiLsJsJuIuwmwm7iD3atRNj/aR7WAAAAAElFTkSuQmCC")
     """Imagem do botão `Incluir` na resolução `1920x1080`"""
 
     def __init__ (self, janela: bot.sistema.JanelaW32) -> None:
@@ -0,0 +1,97 @@
+# std
+from __future__ import annotations
+import io, base64, typing, threading
+# externo
+from bot.imagem import Imagem
+
+class TemplateImagem:
+    """Imagem de template embutida em `base64` decodificada apenas no primeiro uso
+    - Substitui o `Imagem.FromBase64()` nas constantes dos módulos, evitando decodificar todas as imagens na importação
+    - Imagem decodificada mantida em cache após o primeiro uso
+    - Atributos e métodos da `Imagem` acessíveis diretamente. Ex: `template.largura`
+    - `variante()` para obter a imagem em tons de cinza ou redimensionada, também mantida em cache
+    - `procurar_imagem()` procura pela `variante()` correspondente ao `cinza` e `escala`, sem converter o template a cada chamada
+    - Seguro entre threads
+
+    ### Exemplo
+    ```
+    IMAGEM_MODULO = TemplateImagem.FromBase64("data:image/png;base64,iVBORw0KGgo...")
+    posicao = IMAGEM_MODULO.procurar_imagem(regiao=coordenada, cinza=True)
+    ```"""
+
+    conteudo: str
+    """Conteúdo `base64` da imagem, com ou sem o prefixo `data:image/png;base64,`"""
+
+    def __init__ (self, conteudo: str) -> None:
+        self.conteudo = conteudo
+        self._imagem: Imagem | None = None
+        self._variantes = dict[tuple[bool, float], Imagem]()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def FromBase64 (cls, conteudo: str) -> TemplateImagem:
+        """Criar o template a partir do `conteudo` em `base64`, sem decodificá-lo
+        - Mesmo formato aceito pelo `Imagem.FromBase64()`"""
+        return cls(conteudo)
+
+    def __repr__ (self) -> str:
+        return f"<TemplateImagem decodificado={self.decodificado} variantes={len(self._variantes)}>"
+
+    def __getattr__ (self, nome: str) -> typing.Any:
+        # Chamado apenas para os atributos não presentes no template
+        if nome.startswith("_"): raise AttributeError(nome)
+        return getattr(self.imagem, nome)
+
+    @property
+    def decodificado (self) -> bool:
+        """Indicador se a imagem já foi decodificada"""
+        return self._imagem is not None
+
+    @property
+    def imagem (self) -> Imagem:
+        """Imagem decodificada no primeiro acesso"""
+        if self._imagem is None:
+            with self._lock:
+                if self._imagem is None:
+                    self._imagem = Imagem.FromBase64(self.conteudo)
+        return self._imagem
+
+    def procurar_imagem (self, *args: typing.Any, cinza: bool = False, escala: float = 1.0, **kwargs: typing.Any) -> typing.Any:
+        """Procurar o template na tela pela `variante(cinza, escala)` mantida em cache
+        - `args` e `kwargs` repassados ao `Imagem.procurar_imagem()`
+        - `cinza` repassado para a captura da tela também ser convertida"""
+        return self.variante(cinza, escala).procurar_imagem(*args, cinza=cinza, **kwargs)
+
+    def variante (self, cinza: bool = False, escala: float = 1.0) -> Imagem:
+        """Obter a imagem em tons de cinza e/ou redimensionada pela `escala`
+        - Criada apenas no primeiro uso de cada combinação e mantida em cache
+        - `cinza=False, escala=1.0` retorna a própria `imagem`
+        - Útil para procurar o template em resoluções diferentes de `1920x1080`"""
+        if not cinza and escala == 1.0: return self.imagem
+        chave = (cinza, escala)
+        imagem = self._variantes.get(chave)
+        if imagem is not None: return imagem
+
+        with self._lock:
+            imagem = self._variantes.get(chave)
+            if imagem is None:
+                imagem = self._variantes[chave] = self._criar_variante(cinza, escala)
+        return imagem
+
+    def _criar_variante (self, cinza: bool, escala: float) -> Imagem:
+        # `pillow` instalado pela dependência `bot[imagem]`
+        from PIL import Image
+        conteudo = self.conteudo.split(",", 1)[-1] if self.conteudo.startswith("data:") else self.conteudo
+        pillow = Image.open(io.BytesIO(base64.b64decode(conteudo)))
+        if cinza: pillow = pillow.convert("L").convert("RGB")
+        if escala != 1.0:
+            largura, altura = pillow.size
+            pillow = pillow.resize((max(1, round(largura * escala)), max(1, round(altura * escala))), Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        pillow.save(buffer, format="PNG")
+        return Imagem.FromBase64(base64.b64encode(buffer.getvalue()).decode())
+
+__all__ = [
+    "TemplateImagem",
+]
@@ -1,6 +1,6 @@
 # std
 from typing import Self
-import certifi, functools
+import certifi
 # interno
 import dclick
 from dclick.nora import modelos
@@ -8,16 +8,19 @@ from dclick.nora import modelos
 import bot
 from bot.estruturas.filas import Queue
 
-@functools.cache
+@dclick.http.registro_clientes.cliente("nora")
 def client_singleton () -> dclick.http.ClienteHttp:
     """Criar o http `Client` configurado com o `host`, `token` e timeout
-    - O Client ficará aberto após a primeira chamada na função devido ao `@cache`"""
+    - Client gerenciado pelo `registro_clientes`: criado na primeira chamada, fechado ao final da execução e recriado após `fork` ou alteração da seção
+    - Opções de conexão, timeouts e retentativas conforme as variáveis da seção `[nora]`"""
     host, apikey = bot.config.nora.obter("host", "apikey")
-    return dclick.http.ClienteHttp(
+    return dclick.http.ClienteHttp.FromConfig(
+        "nora",
+        timeout  = 60,
         base_url = host,
         headers  = { "x-api-key": apikey },
-        timeout  = 60,
         verify   = certifi.where(),
+        compartilhar_transporte = True,
         follow_redirects = True,
     )
 
@@ -0,0 +1,298 @@
+# std
+import time, typing, asyncio, tempfile, itertools, threading
+# interno
+from dclick.holmes import aio, cache_modelos, Tarefa, Processo
+from dclick.http import ClienteHttp, ClienteHttpAsync, registro_clientes
+# externo
+import httpx
+import pytest
+from bot.estruturas import Caminho
+
+DATA = "2024-01-01T00:00:00.000Z"
+
+def tarefa_json (id_tarefa: str, assignee_id: str | None = None) -> dict:
+    return {
+        "id": id_tarefa, "name": "Conferência", "status": "opened", "task_id": id_tarefa,
+        "identifier": "TAR-1", "template_id": "template", "assignee_id": assignee_id,
+        "process_id": f"processo_{id_tarefa}", "process_name": "Processo", "process_status": "opened",
+        "process_created_at": DATA,
+        "tables": [{ "id": "tabela", "name": "Itens" }],
+        "actions": [{ "id": "aprovar", "name": "Aprovar" }],
+        "documents": [{ "id": "documento", "conditional": "Documento" }],
+        "properties": [],
+    }
+
+class Servidor:
+    """Respostas do Holmes pelo `httpx.MockTransport` registrando a concorrência máxima dos requests"""
+
+    def __init__ (self, responder, latencia: float = 0.05) -> None:
+        self.responder = responder
+        self.latencia = latencia
+        self.caminhos = list[str]()
+        self.simultaneos = self.maximo_simultaneos = 0
+        self.lock = threading.Lock()
+
+    def __call__ (self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.caminhos.append(request.url.path)
+            self.simultaneos += 1
+            self.maximo_simultaneos = max(self.maximo_simultaneos, self.simultaneos)
+        try:
+            time.sleep(self.latencia)
+            return self.responder(request)
+        finally:
+            with self.lock: self.simultaneos -= 1
+
+@pytest.fixture
+def registrar_holmes ():
+    """Registrar o cliente `holmes` com as respostas de um `Servidor`
+    - Cliente de teste fechado e registro original restaurado ao final"""
+    original = registro_clientes._registros.get("holmes")
+
+    def registrar (servidor: Servidor) -> None:
+        registro_clientes.registrar(
+            "holmes",
+            lambda: ClienteHttp(base_url="http://holmes", transport=httpx.MockTransport(servidor))
+        )
+
+    yield registrar
+    registro_clientes.fechar("holmes")
+    if original is None: registro_clientes._registros.pop("holmes", None)
+    else: registro_clientes._registros["holmes"] = original
+
+@pytest.fixture
+def registrar_holmes_async ():
+    """Registrar o cliente assíncrono `holmes` com as respostas do `responder`
+    - Clientes de teste fechados pelo `asyncio.run()` e registro original restaurado ao final"""
+    original = registro_clientes._registros_async.get("holmes")
+
+    def registrar (responder) -> None:
+        registro_clientes.registrar_async(
+            "holmes",
+            lambda: ClienteHttpAsync(base_url="http://holmes", transport=httpx.MockTransport(responder))
+        )
+
+    yield registrar
+    if original is None: registro_clientes._registros_async.pop("holmes", None)
+    else: registro_clientes._registros_async["holmes"] = original
+
+@pytest.fixture
+def cache_habilitado ():
+    cache_modelos.ttl = 60
+    cache_modelos.limpar()
+    yield cache_modelos
+    cache_modelos.ttl = None
+    cache_modelos.limpar()
+
+def test_cache_modelos_retorna_copia (cache_habilitado) -> None:
+    original = { "id": "1", "documents": [] }
+    cache_modelos.armazenar("tarefa", "1", original)
+    original["documents"].append("alterado")
+
+    obtido = cache_modelos.obter("tarefa", "1")
+    assert obtido == { "id": "1", "documents": [] }
+    obtido["id"] = "alterado"
+    assert cache_modelos.obter("tarefa", "1")["id"] == "1"
+
+def test_aio_escritas_invalidam_cache (cache_habilitado, registrar_holmes_async) -> None:
+    consultas = list[str]()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            consultas.append(request.url.path)
+            return httpx.Response(200, json=tarefa_json("t1"))
+        return httpx.Response(204 if request.url.path.endswith("/documento") else 200, json={})
+
+    registrar_holmes_async(responder)
+
+    async def main () -> None:
+        tarefa = await aio.consultar_tarefa("t1")
+        assert (await aio.consultar_tarefa("t1")).assignee_id is None
+        assert len(consultas) == 1
+
+        await aio.assumir_tarefa(tarefa, "usuario")
+        await aio.consultar_tarefa("t1")
+        assert len(consultas) == 2
+
+        await aio.anexar_documento(tarefa, "documento", ("a.txt", b"abc"))
+        await aio.consultar_tarefa("t1")
+        assert len(consultas) == 3
+
+        cache_modelos.armazenar("processo", "processo_t1", object())
+        await aio.tomar_acao(tarefa, "Aprovar")
+        assert len(consultas) == 4
+        assert cache_modelos.obter("processo", "processo_t1") is None
+
+    asyncio.run(main())
+
+def test_consultar_muitos_concorrente_com_erros_prefixados (registrar_holmes) -> None:
+    def responder (request: httpx.Request) -> httpx.Response:
+        id_tarefa = request.url.path.rsplit("/", 1)[-1]
+        if id_tarefa == "erro": return httpx.Response(500, json={ "message": "indisponível" })
+        return httpx.Response(200, json=tarefa_json(id_tarefa))
+
+    servidor = Servidor(responder)
+    registrar_holmes(servidor)
+    resultado = Tarefa.ConsultarMuitos(["t1", "erro", "t2", "t1", "t3"], concorrencia=4)
+
+    assert resultado.ids == ["t1", "erro", "t2", "t3"]
+    assert [tarefa.id for tarefa in resultado] == ["t1", "t2", "t3"]
+    assert sorted(servidor.caminhos) == ["/v1/tasks/erro", "/v1/tasks/t1", "/v1/tasks/t2", "/v1/tasks/t3"]
+    assert servidor.maximo_simultaneos > 1
+    assert "Falha Tarefa.Consultar(id_tarefa='erro') no Holmes" in str(resultado.erros["erro"])
+    with pytest.raises(Exception, match=r"Tarefa\.Consultar\(id_tarefa='erro'\)"):
+        resultado.esperar_sucesso()
+
+def itens_json (page: int, per_page: int, total: int) -> dict:
+    inicio = (page - 1) * per_page
+    return { "items": [
+        { "id": f"item{indice}", "created_at": DATA, "updated_at": None, "property_values": [] }
+        for indice in range(inicio, min(inicio + per_page, total))
+    ]}
+
+def test_iterar_itens_tabela_consulta_proxima_pagina_antecipadamente (registrar_holmes) -> None:
+    def responder (request: httpx.Request) -> httpx.Response:
+        page, per_page = int(request.url.params["page"]), int(request.url.params["per_page"])
+        return httpx.Response(200, json=itens_json(page, per_page, 25))
+
+    servidor = Servidor(responder, latencia=0.3)
+    registrar_holmes(servidor)
+    tarefa = Tarefa.Unmarshal(tarefa_json("t1"))
+    itens = tarefa.IterarItensTabela("Itens", per_page=10)
+
+    primeiro = next(itens)
+    assert primeiro.id == "item0"
+    # Página 2 ainda em andamento enquanto os itens da página 1 são processados
+    time.sleep(0.1)
+    assert servidor.simultaneos == 1 and len(servidor.caminhos) == 2
+    assert [item.id for item in itens] == [f"item{indice}" for indice in range(1, 25)]
+
+def test_iterar_itens_tabela_sem_prefetch_e_encerramento_antecipado (registrar_holmes) -> None:
+    def responder (request: httpx.Request) -> httpx.Response:
+        page, per_page = int(request.url.params["page"]), int(request.url.params["per_page"])
+        return httpx.Response(200, json=itens_json(page, per_page, 25))
+
+    servidor = Servidor(responder, latencia=0.2)
+    registrar_holmes(servidor)
+    tarefa = Tarefa.Unmarshal(tarefa_json("t1"))
+
+    # Sem o `prefetch` a página 2 é consultada apenas após o último item da página 1
+    itens = tarefa.IterarItensTabela("Itens", per_page=10, prefetch=False)
+    assert [item.id for item in itertools.islice(itens, 10)] == [f"item{indice}" for indice in range(10)]
+    assert len(servidor.caminhos) == 1
+    assert next(itens).id == "item10" and len(servidor.caminhos) == 2
+    itens.close()
+    assert len(servidor.caminhos) == 2
+
+    # Com o `prefetch` o encerramento aguarda a consulta antecipada em andamento
+    servidor.caminhos.clear()
+    itens = tarefa.IterarItensTabela("Itens", per_page=10)
+    next(itens)
+    time.sleep(0.05)
+    itens.close()
+    assert len(servidor.caminhos) == 2 and servidor.simultaneos == 0
+
+def test_iterar_itens_tabela_erro_apos_itens_anteriores (registrar_holmes) -> None:
+    def responder (request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == 2: return httpx.Response(500, json={ "message": "indisponível" })
+        return httpx.Response(200, json=itens_json(page, 10, 25))
+
+    registrar_holmes(Servidor(responder))
+    tarefa = Tarefa.Unmarshal(tarefa_json("t1"))
+    recebidos = list[str]()
+    with pytest.raises(Exception, match="tabela"):
+        for item in tarefa.IterarItensTabela("Itens", per_page=10):
+            recebidos.append(item.id)
+    assert len(recebidos) == 10
+
+def documentos_json (conteudos: list[bytes]) -> dict:
+    return { "documents": [
+        { "id": f"item{indice}", "name": f"Documento {indice}", "status": "active", "file": True,
+          "file_name": "documento.pdf", "document_id": f"documento{indice}", "created_at": DATA, "removed": False }
+        for indice in range(len(conteudos))
+    ]}
+
+def test_baixar_documentos_concorrente_sem_repetir_conteudo (tmp_path, registrar_holmes) -> None:
+    conteudos = [b"a" * 1000, b"b" * 1000, b"a" * 1000, b"a" * 1000, b"erro", b"b" * 1000]
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/documents"):
+            return httpx.Response(200, json=documentos_json(conteudos))
+        indice = int(request.url.path.split("/")[-2].removeprefix("documento"))
+        if conteudos[indice] == b"erro": return httpx.Response(500)
+        return httpx.Response(200, content=conteudos[indice])
+
+    servidor = Servidor(responder)
+    registrar_holmes(servidor)
+    processo = Processo.Unmarshal({ "id": "p1", "name": "Processo", "status": "opened", "identifier": "PRO-1",
+                                    "solution_id": "solucao", "created_at": DATA, "current_activities": [] })
+    manifesto = processo.BaixarDocumentos(Caminho(str(tmp_path)), concorrencia=4)
+
+    assert servidor.maximo_simultaneos > 1
+    assert [baixado.item.document_id for baixado in manifesto] == [f"documento{indice}" for indice in range(6)]
+    assert manifesto[4].erro is not None and manifesto[4].caminho is None
+    salvos = [baixado for baixado in manifesto if baixado.sucesso and baixado.duplicado_de is None]
+    assert len(salvos) == 2
+    assert sorted(arquivo.name for arquivo in tmp_path.iterdir()) == ["documento.pdf", "documento_2.pdf"]
+    for baixado in manifesto:
+        if baixado.sucesso:
+            with open(baixado.caminho.path, "rb") as arquivo:
+                assert arquivo.read() == conteudos[int(baixado.item.document_id.removeprefix("documento"))]
+
+def test_baixar_documentos_registra_erro_do_filtro (tmp_path, registrar_holmes) -> None:
+    conteudos = [b"a", b"b", b"c"]
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/documents"):
+            return httpx.Response(200, json=documentos_json(conteudos))
+        indice = int(request.url.path.split("/")[-2].removeprefix("documento"))
+        return httpx.Response(200, content=conteudos[indice])
+
+    def filtro (item) -> bool:
+        if item.document_id == "documento1": raise ValueError("filtro inválido")
+        return True
+
+    servidor = Servidor(responder, latencia=0)
+    registrar_holmes(servidor)
+    processo = Processo.Unmarshal({ "id": "p1", "name": "Processo", "status": "opened", "identifier": "PRO-1",
+                                    "solution_id": "solucao", "created_at": DATA, "current_activities": [] })
+    manifesto = processo.BaixarDocumentos(Caminho(str(tmp_path)), filtro=filtro)
+
+    assert [baixado.item.document_id for baixado in manifesto] == ["documento0", "documento1", "documento2"]
+    assert isinstance(manifesto[1].erro, ValueError)
+    assert manifesto[1].as_dict()["erro"] == "ValueError: filtro inválido"
+    assert manifesto[0].sucesso and manifesto[2].sucesso
+    assert "/v1/documents/documento1/download" not in servidor.caminhos
+
+def test_aio_consultar_documentos_em_disco_cancela_e_remove_temporarios (tmp_path, monkeypatch, registrar_holmes_async) -> None:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    iniciados = list[str]()
+
+    async def partes () -> typing.AsyncIterator[bytes]:
+        for _ in range(20):
+            await asyncio.sleep(0.05)
+            yield b"a" * 100
+
+    async def responder (request: httpx.Request) -> httpx.Response:
+        document_id = request.url.path.split("/")[-2]
+        iniciados.append(document_id)
+        if document_id == "erro":
+            await asyncio.sleep(0.1)
+            return httpx.Response(500)
+        return httpx.Response(200, content=partes())
+
+    registrar_holmes_async(responder)
+
+    async def main () -> None:
+        with pytest.raises(Exception):
+            await aio.consultar_documentos(["d1", "d2", "erro", "d3"], concorrencia=3, em_disco=True)
+        # Downloads cancelados já concluídos ao propagar o erro, sem arquivos temporários restantes
+        assert {"d1", "d2", "erro"} <= set(iniciados)
+        assert list(tmp_path.iterdir()) == []
+
+        documento, = await aio.consultar_documentos(["d1"], em_disco=True)
+        assert len(list(tmp_path.iterdir())) == 1
+        documento.fechar()
+
+    asyncio.run(main())
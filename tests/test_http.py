@@ -0,0 +1,952 @@
+# std
+import os, gc, gzip, json, time, zlib, typing, asyncio, threading, contextlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.etree import ElementTree
+# interno
+import dclick
+from dclick.http import (ClienteHttp, ClienteHttpAsync, RegistroClientes, PoliticaRetentativa, decodificar_json, iterar_array_json,
+                         CacheHttp, CacheMemoria, CacheDisco, Coalescencia, LimiteTaxa, Disjuntor, DisjuntorAberto,
+                         Cassete, TransporteGravacao, TransporteGravacaoAsync, TransporteReproducao, InteracaoNaoGravada, REDIGIDO,
+                         CompressaoRequest, CaminhoXML, ExtratorXML, iterar_xml, TransporteCompartilhado)
+# externo
+import httpx
+import pytest
+from bot.estruturas import Caminho
+
+def test_disjuntor_desabilitado_sem_configuracao () -> None:
+    client = ClienteHttp.FromConfig("secao_sem_configuracao")
+    try: assert client.disjuntor is None
+    finally: client.close()
+
+def test_metricas_desabilitadas_sem_configuracao () -> None:
+    client = ClienteHttp.FromConfig("secao_sem_configuracao")
+    try: assert client.metricas is None
+    finally: client.close()
+
+def test_registro_fecha_cliente_substituido_ao_liberar () -> None:
+    fechados = list[int]()
+
+    class Transporte (httpx.MockTransport):
+        def close (self) -> None:
+            fechados.append(1)
+
+    registro = RegistroClientes()
+    fabrica = lambda: ClienteHttp(transport=Transporte(lambda request: httpx.Response(200)))
+    registro.registrar("teste", fabrica, "secao_sem_configuracao")
+    anterior = registro.obter("teste")
+    registro.registrar("teste", fabrica, "secao_sem_configuracao")
+
+    assert registro.obter("teste") is not anterior
+    assert anterior.get("http://teste/").status_code == 200 and not fechados
+    del anterior
+    gc.collect()
+    assert fechados == [1]
+    registro.fechar()
+
+def test_registro_transporte_compartilhado_liberado_uma_vez_por_cliente () -> None:
+    registro = RegistroClientes()
+    fabrica = lambda: ClienteHttp(base_url="http://teste", transport=registro.transporte("http://teste"))
+    registro.registrar("teste", fabrica, "secao_sem_configuracao")
+    velho = registro.obter("teste")
+    registro.registrar("teste", fabrica, "secao_sem_configuracao")
+    novo = registro.obter("teste")
+
+    transporte = getattr(novo, "_transport")
+    assert transporte is not getattr(velho, "_transport") and transporte.transporte is getattr(velho, "_transport").transporte
+    assert transporte.referencias == 2
+
+    # `close()` explícito seguido da coleta do cliente substituído libera apenas a sua referência
+    velho.close()
+    velho.close()
+    del velho
+    gc.collect()
+    assert transporte.referencias == 1 and not transporte.fechado
+
+    registro.fechar()
+    assert transporte.referencias == 0 and transporte.fechado
+    novo_transporte = registro.transporte("http://teste")
+    assert novo_transporte is not None and novo_transporte.transporte is not transporte.transporte
+    novo_transporte.close()
+
+def test_transporte_compartilhado_mantem_proxies_do_ambiente (monkeypatch: pytest.MonkeyPatch) -> None:
+    for variavel in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(variavel, raising=False)
+        monkeypatch.delenv(variavel.lower(), raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local:3128")
+    monkeypatch.setenv("NO_PROXY", "interno.local")
+
+    client = ClienteHttp.FromConfig("secao_sem_configuracao", base_url="https://api.local", compartilhar_transporte=True)
+    padrao = httpx.Client(base_url="https://api.local")
+    try:
+        assert set(getattr(client, "_mounts")) == set(getattr(padrao, "_mounts"))
+        proxy = getattr(client, "_transport_for_url")(httpx.URL("https://api.local/"))
+        direto = getattr(client, "_transport_for_url")(httpx.URL("https://interno.local/"))
+        assert isinstance(proxy, TransporteCompartilhado) and proxy is not getattr(client, "_transport")
+        assert type(proxy._pool).__name__ == "HTTPProxy" and direto is getattr(client, "_transport")
+    finally:
+        client.close()
+        padrao.close()
+    assert proxy.fechado and getattr(client, "_transport").fechado
+
+def test_registro_descarta_clientes_async_de_loops_fechados (monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    alertas = list[str]()
+    monkeypatch.setattr(dclick.logger, "alertar", lambda mensagem, *args, **kwargs: alertas.append(str(mensagem)))
+    registro = RegistroClientes()
+    registro.registrar_async("teste", lambda: ClienteHttpAsync(transport=httpx.MockTransport(lambda request: httpx.Response(200))),
+                             "secao_sem_configuracao")
+
+    async def obter () -> ClienteHttpAsync:
+        return registro.obter_async("teste")
+
+    # Event loop fechado sem o `fechar_async()`
+    loop = asyncio.new_event_loop()
+    client = loop.run_until_complete(obter())
+    loop.close()
+    registro.fechar()
+    assert len(alertas) == 1 and "teste" in alertas[0]
+    assert not registro._registros_async["teste"].clientes and not registro._encerramentos
+    del loop
+    gc.collect()
+    assert "destroyed but it is pending" not in caplog.text
+
+    # Com o `fechar_async()` nada é descartado
+    loop = asyncio.new_event_loop()
+    assert loop.run_until_complete(obter()) is not client
+    loop.run_until_complete(registro.fechar_async())
+    loop.close()
+    registro.fechar()
+    assert len(alertas) == 1
+
+def cliente_retentativa (respostas: list[httpx.Response | Exception], **politica) -> tuple[ClienteHttp, list[httpx.Request]]:
+    """Cliente com as `respostas` retornadas em sequência e os requests recebidos pelo transporte"""
+    recebidos = list[httpx.Request]()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        recebidos.append(request)
+        resposta = respostas[min(len(recebidos), len(respostas)) - 1]
+        if isinstance(resposta, Exception): raise resposta
+        return resposta
+
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(responder))
+    client.retentativa = PoliticaRetentativa(**({ "backoff": 0 } | politica))
+    return client, recebidos
+
+def test_retentativa_backoff_exponencial_limitado () -> None:
+    politica = PoliticaRetentativa(backoff=0.5, backoff_maximo=3, jitter=False)
+    assert [politica.calcular_espera(numero) for numero in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    politica.jitter = True
+    for numero in range(1, 6):
+        esperas = [politica.calcular_espera(numero) for _ in range(200)]
+        assert all(0 <= espera <= min(0.5 * 2 ** (numero - 1), 3) for espera in esperas)
+        assert len(set(esperas)) > 1
+
+def test_retentativa_retry_after () -> None:
+    politica = PoliticaRetentativa(backoff_maximo=30)
+    response = lambda valor: httpx.Response(503, headers={ "Retry-After": valor })
+
+    assert politica.retry_after(response("7")) == 7
+    assert politica.retry_after(response("invalido")) is None
+    assert politica.retry_after(httpx.Response(503)) is None
+    assert politica.retry_after(response("Wed, 21 Oct 2015 07:28:00 GMT")) == 0
+    futuro = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+    assert 15 <= typing.cast(float, politica.retry_after(response(futuro))) <= 20
+
+    assert politica.calcular_espera(1, response("7")) == 7
+    # Retry-After acima do `backoff_maximo` não é aguardado
+    assert politica.calcular_espera(1, response("31")) is None
+
+def test_retentativa_repete_status_e_erros_configurados () -> None:
+    client, recebidos = cliente_retentativa([httpx.Response(503, headers={ "Retry-After": "0" }), httpx.ConnectError("recusado"), httpx.Response(200)])
+    response = client.get("/recurso")
+    assert response.status_code == 200 and len(recebidos) == 3
+    assert [(tentativa.status_code, tentativa.erro) for tentativa in response.tentativas] == [(503, None), (None, "ConnectError"), (200, None)]
+
+    client, recebidos = cliente_retentativa([httpx.Response(500)])
+    assert client.get("/recurso").status_code == 500 and len(recebidos) == 1
+
+    client, recebidos = cliente_retentativa([httpx.ReadTimeout("lento")])
+    with pytest.raises(httpx.ReadTimeout):
+        client.get("/recurso")
+    assert len(recebidos) == 1
+
+def test_retentativa_limitada_com_nota_das_tentativas () -> None:
+    client, recebidos = cliente_retentativa([httpx.ConnectError("recusado")], tentativas=3)
+    with pytest.raises(httpx.ConnectError) as erro:
+        client.get("/recurso")
+    assert len(recebidos) == 3
+    assert any("Tentativas realizadas" in nota for nota in erro.value.__notes__)
+
+    client, recebidos = cliente_retentativa([httpx.Response(503)], tentativas=2)
+    response = client.get("/recurso")
+    assert response.status_code == 503 and len(response.tentativas) == 2 and len(recebidos) == 2
+
+def test_retentativa_apenas_idempotentes () -> None:
+    client, recebidos = cliente_retentativa([httpx.Response(503), httpx.Response(201)])
+    assert client.post("/recurso", json={ "a": 1 }).status_code == 503
+    assert len(recebidos) == 1
+
+    client, recebidos = cliente_retentativa([httpx.Response(503), httpx.Response(201)])
+    response = client.post("/recurso", headers={ "Idempotency-Key": "chave" }, json={ "a": 1 })
+    assert response.status_code == 201 and len(recebidos) == 2
+    assert recebidos[0].content == recebidos[1].content == b'{"a":1}'
+
+    client, recebidos = cliente_retentativa([httpx.Response(503), httpx.Response(200)])
+    assert client.put("/recurso", conteudo=b"abc").status_code == 200 and len(recebidos) == 2
+
+def test_retentativa_nao_repete_corpo_em_stream () -> None:
+    recebidos = list[bytes]()
+
+    class Transporte (httpx.BaseTransport):
+        """Consome o corpo em stream sem armazená-lo no request, como o transporte de rede"""
+        def handle_request (self, request: httpx.Request) -> httpx.Response:
+            recebidos.append(b"".join(typing.cast(typing.Iterable[bytes], request.stream)))
+            return httpx.Response(503)
+
+    client = ClienteHttp(base_url="http://teste", transport=Transporte())
+    client.retentativa = PoliticaRetentativa(backoff=0)
+    corpo = (parte for parte in (b"a", b"b"))
+    response = client.put("/recurso", conteudo=corpo)
+    assert response.status_code == 503 and recebidos == [b"ab"] and len(response.tentativas) == 1
+
+    response = client.put("/recurso", conteudo=b"ab")
+    assert len(response.tentativas) == 3 and recebidos[1:] == [b"ab", b"ab", b"ab"]
+
+def test_retentativa_cliente_async () -> None:
+    recebidos = list[httpx.Request]()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        recebidos.append(request)
+        return httpx.Response(200 if len(recebidos) == 2 else 502)
+
+    async def main () -> None:
+        async with ClienteHttpAsync(base_url="http://teste", transport=httpx.MockTransport(responder)) as client:
+            client.retentativa = PoliticaRetentativa(backoff=0)
+            response = await client.get("/recurso")
+            assert response.status_code == 200
+            assert [tentativa.status_code for tentativa in response.tentativas] == [502, 200]
+
+    asyncio.run(main())
+
+def test_response_headers_alteracao_nao_afeta_resposta () -> None:
+    client = ClienteHttp(transport=httpx.MockTransport(lambda request: httpx.Response(200, headers={ "X-Valor": "1", "Content-Type": "text/plain" })))
+    response = client.get("http://teste/")
+
+    response.headers["x-valor"] = "alterado"
+    response.headers_dict["x-valor"] = "alterado"
+    assert response.headers["X-Valor"] == "1"
+    assert response.headers_dict["x-valor"] == "1"
+    assert response.headers is not response.headers
+    assert response.text == ""
+
+class Conexao:
+    def __init__ (self, ociosa: bool) -> None:
+        self.ociosa = ociosa
+
+    def is_idle (self) -> bool:
+        return self.ociosa
+
+class TransporteComPool (httpx.MockTransport):
+    """Transporte com o `connections` público do pool do `httpcore` simulado"""
+
+    def __init__ (self, conexoes: list[Conexao]) -> None:
+        super().__init__(lambda request: httpx.Response(200))
+        self._pool = self
+        self.conexoes = conexoes
+        self.consultas = 0
+
+    @property
+    def connections (self) -> list[Conexao]:
+        self.consultas += 1
+        return list(self.conexoes)
+
+def test_saturacao_pool_apenas_com_alerta_habilitado () -> None:
+    transporte = TransporteComPool([Conexao(ociosa=False)])
+    client = ClienteHttp(transport=transporte)
+    client.max_conexoes = 1
+    client.get("http://teste/")
+    assert transporte.consultas == 0 and client.estatisticas_pool().saturacoes == 0
+
+    client.alertar_saturacao = True
+    client.get("http://teste/")
+    client.get("http://teste/")
+    estatisticas = client.estatisticas_pool()
+    assert estatisticas.saturacoes == 2
+    assert (estatisticas.conexoes, estatisticas.ativas, estatisticas.max_conexoes) == (1, 1, 1)
+
+    transporte.conexoes.append(Conexao(ociosa=True))
+    client.max_conexoes = 2
+    client.get("http://teste/")
+    assert client.estatisticas_pool().saturacoes == 2
+
+def partes_de (conteudo: bytes, tamanho: int) -> typing.Iterator[bytes]:
+    for inicio in range(0, len(conteudo), tamanho):
+        yield conteudo[inicio : inicio + tamanho]
+
+DOCUMENTO_JSON = json.dumps({
+    "total": 3,
+    "pular": { "items": [1, 2], "texto": "items ] } \" [ {", "aninhado": [[[[[[[[[[{ "a": [] }]]]]]]]]]] },
+    "items": [
+        { "id": "1", "nome": "Ação \"citada\" [x]", "valores": [1.5, -2e3, None, True] },
+        { "id": "2", "filhos": [{ "a": { "b": { "c": { "d": { "e": { "f": { "g": { "h": { "i": [1] } } } } } } } } }] },
+        "texto", 10, None, [],
+    ],
+    "depois": "ignorado",
+}, ensure_ascii=False).encode()
+
+def test_iterar_array_json_equivalente_ao_json_em_qualquer_particionamento () -> None:
+    esperado = json.loads(DOCUMENTO_JSON)["items"]
+    for tamanho in (1, 2, 3, 7, 64, len(DOCUMENTO_JSON)):
+        assert list(iterar_array_json(partes_de(DOCUMENTO_JSON, tamanho), "items")) == esperado
+    assert list(iterar_array_json(DOCUMENTO_JSON.decode(), "pular.items")) == [1, 2]
+    assert list(iterar_array_json(b' [ {"a": 1} , [2] ] ')) == [{ "a": 1 }, [2]]
+
+def test_iterar_array_json_caminho_ausente_ou_nulo () -> None:
+    assert list(iterar_array_json(b'{"outro": [1]}', "items")) == []
+    assert list(iterar_array_json(b'{"items": null}', "items")) == []
+    assert list(iterar_array_json(b'{}', "items")) == []
+    assert list(iterar_array_json(b'{"a": {}}', "a.items")) == []
+    assert list(iterar_array_json(b'{"items": []}', "items")) == []
+
+def test_iterar_array_json_invalido () -> None:
+    for conteudo, caminho in ((b'{"items": {}}', "items"), (b'{"items": "x"}', "items"),
+                              (b'[1, 2', ""), (b'{"items": [{"a": 1}', "items"), (b'[1 2]', ""), (b'{"items": ["abc', "items")):
+        with pytest.raises(ValueError):
+            list(iterar_array_json(partes_de(conteudo, 3), caminho))
+    with pytest.raises(ValueError):
+        list(iterar_array_json(b'[1, 2]', "items"))
+
+def test_iterar_array_json_le_as_partes_sob_demanda () -> None:
+    lidas = list[int]()
+    conteudo = json.dumps({ "items": [{ "id": indice, "texto": "x" * 100 } for indice in range(100)] }).encode()
+
+    def partes () -> typing.Iterator[bytes]:
+        for indice, parte in enumerate(partes_de(conteudo, 64)):
+            lidas.append(indice)
+            yield parte
+
+    itens = iterar_array_json(partes(), "items")
+    assert next(itens) == { "id": 0, "texto": "x" * 100 }
+    assert len(lidas) <= 4
+    assert len(list(itens)) == 99
+
+def test_decodificar_json_fallback () -> None:
+    assert decodificar_json(b'{"grande": 123456789012345678901234567890}') == { "grande": 123456789012345678901234567890 }
+    assert decodificar_json('{"nome": "ação"}'.encode("latin-1"), "latin-1") == { "nome": "ação" }
+    assert list(iterar_array_json('[{"nome": "ação"}]'.encode("latin-1"), encoding="latin-1")) == [{ "nome": "ação" }]
+    with pytest.raises(ValueError):
+        decodificar_json(b'{"a": }')
+
+class ServidorCache:
+    """Recursos com `ETag` e `Last-Modified` respondendo `304` aos requests condicionais"""
+
+    def __init__ (self, headers: dict[str, str] | None = None) -> None:
+        self.headers = headers or {}
+        self.versao = 1
+        self.requests = list[httpx.Request]()
+
+    def __call__ (self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method != "GET": return httpx.Response(204)
+        etag = f'"v{self.versao}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={ "ETag": etag, "X-Revalidado": "1" })
+        return httpx.Response(200, headers={ "ETag": etag, **self.headers }, content=f"{request.url.path} v{self.versao}".encode())
+
+def cliente_cache (cache: CacheHttp, servidor: ServidorCache) -> ClienteHttp:
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(servidor))
+    client.cache = cache
+    return client
+
+def test_cache_revalida_por_etag () -> None:
+    servidor = ServidorCache()
+    client = cliente_cache(CacheMemoria(), servidor)
+
+    assert client.get("/recurso").text == "/recurso v1"
+    response = client.get("/recurso")
+    assert response.status_code == 200 and response.text == "/recurso v1"
+    assert response.headers["X-Revalidado"] == "1"
+    assert servidor.requests[1].headers["If-None-Match"] == '"v1"'
+
+    servidor.versao = 2
+    assert client.get("/recurso").text == "/recurso v2"
+    assert (client.cache.acertos, client.cache.revalidacoes, client.cache.falhas) == (0, 1, 2)
+
+def test_cache_revalida_por_last_modified () -> None:
+    data = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-Modified-Since") == data: return httpx.Response(304)
+        return httpx.Response(200, headers={ "Last-Modified": data }, content=b"conteudo")
+
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(responder))
+    client.cache = CacheMemoria()
+    client.get("/recurso")
+    assert client.get("/recurso").content == b"conteudo"
+    assert client.cache.revalidacoes == 1
+
+def test_cache_fresco_e_diretivas_do_request () -> None:
+    servidor = ServidorCache({ "Cache-Control": "max-age=60" })
+    client = cliente_cache(CacheMemoria(), servidor)
+
+    client.get("/recurso")
+    assert client.get("/recurso").text == "/recurso v1"
+    assert len(servidor.requests) == 1 and client.cache.acertos == 1
+
+    client.get("/recurso", headers={ "Cache-Control": "no-cache" })
+    client.get("/recurso", headers={ "Pragma": "no-cache" })
+    assert len(servidor.requests) == 3 and servidor.requests[-1].headers["If-None-Match"] == '"v1"'
+
+    servidor.versao = 2
+    assert client.get("/recurso", headers={ "Cache-Control": "no-store" }).text == "/recurso v2"
+    assert "If-None-Match" not in servidor.requests[-1].headers
+    assert client.get("/recurso").text == "/recurso v1"
+
+def test_cache_nao_armazena_no_store_ou_sem_validador () -> None:
+    servidor = ServidorCache({ "Cache-Control": "no-store" })
+    client = cliente_cache(CacheMemoria(), servidor)
+    client.get("/recurso")
+    client.get("/recurso")
+    assert len(client.cache) == 0 and "If-None-Match" not in servidor.requests[1].headers
+
+    client = ClienteHttp(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"x")))
+    client.cache = cache = CacheMemoria()
+    client.get("http://teste/recurso")
+    assert len(cache) == 0
+
+def test_cache_invalida_recurso_apos_escrita () -> None:
+    servidor = ServidorCache({ "Cache-Control": "max-age=60" })
+    client = cliente_cache(cache := CacheMemoria(), servidor)
+    caminhos = ["/v1/tasks", "/v1/tasks/1", "/v1/tasks/1/documents", "/v1/tasks/2", "/v1/processes/1"]
+    for caminho in caminhos: client.get(caminho)
+    client.get("http://outro/v1/tasks/1")
+
+    client.post("/v1/tasks/1/action", json={})
+    assert sorted(httpx.URL(url).path for url in cache.urls().values()) == ["/v1/processes/1", "/v1/tasks/1", "/v1/tasks/1/documents", "/v1/tasks/2"]
+    client.get("/v1/tasks/1")
+    client.put("/v1/tasks/1", json={})
+    restantes = sorted(str(url) for url in cache.urls().values())
+    assert restantes == ["http://outro/v1/tasks/1", "http://teste/v1/processes/1", "http://teste/v1/tasks/2"]
+
+    # Escrita sem sucesso mantém as entradas
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(
+        lambda request: httpx.Response(500) if request.method == "DELETE" else servidor(request)
+    ))
+    client.cache = cache
+    client.delete("/v1/tasks/2")
+    assert len(cache) == 3
+
+def test_cache_memoria_remove_menos_utilizado () -> None:
+    client = cliente_cache(cache := CacheMemoria(maximo=2), ServidorCache())
+    client.get("/a")
+    client.get("/b")
+    client.get("/a")
+    client.get("/c")
+    assert sorted(httpx.URL(url).path for url in cache.urls().values()) == ["/a", "/c"]
+
+def test_cache_disco_persiste_sem_headers_sensiveis (tmp_path) -> None:
+    servidor = ServidorCache({ "Set-Cookie": "sessao=segredo", "Vary": "Authorization" })
+    client = cliente_cache(CacheDisco(Caminho(str(tmp_path))), servidor)
+    client.get("/recurso", headers={ "Authorization": "Bearer segredo" })
+
+    for arquivo in tmp_path.iterdir():
+        assert b"segredo" not in arquivo.read_bytes()
+    assert not any(nome.startswith(".tmp_") for nome in os.listdir(tmp_path))
+
+    client = cliente_cache(cache := CacheDisco(Caminho(str(tmp_path))), servidor)
+    response = client.get("/recurso", headers={ "Authorization": "Bearer segredo" })
+    assert response.text == "/recurso v1" and "set-cookie" not in response.headers_dict
+    assert cache.revalidacoes == 1
+
+    # `Vary: Authorization` com outra credencial não utiliza a entrada
+    client.get("/recurso", headers={ "Authorization": "Bearer outro" })
+    assert "If-None-Match" not in servidor.requests[-1].headers
+
+    cache.limpar()
+    assert os.listdir(tmp_path) == []
+
+def test_coalescencia_agrupa_requests_identicos_entre_threads () -> None:
+    chamadas = list[str]()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        chamadas.append(request.headers.get("Authorization", ""))
+        time.sleep(0.3)
+        return httpx.Response(200, headers={ "Content-Length": "8" }, content=b"conteudo")
+
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(responder))
+    client.coalescencia = Coalescencia()
+    with ThreadPoolExecutor(8) as executor:
+        responses = list(executor.map(lambda _: client.get("/recurso"), range(6)))
+        outros = list(executor.map(lambda token: client.get("/recurso", headers={ "Authorization": token }), ("a", "b")))
+
+    assert len(chamadas) == 3 and sorted(chamadas) == ["", "a", "b"]
+    assert client.coalescencia.economizadas == 5
+    assert len({ id(response) for response in responses }) == 6
+    assert all(response.content == b"conteudo" and response.status_code == 200 for response in responses + outros)
+
+def test_coalescencia_repassa_erro_e_ignora_escritas () -> None:
+    chamadas = list[str]()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        chamadas.append(request.method)
+        time.sleep(0.2)
+        if request.method == "GET": raise httpx.ReadTimeout("lento", request=request)
+        return httpx.Response(201)
+
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(responder))
+    client.coalescencia = Coalescencia()
+
+    def obter (_) -> Exception | None:
+        try: client.get("/recurso")
+        except httpx.ReadTimeout as erro: return erro
+        return None
+
+    with ThreadPoolExecutor(4) as executor:
+        erros = list(executor.map(obter, range(4)))
+        escritas = list(executor.map(lambda _: client.post("/recurso", json={}).status_code, range(3)))
+    assert all(isinstance(erro, httpx.ReadTimeout) for erro in erros)
+    assert chamadas.count("GET") == 1 and chamadas.count("POST") == 3 and escritas == [201] * 3
+    assert client.coalescencia.economizadas == 0
+
+def test_coalescencia_async () -> None:
+    chamadas = list[str]()
+
+    async def responder (request: httpx.Request) -> httpx.Response:
+        chamadas.append(request.url.path)
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, content=request.url.path.encode())
+
+    async def main () -> None:
+        async with ClienteHttpAsync(base_url="http://teste", transport=httpx.MockTransport(responder)) as client:
+            client.coalescencia = Coalescencia()
+            responses = await asyncio.gather(*(client.get(f"/recurso/{indice % 2}") for indice in range(6)))
+            assert [response.text for response in responses] == [f"/recurso/{indice % 2}" for indice in range(6)]
+            assert client.coalescencia.economizadas == 4
+
+            # Request em andamento cancelado: os demais realizam o próprio request
+            lider = asyncio.ensure_future(client.get("/cancelado"))
+            await asyncio.sleep(0.01)
+            seguidor = asyncio.ensure_future(client.get("/cancelado"))
+            await asyncio.sleep(0.01)
+            lider.cancel()
+            assert (await seguidor).text == "/cancelado"
+            assert client.coalescencia.economizadas == 4
+
+    asyncio.run(main())
+    assert len(chamadas) == 4
+
+def requisicao (url: str) -> httpx.Request:
+    return httpx.Request("GET", url)
+
+def test_limite_taxa_rajada_e_reserva_em_ordem () -> None:
+    limite = LimiteTaxa(10, rajada=3)
+    esperas = [limite.reservar(requisicao("http://teste/a")) for _ in range(6)]
+    assert esperas[:3] == [0, 0, 0]
+    # Cada request excedente reserva o próximo token, espaçados por 1 / taxa
+    for indice, espera in enumerate(esperas[3:], start=1):
+        assert espera == pytest.approx(indice / 10, abs=0.01)
+    assert limite.esperas == 3 and limite.segundos_espera == pytest.approx(0.6, abs=0.03)
+
+    # Tokens repostos com o tempo, limitados à rajada
+    limite = LimiteTaxa(100, rajada=2)
+    limite.reservar(requisicao("http://teste/a"))
+    limite.reservar(requisicao("http://teste/a"))
+    time.sleep(0.05)
+    assert [limite.reservar(requisicao("http://teste/a")) for _ in range(2)] == [0, 0]
+    assert limite.reservar(requisicao("http://teste/a")) > 0
+
+def test_limite_taxa_por_host_e_rota () -> None:
+    limite = LimiteTaxa(1, rajada=1, rotas={ "/v1": (1, 2), "/v1/documents": (1, 1) })
+    assert limite.reservar(requisicao("http://a/outro")) == 0
+    assert limite.reservar(requisicao("http://b/outro")) == 0
+    assert limite.reservar(requisicao("http://a:8080/outro")) == 0
+    assert limite.reservar(requisicao("http://a/outro")) > 0
+
+    assert limite.reservar(requisicao("http://a/v1/documents/1")) == 0
+    assert limite.reservar(requisicao("http://a/v1/documents/2")) > 0
+    assert [limite.reservar(requisicao(f"http://a/v1/tasks/{indice}")) for indice in range(2)] == [0, 0]
+    assert limite.reservar(requisicao("http://a/v1/tasks/3")) > 0
+
+def test_limite_taxa_aplicado_pelos_clientes () -> None:
+    chegadas = list[float]()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        chegadas.append(time.monotonic())
+        return httpx.Response(200)
+
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(responder))
+    client.limite = LimiteTaxa(20, rajada=1)
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda _: client.get("/recurso"), range(5)))
+    assert max(chegadas) - min(chegadas) >= 0.18
+
+    async def main () -> None:
+        async with ClienteHttpAsync(base_url="http://teste", transport=httpx.MockTransport(responder)) as client:
+            client.limite = LimiteTaxa(20, rajada=1)
+            inicio = time.monotonic()
+            await asyncio.gather(*(client.get("/recurso") for _ in range(5)))
+            assert time.monotonic() - inicio >= 0.18
+            assert client.limite.esperas == 4
+
+    asyncio.run(main())
+
+def test_disjuntor_abre_e_fecha_pelo_request_de_teste () -> None:
+    disjuntor = Disjuntor("teste", taxa_falhas=0.5, minimo_chamadas=2, tempo_aberto=0.05)
+    for sucesso in (True, False):
+        disjuntor.registrar(disjuntor.permitir(requisicao("http://teste/")), sucesso)
+    assert disjuntor.estado == "ABERTO"
+    with pytest.raises(DisjuntorAberto):
+        disjuntor.permitir(requisicao("http://teste/"))
+
+    time.sleep(0.06)
+    teste = disjuntor.permitir(requisicao("http://teste/"))
+    assert disjuntor.estado == "SEMI_ABERTO"
+    # Apenas um request de teste por vez
+    with pytest.raises(DisjuntorAberto):
+        disjuntor.permitir(requisicao("http://teste/"))
+    disjuntor.registrar(teste, False)
+    assert disjuntor.estado == "ABERTO" and disjuntor.recusados == 2
+
+    time.sleep(0.06)
+    disjuntor.registrar(disjuntor.permitir(requisicao("http://teste/")), True)
+    assert disjuntor.estado == "FECHADO"
+
+def test_disjuntor_desconsidera_resultados_anteriores_ao_estado () -> None:
+    disjuntor = Disjuntor("teste", taxa_falhas=0.5, minimo_chamadas=2, tempo_aberto=0.05)
+    primeiro, segundo, lento = (disjuntor.permitir(requisicao("http://teste/")) for _ in range(3))
+    disjuntor.registrar(primeiro, False)
+    disjuntor.registrar(segundo, False)
+    assert disjuntor.estado == "ABERTO"
+
+    time.sleep(0.06)
+    teste = disjuntor.permitir(requisicao("http://teste/"))
+    # Resultados do request permitido antes da abertura não decidem o request de teste
+    disjuntor.registrar(lento, True)
+    disjuntor.registrar(lento, False)
+    assert disjuntor.estado == "SEMI_ABERTO"
+
+    disjuntor.registrar(teste, True)
+    assert disjuntor.estado == "FECHADO"
+    disjuntor.registrar(lento, False)
+    disjuntor.registrar(disjuntor.permitir(requisicao("http://teste/")), True)
+    assert disjuntor.estado == "FECHADO"
+
+def test_disjuntor_aplicado_pelo_cliente () -> None:
+    chamadas = list[httpx.Request]()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        chamadas.append(request)
+        return httpx.Response(503)
+
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(responder))
+    client.disjuntor = Disjuntor("teste", minimo_chamadas=2, tempo_aberto=60)
+    assert client.get("/recurso").status_code == 503
+    assert client.get("/recurso").status_code == 503
+    with pytest.raises(DisjuntorAberto):
+        client.get("/recurso")
+    assert len(chamadas) == 2 and client.disjuntor.recusados == 1
+
+def servidor_gravacao (chamadas: list[httpx.Request]) -> httpx.MockTransport:
+    """Respostas com o corpo em stream, como as de rede, lidas pelo `TransporteGravacao`"""
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        chamadas.append(request)
+        corpo = json.dumps({
+            "chamada": len(chamadas), "metodo": request.method, "path": request.url.path,
+            "token": "segredo", "dados": { "fields": [{ "valor": "segredo" }], "nome": "visivel" },
+        }).encode()
+        headers = { "Content-Type": "application/json", "Content-Encoding": "gzip", "X-Api-Key": "segredo" }
+        return httpx.Response(200, headers=headers, stream=httpx.ByteStream(gzip.compress(corpo)))
+
+    return httpx.MockTransport(responder)
+
+def test_cassete_grava_e_reproduz_sem_rede (tmp_path) -> None:
+    chamadas = list[httpx.Request]()
+    caminho = str(tmp_path / "teste.cassete")
+    transporte = TransporteGravacao(Cassete(caminho), servidor_gravacao(chamadas))
+    with ClienteHttp(base_url="http://teste", transport=transporte) as client:
+        gravadas = [
+            client.get("/tarefa").json(),
+            client.get("/tarefa").json(),
+            client.post("/acao", json={ "id": 1 }).json(),
+            client.post("/upload", arquivos={ "file": ("a.txt", b"abc", "text/plain") }).json(),
+        ]
+    assert len(chamadas) == 4 and os.path.exists(caminho)
+
+    cassete = Cassete.Carregar(caminho)
+    with ClienteHttp(base_url="http://teste", transport=TransporteReproducao(cassete)) as client:
+        # Interações repetidas reproduzidas na ordem gravada e a última repetida ao esgotar
+        assert [client.get("/tarefa").json()["chamada"] for _ in range(3)] == [1, 2, 2]
+        assert client.post("/acao", json={ "id": 1 }).json()["chamada"] == gravadas[2]["chamada"]
+        # Boundary aleatório do multipart não impede a correspondência
+        assert client.post("/upload", arquivos={ "file": ("a.txt", b"abc", "text/plain") }).json()["chamada"] == gravadas[3]["chamada"]
+        with pytest.raises(InteracaoNaoGravada):
+            client.post("/acao", json={ "id": 2 })
+        with pytest.raises(InteracaoNaoGravada):
+            client.get("/outro")
+    assert len(chamadas) == 4
+
+def test_cassete_redige_segredos_e_armazena_decodificado (tmp_path) -> None:
+    caminho = str(tmp_path / "teste.cassete")
+    with ClienteHttp(base_url="http://teste", transport=TransporteGravacao(Cassete(caminho), servidor_gravacao([]))) as client:
+        original = client.get("/tarefa")
+        assert original.json()["token"] == "segredo"
+
+    with gzip.open(caminho, "rb") as arquivo:
+        assert b"segredo" not in arquivo.read()
+
+    with ClienteHttp(base_url="http://teste", transport=TransporteReproducao(Cassete.Carregar(caminho))) as client:
+        response = client.get("/tarefa")
+    dados = response.json()
+    assert dados["token"] == REDIGIDO and dados["dados"]["fields"] == [{ "valor": REDIGIDO }]
+    assert dados["dados"]["nome"] == "visivel"
+    assert response.headers["X-Api-Key"] == REDIGIDO and "content-encoding" not in response.headers_dict
+
+def test_cassete_async_combinando_corpo (tmp_path) -> None:
+    caminho = str(tmp_path / "teste.cassete")
+    chamadas = list[httpx.Request]()
+
+    async def main () -> None:
+        async def responder (request: httpx.Request) -> httpx.Response:
+            chamadas.append(request)
+            return httpx.Response(200, stream=httpx.ByteStream(request.content[::-1]))
+
+        gravacao = TransporteGravacaoAsync(Cassete(caminho), httpx.MockTransport(responder))
+        async with ClienteHttpAsync(base_url="http://teste", transport=gravacao) as client:
+            for corpo in (b"abc", b"xyz"):
+                await client.post("/inverter", conteudo=corpo)
+
+        reproducao = TransporteReproducao(Cassete.Carregar(caminho), latencia=0.05, banda=1_000_000)
+        async with ClienteHttpAsync(base_url="http://teste", transport=reproducao) as client:
+            inicio = time.perf_counter()
+            assert (await client.post("/inverter", conteudo=b"xyz")).content == b"zyx"
+            assert (await client.post("/inverter", conteudo=b"abc")).content == b"cba"
+            assert time.perf_counter() - inicio >= 0.1
+
+        # Sem combinar o corpo, a interação é obtida apenas pelo método e URL
+        async with ClienteHttpAsync(base_url="http://teste", transport=TransporteReproducao(Cassete.Carregar(caminho, combinar_corpo=False))) as client:
+            assert (await client.post("/inverter", conteudo=b"outro")).content == b"cba"
+
+    asyncio.run(main())
+    assert len(chamadas) == 2
+
+class ServidorLote:
+    """Respostas com a latência informada no path `/{segundos}` e o registro dos requests simultâneos"""
+
+    def __init__ (self) -> None:
+        self.lock = threading.Lock()
+        self.simultaneos = self.maximo_simultaneos = 0
+        self.caminhos = list[str]()
+
+    def entrar (self, request: httpx.Request) -> float:
+        with self.lock:
+            self.caminhos.append(request.url.path)
+            self.simultaneos += 1
+            self.maximo_simultaneos = max(self.maximo_simultaneos, self.simultaneos)
+        return float(request.url.path.strip("/"))
+
+    def sair (self, request: httpx.Request) -> httpx.Response:
+        with self.lock: self.simultaneos -= 1
+        if request.url.path == "/0.02": return httpx.Response(500)
+        return httpx.Response(200, content=request.url.path.encode())
+
+    def __call__ (self, request: httpx.Request) -> httpx.Response:
+        segundos = self.entrar(request)
+        try: time.sleep(segundos)
+        finally: response = self.sair(request)
+        return response
+
+    async def responder_async (self, request: httpx.Request) -> httpx.Response:
+        segundos = self.entrar(request)
+        try: await asyncio.sleep(segundos)
+        finally: response = self.sair(request)
+        return response
+
+def test_executar_lote_concorrencia_limitada_e_erros_por_item () -> None:
+    servidor = ServidorLote()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/erro": raise httpx.ConnectError("recusado", request=request)
+        return servidor(request)
+
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(responder))
+    itens = [("GET", "/0.1"), ("GET", "/erro"), client.build_request("GET", "/0.05"), ("GET", "/0.02"), ("GET", "/0.05"), ("GET", "/0.05")]
+    resultados = list(client.executar_lote(itens, concorrencia=3))
+
+    assert [resultado.indice for resultado in resultados] == list(range(6))
+    assert 1 < servidor.maximo_simultaneos <= 3
+    assert isinstance(resultados[1].erro, httpx.ConnectError) and resultados[1].response is None
+    with pytest.raises(httpx.ConnectError):
+        resultados[1].esperar_response()
+    assert resultados[3].response is not None and resultados[3].response.status_code == 500 and not resultados[3].sucesso
+    assert resultados[0].sucesso and resultados[0].esperar_response().text == "/0.1"
+
+    desordenados = [resultado.indice for resultado in client.executar_lote([("GET", "/0.2"), ("GET", "/0.01")], ordenado=False)]
+    assert desordenados == [1, 0]
+
+def test_executar_lote_interrompido_cancela_pendentes () -> None:
+    servidor = ServidorLote()
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(servidor))
+    for _ in client.executar_lote([("GET", "/0.05")] * 10, concorrencia=2):
+        break
+    assert servidor.simultaneos == 0 and len(servidor.caminhos) <= 4
+
+def test_executar_lote_async_aguarda_cancelados () -> None:
+    servidor = ServidorLote()
+
+    async def main () -> None:
+        async with ClienteHttpAsync(base_url="http://teste", transport=httpx.MockTransport(servidor.responder_async)) as client:
+            resultados = [resultado async for resultado in client.executar_lote([("GET", "/0.05"), ("GET", "/0.02"), ("GET", "/0.01")], concorrencia=2)]
+            assert [resultado.indice for resultado in resultados] == [0, 1, 2]
+            assert servidor.maximo_simultaneos == 2 and resultados[1].response.status_code == 500
+
+            async with contextlib.aclosing(client.executar_lote([("GET", "/0.01")] + [("GET", "/0.5")] * 5, concorrencia=3)) as lote:
+                async for _ in lote: break
+            # Requests cancelados encerrados antes do retorno
+            assert servidor.simultaneos == 0
+            assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+    asyncio.run(main())
+
+def cliente_compressao (compressao: CompressaoRequest) -> tuple[ClienteHttp, list[httpx.Request]]:
+    recebidos = list[httpx.Request]()
+
+    def responder (request: httpx.Request) -> httpx.Response:
+        recebidos.append(request)
+        return httpx.Response(503 if len(recebidos) == 1 and request.url.path == "/retentar" else 200)
+
+    client = ClienteHttp(base_url="http://teste", transport=httpx.MockTransport(responder))
+    client.compressao = compressao
+    return client, recebidos
+
+def descomprimir (request: httpx.Request) -> bytes:
+    return zlib.decompress(request.content, 31 if request.headers["Content-Encoding"] == "gzip" else 15)
+
+def test_compressao_corpo_elegivel () -> None:
+    client, recebidos = cliente_compressao(CompressaoRequest("gzip", minimo=1024))
+    corpo = { "itens": ["valor repetido"] * 500 }
+    client.post("/json", json=corpo)
+    request = recebidos[-1]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert int(request.headers["Content-Length"]) == len(request.content) < 1024
+    assert json.loads(descomprimir(request)) == corpo
+    assert client.compressao.requests == 1 and client.compressao.economia > 0.9
+
+    client, recebidos = cliente_compressao(CompressaoRequest("deflate", minimo=10))
+    client.post("/texto", conteudo=b"a" * 100, headers={ "Content-Type": "text/plain" })
+    assert descomprimir(recebidos[-1]) == b"a" * 100
+
+def test_compressao_ignora_corpos_nao_elegiveis () -> None:
+    client, recebidos = cliente_compressao(CompressaoRequest(minimo=1024))
+    client.post("/pequeno", json={ "a": 1 })
+    client.post("/binario", conteudo=b"a" * 2048, headers={ "Content-Type": "application/octet-stream" })
+    client.post("/sem_tipo", conteudo=b"a" * 2048)
+    client.post("/arquivo", arquivos={ "file": ("a.txt", b"a" * 2048, "text/plain") })
+    client.post("/comprimido", conteudo=gzip.compress(b"a" * 2048) * 100,
+                headers={ "Content-Type": "application/json", "Content-Encoding": "gzip" })
+    assert [request.headers.get("Content-Encoding") for request in recebidos] == [None, None, None, None, "gzip"]
+    assert client.compressao.requests == 0
+
+def test_compressao_corpo_em_stream_e_retentativa () -> None:
+    client, recebidos = cliente_compressao(CompressaoRequest(minimo=1024))
+    partes = (b"linha de texto\n" * 100 for _ in range(10))
+    client.post("/stream", conteudo=partes, headers={ "Content-Type": "text/plain" })
+    request = recebidos[-1]
+    assert request.headers["Transfer-Encoding"] == "chunked" and "Content-Length" not in request.headers
+    assert descomprimir(request) == b"linha de texto\n" * 1000
+    assert client.compressao.bytes_originais == 15_000 and client.compressao.requests == 1
+
+    # Corpo comprimido em memória é reenviado na retentativa sem comprimir novamente
+    client, recebidos = cliente_compressao(CompressaoRequest(minimo=10))
+    client.retentativa = PoliticaRetentativa(backoff=0)
+    client.put("/retentar", json={ "texto": "a" * 100 })
+    assert len(recebidos) == 2 and recebidos[0].content == recebidos[1].content
+    assert json.loads(descomprimir(recebidos[1])) == { "texto": "a" * 100 }
+
+def test_compressao_stream_cliente_async () -> None:
+    recebidos = list[bytes]()
+
+    async def responder (request: httpx.Request) -> httpx.Response:
+        recebidos.append(zlib.decompress(await request.aread(), 31))
+        return httpx.Response(200)
+
+    async def partes () -> typing.AsyncIterator[bytes]:
+        for _ in range(4): yield b"x" * 1000
+
+    async def main () -> None:
+        async with ClienteHttpAsync(base_url="http://teste", transport=httpx.MockTransport(responder)) as client:
+            client.compressao = CompressaoRequest(minimo=100)
+            await client.post("/stream", conteudo=partes(), headers={ "Content-Type": "application/xml" })
+
+    asyncio.run(main())
+    assert recebidos == [b"x" * 4000]
+
+DOCUMENTO_XML = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<nfeProc xmlns="http://www.portalfiscal.inf.br/nfe"><NFe><infNFe Id="NFe123">'
+    b'<det nItem="1"><prod><xProd>Caneta</xProd></prod></det>'
+    b'<det nItem="2"><prod><xProd>L\xc3\xa1pis</xProd></prod></det>'
+    b'<total><vNF>10.00</vNF></total>'
+    b'</infNFe></NFe></nfeProc>'
+)
+
+def test_caminho_xml () -> None:
+    caminho = CaminhoXML("/nfe:nfeProc/{http://www.portalfiscal.inf.br/nfe}NFe/*")
+    assert caminho.absoluto and caminho.segmentos == ("nfeProc", "NFe", "*")
+    assert caminho.corresponde(["nfeProc", "NFe", "infNFe"])
+    assert not caminho.corresponde(["raiz", "nfeProc", "NFe", "infNFe"])
+
+    caminho = CaminhoXML("//infNFe/det")
+    assert not caminho.absoluto and caminho.segmentos == ("infNFe", "det")
+    assert caminho.corresponde(["nfeProc", "NFe", "infNFe", "det"])
+    assert not caminho.corresponde(["det"]) and not caminho.corresponde(["infNFe", "det", "prod"])
+
+    for invalido in ("det[1]", "det/@nItem", "infNFe//det", "text()", "det|total", "", "/"):
+        with pytest.raises(ValueError): CaminhoXML(invalido)
+    with pytest.raises(ValueError): ExtratorXML()
+
+def test_iterar_xml_em_partes () -> None:
+    def extrair (*caminhos: str, tamanho: int = 7) -> list[str]:
+        partes = (DOCUMENTO_XML[inicio : inicio + tamanho] for inicio in range(0, len(DOCUMENTO_XML), tamanho))
+        return [elemento.tag.partition("}")[2] for elemento in iterar_xml(partes, *caminhos)]
+
+    assert extrair("det", tamanho=1) == extrair("det", tamanho=len(DOCUMENTO_XML)) == ["det", "det"]
+    assert extrair("/nfeProc/NFe/infNFe/det") == ["det", "det"]
+    assert extrair("/NFe/infNFe/det") == []
+    assert extrair("infNFe/*") == ["det", "det", "total"]
+    assert extrair("xProd", "vNF") == ["xProd", "xProd", "vNF"]
+    # Elementos aninhados a um elemento extraído são retornados apenas dentro dele
+    assert extrair("det", "prod") == ["det", "det"]
+
+    itens = [
+        (elemento.get("nItem"), elemento.findtext("{*}prod/{*}xProd"))
+        for elemento in iterar_xml([DOCUMENTO_XML.decode()], "nfe:det")
+    ]
+    assert itens == [("1", "Caneta"), ("2", "Lápis")]
+
+def test_extrator_xml_incremental_e_documento_invalido () -> None:
+    extrator = ExtratorXML("det")
+    fim_primeiro = DOCUMENTO_XML.index(b"</det>") + len(b"</det>")
+    assert list(extrator.alimentar(DOCUMENTO_XML[:fim_primeiro - 1])) == []
+    primeiro, = extrator.alimentar(DOCUMENTO_XML[fim_primeiro - 1 : fim_primeiro])
+    assert primeiro.get("nItem") == "1" and primeiro.findtext("{*}prod/{*}xProd") == "Caneta"
+
+    # Documento incompleto é detectado apenas ao finalizar
+    assert len(list(extrator.alimentar(DOCUMENTO_XML[fim_primeiro:-10]))) == 1
+    with pytest.raises(ElementTree.ParseError): list(extrator.finalizar())
+
+    with pytest.raises(ElementTree.ParseError):
+        list(iterar_xml([b"<raiz><det></raiz>"], "det"))
+
+def test_response_iter_xml () -> None:
+    documentos = { "/nfe": DOCUMENTO_XML, "/invalido": b"<raiz><det></raiz>" }
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=httpx.ByteStream(documentos[request.url.path])))
+    with ClienteHttp(base_url="http://teste", transport=transport) as client:
+        with client.stream("GET", "/nfe") as response:
+            assert len(list(response.iter_xml("det", tamanho_chunk=16))) == 2
+        with client.stream("GET", "/invalido") as response, pytest.raises(ValueError):
+            list(response.iter_xml("det"))
+        with client.stream("GET", "/nfe") as response, pytest.raises(ValueError):
+            list(response.iter_xml("det[1]"))